@@ -18,14 +18,25 @@ d : int
     每次抽完之后，再放入d个不同类型的样本
 """
 
+import itertools
+import math
+import os
+import sys
 from math import comb
 
+import numpy as np
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from distribute.logfact import hypergeom_pmf, log_comb, log_factorial
+
 def sampling_without_replacement(b, r, m, n, /) -> float | None:
     """
     sampling_without_replacement(b, r, m, n, /) -> float | None \n
 
     无放回抽样(超几何分布) \n
-    只涉及两种类型的抽样计算，不涉及多维超几何分布的计算  \n
+    只涉及两种类型的抽样计算，多类别的情形见 multivariate_hypergeom_pmf  \n
     例如，检测次品率，在100个零件中进行抽取，其中好零件有90个，坏零件有10个，
     现在抽取了10次，抽取的结果分别是8个好零件和2个坏零件 \n
     那么计算的结果就是sampling_without_replacement(90, 10, 8, 2)
@@ -56,10 +67,12 @@ def sampling_without_replacement(b, r, m, n, /) -> float | None:
     >>> sampling_without_replacement(90, 10, 8, 2)
     0.20150988480897875
 
-    如例子所示，100个零件中进行抽取，好零件有90个，抽取10次，抽到了8个好零件的概率
+    如例子所示，100个零件中进行抽取，好零件有90个，抽取10次，抽到了8个好零件的概率 \n
+    用 comb 精确计算，结果正确舍入；b + r 很大时大整数运算超线性变慢，
+    可改用 distribute.HyperGeom(b + r, b, m + n).pmf(m)，超过 COMB_MAX_N 后取鞍点展开
     """
     if m < b and n < r:
-        return comb(b, m) * comb(r, n) / comb(b + r, m + n)
+        return hypergeom_pmf(m, b + r, b, m + n, exact=True)
     raise ValueError("be sure m < b and n < r")
 
 
@@ -140,12 +153,123 @@ def infection(b: int, r: int, m: int, n: int, c: int, /) -> float:
     return result
 
 
+def _draw_probs(b, r, i, j, c, d):
+    """
+    已抽到 i 个类型1、j 个类型2 之后，下一次抽到类型1、类型2 的概率
+    此时罐中类型1有 b + ic + jd 个，类型2有 r + jc + id 个，只与 (i, j) 有关而与抽取顺序无关；
+    数量为负（如无放回抽样抽空）按 0 处理
+    """
+    x = max(b + i * c + j * d, 0)
+    y = max(r + j * c + i * d, 0)
+    total = x + y
+    if total == 0:
+        return 0.0, 0.0
+    return x / total, y / total
+
+
+def polya(b: int, r: int, m: int, n: int, c: int = 0, d: int = 0, /) -> float:
+    """
+    polya(b, r, m, n, c=0, d=0, /) -> float \n
+    波利亚罐子模型的通解：每次抽完放回原球，再加入c个同类型、d个不同类型的样本，
+    求m+n次抽取中恰好抽到m个类型1、n个类型2的概率 \n
+    罐中状态只取决于已抽到的数量 (i, j)，按格点路径递推
+    P(i, j) = P(i-1, j)·p1(i-1, j) + P(i, j-1)·p2(i, j-1)，计算量为 O(m·n)，
+    不需要枚举全部排列
+
+    Parameters
+    ----------
+    b : int
+        抽样类型1的数量
+    r : int
+        抽样类型2的数量
+    m : int
+        抽到m个类型1
+    n : int
+        抽到n个类型2
+    c : int
+        每次抽完之后，再放入c个同类型的样本，c=-1 即无放回抽样
+    d : int
+        每次抽完之后，再放入d个不同类型的样本
+
+    Returns
+    -------
+    out : float
+        算得的概率值
+
+    Examples
+    --------
+    >>> polya(5, 6, 1, 2, 3)          # 传染病模型，同 infection(5, 6, 1, 2, 3)
+    0.3093964858670741
+    >>> polya(5, 6, 1, 2, 0, 3)       # 安全模型，同 security(5, 6, 1, 2, 3)
+    0.47097020626432384
+    """
+    if m < 0 or n < 0:
+        raise ValueError("m 和 n 必须非负")
+    # row[j] 为 P(i, j)，逐行更新 i
+    row = [1.0] + [0.0] * n
+    for j in range(1, n + 1):
+        row[j] = row[j - 1] * _draw_probs(b, r, 0, j - 1, c, d)[1]
+    for i in range(1, m + 1):
+        row[0] = row[0] * _draw_probs(b, r, i - 1, 0, c, d)[0]
+        for j in range(1, n + 1):
+            row[j] = row[j] * _draw_probs(b, r, i - 1, j, c, d)[0] + row[j - 1] * _draw_probs(b, r, i, j - 1, c, d)[1]
+    return row[n]
+
+
+def polya_paths(b: int, r: int, m: int, n: int, c: int = 0, d: int = 0, /, name1: str | int = 0, name2: str | int = 1):
+    """
+    polya_paths(b, r, m, n, c=0, d=0, /, name1=0, name2=1) \n
+    逐条生成m个类型1、n个类型2的每一种抽取顺序及其概率，共C(m+n, m)条 \n
+    生成器按需产出，不会一次把全部排列放进内存；只需要总概率时用 polya
+
+    Parameters
+    ----------
+    b, r, m, n, c, d :
+        同 polya
+    name1 : str | int
+        类型1的名称
+    name2 : str | int
+        类型2的名称
+
+    Yields
+    ------
+    (path, prob) : (tuple, float)
+        path 为长度 m+n 的抽取顺序，prob 为按该顺序抽取的概率
+
+    Examples
+    --------
+    >>> list(polya_paths(5, 6, 1, 1, 0, 3))
+    [((0, 1), 0.2922077922077922), ((1, 0), 0.3116883116883116)]
+    """
+    if m < 0 or n < 0:
+        raise ValueError("m 和 n 必须非负")
+    total = m + n
+    # 类型1所在位置的组合按字典序产出，每种顺序恰好出现一次
+    for ones in itertools.combinations(range(total), m):
+        ones = set(ones)
+        path = []
+        prob = 1.0
+        i = j = 0
+        for k in range(total):
+            p1, p2 = _draw_probs(b, r, i, j, c, d)
+            if k in ones:
+                prob *= p1
+                path.append(name1)
+                i += 1
+            else:
+                prob *= p2
+                path.append(name2)
+                j += 1
+        yield tuple(path), prob
+
+
 def security(b: int, r: int, m: int, n: int, d: int, name1: str |int=0, name2 : str| int=1, verbose=False) -> dict | float:
     """
     security(b, r, m, n, d, /) -> float \n
     每次抽样都会放入d个不同类型的样本，即检测安全，那么就放松，下一次的事故率就增加，
     检测事故，那么就加紧，下一次的事故率就下降  \n
-    但是注意，这个模型没有通解，抽取的顺序影响概率的计算，因此需要先得到要计算的全排列
+    这个模型没有通解，抽取的顺序影响每条路径的概率；总概率由 polya 按格点路径递推得到，
+    verbose=True 时才由 polya_paths 逐条列出各顺序的概率
     Parameters
     ----------
     b : int
@@ -176,37 +300,276 @@ def security(b: int, r: int, m: int, n: int, d: int, name1: str |int=0, name2 :
     >>> security(5, 6, 1, 2, 3, verbose=False)
     0.47097020626432384
     >>> security(5, 6, 1, 2, 3, verbose=True)
-    {'1 0 1': 0.16501145912910617, '0 1 1': 0.15469824293353704, '1 1 0': 0.15126050420168066}
+    {'0 1 1': 0.15469824293353704, '1 0 1': 0.16501145912910617, '1 1 0': 0.15126050420168066}
 
 
     每次抽完之后，放入3个不同类型的样本
     """
-    import itertools
-    name1, name2 = str(name1), str(name2)
-    array = [name1] * m + [name2] * n
-    result = {}
-    # 重复的组合没必要计算，所以这里对他们排列组合之后，选用set类型而不是list类型
-    permutations = set(itertools.permutations(array))
-    # 遍历所有排列
-    for group in permutations:
-        _r = r
-        _b = b
-        out = 1
-        # 遍历排列中的每一个元素
-        for sample in group:
-            # 如果是第一个类型的话
-            if sample == name1:
-                # 分母是样本总数
-                # 分子是当前类型的数量
-                out *= _b / (_b + _r)
-                # 计算结束之后，另一类型的数量要加上d，这样计算的时候就不需要重新累加分子和分母了
-                _r += d
-            # 同上
-            elif sample == name2:
-                out *= _r / (_b + _r)
-                _b += d
-        result[" ".join(group)] = out
     if verbose:
-        return result
-    else:
-        return sum(result.values())
+        name1, name2 = str(name1), str(name2)
+        return {" ".join(path): prob for path, prob in polya_paths(b, r, m, n, 0, d, name1, name2)}
+    return polya(b, r, m, n, 0, d)
+
+
+def _count_rows(x, k):
+    """
+    把计数向量整理成 (行数, k) 的二维整数数组，返回 (数组, 输出形状)
+    """
+    x = np.asarray(x)
+    if x.shape[-1:] != (k,):
+        raise ValueError(f"计数向量的最后一维长度必须为 {k}")
+    if np.any(x != np.floor(x)):
+        raise ValueError("计数必须是整数")
+    return x.reshape(-1, k).astype(np.int64), x.shape[:-1]
+
+
+def _check_counts(counts):
+    counts = np.asarray(counts)
+    if counts.ndim != 1 or np.any(counts < 0) or np.any(counts != np.floor(counts)):
+        raise ValueError("counts 必须是非负整数的一维数组")
+    return counts.astype(np.int64)
+
+
+def _check_probs(p):
+    p = np.asarray(p, dtype=float)
+    if p.ndim != 1 or np.any(p < 0) or not math.isclose(p.sum(), 1.0, rel_tol=1e-9):
+        raise ValueError("p 必须是非负且和为 1 的一维数组")
+    return p
+
+
+def _xlogp(y, p):
+    """y·log p，约定 0·log 0 = 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(y == 0, 0.0, y * np.log(p))
+
+
+def _capped_log_sum(logw, x, n, theta=0.0):
+    """
+    对每一行计算 log Σ Π_i w_i(y_i)，求和范围为 0 <= y_i <= x_i 且 Σ y_i = n \n
+    按类别逐个卷积，递推数组 f[:, s] 为前几类共取 s 个的权重和，计算量 O(k·n·max x)。
+    Σ y_i = n 固定，把 w_i(y) 换成 w_i(y)·e^{θy} 只让结果多出因子 e^{θn}：
+    θ 取得使各类权重的峰值落在期望数量附近，再除以各类的最大值，
+    每次卷积后按行归一化，指数部分另行累加，中间结果既不溢出也不会在主要区域下溢
+    """
+    rows = x.shape[0]
+    f = np.zeros((rows, n + 1))
+    f[:, 0] = 1.0
+    log_scale = np.full(rows, -theta * n)
+    for i, lw in enumerate(logw):
+        lw = lw + theta * np.arange(len(lw))
+        top = lw.max()
+        w = np.exp(lw - top)
+        g = np.zeros_like(f)
+        for y in range(min(len(w) - 1, n, int(x[:, i].max(initial=0))) + 1):
+            coef = np.where(x[:, i] >= y, w[y], 0.0)
+            g[:, y:] += coef[:, None] * f[:, :n + 1 - y]
+        peak = g.max(axis=1)
+        peak[peak == 0] = 1.0
+        f = g / peak[:, None]
+        log_scale += top + np.log(peak)
+    with np.errstate(divide='ignore'):
+        return np.log(f[:, n]) + log_scale
+
+
+def multivariate_hypergeom_pmf(x, counts):
+    """
+    multivariate_hypergeom_pmf(x, counts) -> float | ndarray \n
+    多维超几何分布（多类别无放回抽样）：总体中第i类有 counts[i] 个，
+    无放回抽取 n = Σx_i 个，恰好抽到 x = (x_1, ..., x_k) 的概率
+    P = Π C(counts[i], x_i) / C(N, n) \n
+    组合数查 distribute.logfact 的对数阶乘表，x 可以是很多个计数向量堆成的数组，一次向量化求值
+
+    Parameters
+    ----------
+    x : array_like
+        计数向量，形状 (..., k)
+    counts : array_like
+        各类别在总体中的数量，长度为k
+
+    Returns
+    -------
+    out : float | ndarray
+        形状为 x.shape[:-1] 的概率
+
+    See Also
+    --------
+    scipy.stats.multivariate_hypergeom.pmf(x, counts, n)
+
+    Examples
+    --------
+    >>> round(multivariate_hypergeom_pmf([2, 1, 1], [5, 3, 2]), 6)
+    0.285714
+    """
+    counts = _check_counts(counts)
+    rows, shape = _count_rows(x, len(counts))
+    valid = np.all((rows >= 0) & (rows <= counts), axis=1)
+    safe = np.where(valid[:, None], rows, 0)
+    n = safe.sum(axis=1)
+    logp = (np.sum(log_factorial(counts) - log_factorial(safe) - log_factorial(counts - safe), axis=1)
+            - (log_factorial(counts.sum()) - log_factorial(n) - log_factorial(counts.sum() - n)))
+    out = np.where(valid, np.exp(logp), 0.0).reshape(shape)
+    return out if out.ndim else float(out)
+
+
+def multivariate_hypergeom_cdf(x, counts, n):
+    """
+    multivariate_hypergeom_cdf(x, counts, n) -> float | ndarray \n
+    抽取n个时各类别数量都不超过x的概率 P(X_1 <= x_1, ..., X_k <= x_k) \n
+    对满足 y <= x、Σy = n 的全部计数向量求和，按类别逐个卷积，不枚举计数向量
+
+    Parameters
+    ----------
+    x : array_like
+        计数上限，形状 (..., k)
+    counts : array_like
+        各类别在总体中的数量，长度为k
+    n : int
+        抽取个数，n <= Σcounts
+
+    Returns
+    -------
+    out : float | ndarray
+        形状为 x.shape[:-1] 的概率
+
+    Examples
+    --------
+    >>> round(multivariate_hypergeom_cdf([2, 2, 2], [5, 3, 2], 4), 6)
+    0.704762
+    """
+    counts = _check_counts(counts)
+    if not 0 <= n <= counts.sum():
+        raise ValueError("n 必须在 [0, Σcounts] 之间")
+    rows, shape = _count_rows(x, len(counts))
+    logw = [log_factorial(N) - log_factorial(np.arange(min(N, n) + 1)) - log_factorial(N - np.arange(min(N, n) + 1))
+            for N in counts]
+    total = int(counts.sum())
+    # 各类的期望数量为 n·counts[i]/N，对应 θ = log(n / (N - n))
+    theta = math.log(n / (total - n)) if 0 < n < total else 0.0
+    logp = _capped_log_sum(logw, rows, n, theta) - log_comb(total, n)
+    out = np.minimum(np.exp(logp), 1.0).reshape(shape)
+    return out if out.ndim else float(out)
+
+
+def multivariate_hypergeom_rvs(counts, n, size=None, rng=None):
+    """
+    多维超几何分布随机抽样，调用 numpy.random.Generator.multivariate_hypergeometric
+
+    Parameters
+    ----------
+    counts : array_like
+        各类别在总体中的数量
+    n : int
+        抽取个数
+    size : int | tuple | None
+        样本个数（形状），None 时返回单个计数向量
+    rng : numpy.random.Generator | int | None
+        随机数生成器或种子
+
+    Returns
+    -------
+    out : ndarray
+        形状 (*size, k) 的计数向量
+    """
+    counts = _check_counts(counts)
+    if not 0 <= n <= counts.sum():
+        raise ValueError("n 必须在 [0, Σcounts] 之间")
+    return np.random.default_rng(rng).multivariate_hypergeometric(counts, n, size)
+
+
+def multinomial_pmf(x, n, p):
+    """
+    multinomial_pmf(x, n, p) -> float | ndarray \n
+    多项分布（多类别放回抽样）：抽取n次，第i类的概率为 p_i，恰好抽到 x 的概率
+    P = n! / Π x_i! · Π p_i^{x_i}，Σx_i != n 的计数向量概率为 0
+
+    Parameters
+    ----------
+    x : array_like
+        计数向量，形状 (..., k)
+    n : int
+        抽取次数
+    p : array_like
+        各类别的概率，和为 1
+
+    Returns
+    -------
+    out : float | ndarray
+        形状为 x.shape[:-1] 的概率
+
+    See Also
+    --------
+    scipy.stats.multinomial.pmf(x, n, p)
+
+    Examples
+    --------
+    >>> round(multinomial_pmf([2, 1, 1], 4, [0.5, 0.3, 0.2]), 6)
+    0.18
+    """
+    p = _check_probs(p)
+    rows, shape = _count_rows(x, len(p))
+    valid = np.all(rows >= 0, axis=1) & (rows.sum(axis=1) == n)
+    safe = np.where(valid[:, None], rows, 0)
+    logp = log_factorial(n) - np.sum(log_factorial(safe), axis=1) + np.sum(_xlogp(safe, p), axis=1)
+    out = np.where(valid, np.exp(logp), 0.0).reshape(shape)
+    return out if out.ndim else float(out)
+
+
+def multinomial_cdf(x, n, p):
+    """
+    multinomial_cdf(x, n, p) -> float | ndarray \n
+    抽取n次时各类别次数都不超过x的概率 P(X_1 <= x_1, ..., X_k <= x_k)，
+    与 multivariate_hypergeom_cdf 一样按类别逐个卷积
+
+    Parameters
+    ----------
+    x : array_like
+        计数上限，形状 (..., k)
+    n : int
+        抽取次数
+    p : array_like
+        各类别的概率，和为 1
+
+    Returns
+    -------
+    out : float | ndarray
+        形状为 x.shape[:-1] 的概率
+
+    Examples
+    --------
+    >>> round(multinomial_cdf([2, 2, 2], 4, [0.5, 0.3, 0.2]), 6)
+    0.5766
+    """
+    p = _check_probs(p)
+    if n < 0:
+        raise ValueError("n 必须非负")
+    rows, shape = _count_rows(x, len(p))
+    y = np.arange(n + 1)
+    logw = [_xlogp(y, pi) - log_factorial(y) for pi in p]
+    # 各类的期望次数为 n·p_i，对应 θ = log n
+    logp = _capped_log_sum(logw, rows, n, math.log(n) if n > 0 else 0.0) + log_factorial(n)
+    out = np.minimum(np.exp(logp), 1.0).reshape(shape)
+    return out if out.ndim else float(out)
+
+
+def multinomial_rvs(n, p, size=None, rng=None):
+    """
+    多项分布随机抽样，调用 numpy.random.Generator.multinomial
+
+    Parameters
+    ----------
+    n : int
+        抽取次数
+    p : array_like
+        各类别的概率，和为 1
+    size : int | tuple | None
+        样本个数（形状），None 时返回单个计数向量
+    rng : numpy.random.Generator | int | None
+        随机数生成器或种子
+
+    Returns
+    -------
+    out : ndarray
+        形状 (*size, k) 的计数向量
+    """
+    p = _check_probs(p)
+    return np.random.default_rng(rng).multinomial(n, p, size)
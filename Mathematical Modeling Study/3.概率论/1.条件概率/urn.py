@@ -0,0 +1,169 @@
+# coding: utf-8
+
+"""
+    author:数模加油站
+    广义波利亚罐子模型的蒙特卡洛模拟
+
+罐中有k种颜色的球，每次随机取出一个球并放回；取出颜色i后，颜色j再加入 R[i, j] 个。
+R 可以随时间变化（传入 t -> R 的函数），因此可以模拟没有闭式解的多颜色、时变加球规则。
+polya.py 中的两类型模型对应 R = polya_matrix(2, c, d)
+
+一批轨迹同时模拟：每一步对整批做一次向量运算，批与批之间相互独立，可以分给进程池并行
+"""
+
+import math
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from distribute import Norm
+
+
+def polya_matrix(k: int, c: float, d: float) -> np.ndarray:
+    """
+    k种颜色的波利亚加球矩阵：取出一个球后加入c个同色球，其余每种颜色各加入d个
+
+    Parameters
+    ----------
+    k : int
+        颜色数
+    c : float
+        同色加球数，c=-1 即无放回抽样
+    d : float
+        异色加球数
+
+    Returns
+    -------
+    out : ndarray
+        k x k 矩阵，对角线为c，其余为d
+    """
+    return np.full((k, k), float(d)) + (c - d) * np.eye(k)
+
+
+def _check_matrix(matrix, k):
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.shape != (k, k):
+        raise ValueError(f"加球矩阵的形状必须为 ({k}, {k})")
+    return matrix
+
+
+def _run_batch(initial, reinforce, draws, size, seed):
+    """
+    模拟 size 条独立轨迹，返回 Counter：各颜色抽到次数 (tuple) -> 轨迹数
+    """
+    rng = np.random.default_rng(seed)
+    k = len(initial)
+    counts = np.tile(initial, (size, 1))
+    drawn = np.zeros((size, k), dtype=np.int64)
+    rows = np.arange(size)
+    fixed = None if callable(reinforce) else _check_matrix(reinforce, k)
+    for t in range(draws):
+        matrix = fixed if fixed is not None else _check_matrix(reinforce(t), k)
+        # 数量为负（无放回抽样抽空）按 0 处理，按累积数量做一次逆变换抽样
+        cum = np.cumsum(np.maximum(counts, 0), axis=1)
+        total = cum[:, -1]
+        if (total <= 0).any():
+            raise ValueError(f"第 {t + 1} 次抽取时罐中已没有球")
+        u = rng.random(size) * total
+        color = np.minimum((cum <= u[:, None]).sum(axis=1), k - 1)
+        drawn[rows, color] += 1
+        counts += matrix[color]
+    keys, freq = np.unique(drawn, axis=0, return_counts=True)
+    return Counter({tuple(int(v) for v in key): int(f) for key, f in zip(keys, freq)})
+
+
+def simulate(initial, reinforce, draws: int, trials: int = 1_000_000, batch: int = 100_000,
+             workers: int = 1, seed=None, level: float = 0.95) -> dict:
+    """
+    simulate(initial, reinforce, draws, trials=1_000_000, batch=100_000, workers=1, seed=None, level=0.95) -> dict \n
+    模拟 trials 条独立的罐子轨迹，每条抽取 draws 次，统计各颜色抽到次数的经验分布 \n
+    轨迹按 batch 条一批模拟，每批用 SeedSequence 派生的独立随机数流，
+    workers > 1 时各批分给进程池并行；给定 seed 时结果与 workers、批的执行顺序无关
+
+    Parameters
+    ----------
+    initial : array_like
+        各颜色的初始数量，长度为k
+    reinforce : array_like | callable
+        k x k 加球矩阵，或 t -> 矩阵 的函数（t 从 0 开始，表示第 t+1 次抽取后的加球规则）；
+        workers > 1 时函数必须能被 pickle（模块顶层定义的函数，不能是 lambda）
+    draws : int
+        每条轨迹的抽取次数
+    trials : int
+        轨迹总数
+    batch : int
+        每批的轨迹数，决定内存占用（约 batch * k 个数）
+    workers : int
+        并行进程数
+    seed : int | None
+        随机种子
+    level : float
+        置信区间的置信水平
+
+    Returns
+    -------
+    out : dict
+        各颜色抽到次数 (tuple) -> (频率, 下限, 上限)，区间为 Wilson 置信区间，按键排序
+
+    Examples
+    --------
+    >>> res = simulate([5, 6], polya_matrix(2, 3, 0), 3, trials=200_000, seed=1)
+    >>> p, lo, hi = res[(1, 2)]     # 同 infection(5, 6, 1, 2, 3) = 0.3094
+    """
+    initial = np.asarray(initial, dtype=float)
+    if initial.ndim != 1 or initial.size == 0:
+        raise ValueError("initial 必须是非空的一维数组")
+    if draws < 0 or trials < 1 or batch < 1 or workers < 1:
+        raise ValueError("draws 必须非负，trials、batch、workers 必须为正整数")
+    if not 0 < level < 1:
+        raise ValueError("level 必须在 (0, 1) 之间")
+    sizes = [batch] * (trials // batch) + ([trials % batch] if trials % batch else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(initial, reinforce, draws, size, s) for size, s in zip(sizes, seeds)]
+    total = Counter()
+    if workers == 1:
+        for a in args:
+            total.update(_run_batch(*a))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_run_batch, *zip(*args)):
+                total.update(part)
+
+    z = Norm(0, 1).quantile(0.5 + level / 2)
+    z2 = z * z
+    out = {}
+    for key in sorted(total):
+        p = total[key] / trials
+        center = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+        half = z / (1 + z2 / trials) * math.sqrt(p * (1 - p) / trials + z2 / (4 * trials * trials))
+        out[key] = (p, max(center - half, 0.0), min(center + half, 1.0))
+    return out
+
+
+if __name__ == '__main__':
+    from polya import infection, polya
+
+    # 与闭式解对照：传染病模型 infection(b, r, m, n, c)，抽到 (m, n) 的概率
+    b, r, c = 5, 6, 3
+    res = simulate([b, r], polya_matrix(2, c, 0), 6, trials=1_000_000, workers=2, seed=2025)
+    for m in range(7):
+        p, lo, hi = res.get((m, 6 - m), (0.0, 0.0, 0.0))
+        exact = infection(b, r, m, 6 - m, c)
+        # 偏差以标准误为单位，应大致服从标准正态分布
+        dev = (p - exact) / math.sqrt(exact * (1 - exact) / 1_000_000)
+        print(f"m={m}  模拟 {p:.5f} [{lo:.5f}, {hi:.5f}]  infection {exact:.5f}  偏差 {dev:+.2f} 个标准误")
+
+    # 安全模型（异色加球）与 polya 的格点递推对照
+    res = simulate([5, 6], polya_matrix(2, 0, 2), 5, trials=500_000, seed=7)
+    print("安全模型 (2, 3):", res[(2, 3)], "polya:", polya(5, 6, 2, 3, 0, 2))
+
+    # 三种颜色、加球数随时间递减的罐子
+    res = simulate([3, 2, 1], lambda t: polya_matrix(3, 4 // (t + 1), 0), 4, trials=200_000, seed=0)
+    for key, (p, lo, hi) in list(res.items())[:5]:
+        print(key, f"{p:.4f} [{lo:.4f}, {hi:.4f}]")
@@ -13,4 +13,5 @@ __all__ = [
     'series',
     'parallel',
     'vote',
+    'poisson_binomial',
 ]
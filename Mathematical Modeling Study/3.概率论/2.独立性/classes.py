@@ -4,25 +4,34 @@
     @time  : 2025/7/14 11:24
     @file  : classes.py
 """
-from functools import reduce
 from abc import abstractmethod, ABC
 import math
 
+import numpy as np
+
+from core import poisson_binomial
+
 
 class Base(ABC):
     """
         可靠系统基类
+
+        p 可以是二维数组（方案数 × 元素数），每一行是一种候选方案的故障率，
+        compute 对全部方案一次向量化求值；参数校验对整个数组只做一次
     """
 
-    def __init__(self, p: float | list[float], num: int, r: int | float = None):
+    def __init__(self, p: float | list[float] | np.ndarray, num: int, r: int | float = None):
         """
             p
         Parameters
         ----------
-        p: float | list[float]
-            故障率，若为单个数值，则表示所有元素故障率都相同
+        p: float | list[float] | ndarray
+            故障率，若为单个数值，则表示所有元素故障率都相同；
+            若为形状 (方案数, num) 的二维数组，则每一行是一种方案
         num: int
             元素数量
+        r: int | float
+            表决系统的门限，整数表示最少正常的元素数量，(0, 1) 之间的小数表示最少正常的占比（向上取整）
         """
         self.p = p
         self.num = num
@@ -32,37 +41,37 @@ class Base(ABC):
     def __check_type__(self):
         self.__check_num()
         self.__check_r__()
-        if isinstance(self.p, float):
-            self.__check_p_float()
-            self.p = [self.p] * self.num
-        else:
-            self.__check_p_list()
-
-    def __check_p_float(self):
-        if self.p < 0 or self.p > 1:
-            raise ValueError("p must be between 0 and 1")
-
-    def __check_p_list(self):
-        if len(self.p) != self.num:
+        self.__check_p()
+
+    def __check_p(self):
+        p = np.asarray(self.p, dtype=float)
+        if p.ndim == 0:
+            p = np.full(self.num, float(p))
+        if p.ndim > 2 or p.shape[-1] != self.num:
             raise ValueError("length of p must be equal to num")
-        for i in self.p:
-            if not isinstance(i, float):
-                raise TypeError("The constituent of p must be float")
-            if i < 0 or i > 1:
-                raise ValueError("The constituent of p must be between 0 and 1")
+        if np.any((p < 0) | (p > 1)) or np.isnan(p).any():
+            raise ValueError("The constituent of p must be between 0 and 1")
+        self.p = p
 
     def __check_num(self):
         if self.num <= 0:
             raise ValueError("num must be greater than 0")
 
     def __check_r__(self):
-        if isinstance(self.r, float):
-            if self.r > 1 or self.r < 0:
-                raise ValueError("r must be between 0 and 1")
-        else:
-            if self.r > self.num:
-                raise IndexError("r must be less than num")
+        if self.r is None:
+            return
+        if isinstance(self.r, float) and 0 < self.r < 1:
             self.r = math.ceil(self.num * self.r)
+        elif self.r != int(self.r) or self.r < 0:
+            raise ValueError("r must be a non-negative integer or a ratio between 0 and 1")
+        if self.r > self.num:
+            raise IndexError("r must be less than num")
+        self.r = int(self.r)
+
+    @staticmethod
+    def _result(value):
+        """一维 p 返回 float，二维 p 返回每种方案的可靠性数组"""
+        return float(value) if np.ndim(value) == 0 else value
 
     @abstractmethod
     def compute(self):
@@ -72,38 +81,41 @@ class Base(ABC):
 class Series(Base):
     """
         串联系统，需要指定参数p故障率，和参数num元素数量
+        R = Π(1 - p_i)，按 exp(Σ log(1 - p_i)) 计算，元素很多时也不会逐项相乘下溢
     """
 
-    def __init__(self, p: float | list[float], num: int):
-        if isinstance(p, list):
-            super().__init__([1 - i for i in p], num)
-        else:
-            super().__init__(1 - p, num)
+    def __init__(self, p: float | list[float] | np.ndarray, num: int):
+        super().__init__(p, num)
 
     def compute(self):
-        return reduce(lambda x, y: x * y, self.p)
+        with np.errstate(divide='ignore'):
+            return self._result(np.exp(np.sum(np.log1p(-self.p), axis=-1)))
 
 
 class Parallel(Base):
     """
         并联系统，需要指定参数p故障率，和参数num元素数量
+        R = 1 - Π p_i，按 -expm1(Σ log p_i) 计算，可靠性接近 1 时不丢失精度
     """
 
-    def __init__(self, p: float | list[float], num: int):
+    def __init__(self, p: float | list[float] | np.ndarray, num: int):
         super().__init__(p, num)
 
     def compute(self):
-        return 1 - reduce(lambda x, y: x * y, self.p)
+        with np.errstate(divide='ignore'):
+            return self._result(-np.expm1(np.sum(np.log(self.p), axis=-1)))
 
 
 class Vote(Base):
     """
-        表决系统
+        表决系统，需要指定参数p故障率、参数num元素数量和门限r
+        正常元素的数量服从泊松二项分布，对全部方案同时递推，计算量 O(方案数 · num · r)
     """
 
-    def __init__(self, p: float | list[float], num: int, r: int | float = None):
+    def __init__(self, p: float | list[float] | np.ndarray, num: int, r: int | float = None):
+        if r is None:
+            raise ValueError("r must be given for a vote system")
         super().__init__(p, num, r)
 
-
     def compute(self):
-        pass
+        return self._result(poisson_binomial(1 - self.p, self.r)[..., self.r])
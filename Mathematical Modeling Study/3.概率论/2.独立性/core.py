@@ -7,6 +7,8 @@
 import math
 from functools import reduce  # reduce函数用于将一个函数连续作用于序列的元素上，得到一个累计结果
 
+import numpy as np
+
 
 def series(num, p):
     """
@@ -77,6 +79,51 @@ def parallel(num, p):
     return round(1 - reduce(lambda x, y: x * y, p), 5)  # 故障率相乘为全坏概率，1减去为可靠性
 
 
+def poisson_binomial(q, k=None):
+    """
+        泊松二项分布：n 个独立事件分别以概率 q_i 发生，发生次数 S 的分布
+    递推 dp[j] = P(前 i 个事件中恰好发生 j 个)，每加入一个事件对整个数组做一次向量运算；
+    指定 k 时 j >= k 的情况合并为一格，只需 O(n·k)
+    Parameters
+    ----------
+    q: list[float] | ndarray
+        各事件发生的概率；二维数组时每一行是一组事件，逐行给出分布
+    k: int | None
+        截断位置，None 时返回完整的分布
+
+    Returns
+    -------
+    out: ndarray
+        k 为 None 时最后一维长度为 n+1，第 j 个元素为 P(S = j)；
+        否则长度为 k+1，前 k 个元素为 P(S = j)，最后一个为 P(S >= k)
+
+    Examples
+    --------
+    >>> poisson_binomial([0.5, 0.5]).tolist()
+    [0.25, 0.5, 0.25]
+    >>> poisson_binomial([0.9, 0.8, 0.7], 2).tolist()[-1]  # 至少两个发生
+    0.902
+    """
+    q = np.asarray(q, dtype=float)
+    if q.ndim not in (1, 2) or np.any(q < 0) or np.any(q > 1):
+        raise ValueError("q must be a list of probabilities between 0 and 1")
+    n = q.shape[-1]
+    k = n if k is None else min(max(int(k), 0), n)
+    # q 为二维时每一行是一组独立事件，各行同时递推
+    dp = np.zeros(q.shape[:-1] + (k + 1,))
+    dp[..., 0] = 1.0
+    if k == 0:
+        return dp
+    for i in range(n):
+        qi = q[..., i, None]
+        top = dp[..., k - 1:k] * qi
+        dp[..., 1:k] = dp[..., 1:k] * (1 - qi) + dp[..., :k - 1] * qi
+        dp[..., :1] *= 1 - qi
+        # 截断时最后一格吸收，完整分布时 dp[n] 在最后一步之前恒为 0，两种情况写法相同
+        dp[..., k:] += top
+    return dp
+
+
 def vote(num, p, r):
     """
             用于一键计算表决系统的可靠性
@@ -85,18 +132,23 @@ def vote(num, p, r):
         num: int
             该系统中的元素数量
 
-        p: float
-            故障率，为一个[0, 1]之间的常数，表示各个零部件故障率相同
+        p: float | list[float]
+            故障率，若为一个[0, 1]之间的常数，表示各个零部件故障率相同
+
+            若为一个列表，则列表长度应该与num的值相同，表示每个零件对应的故障率，
+            此时正常零件的数量服从泊松二项分布，用 poisson_binomial 计算
 
-        r: int| float
+        r: int | float | list
             若为整数类型，则表示该系统中最少需要多少台机器正常才正常，此时r<=num
 
             若为小数类型，则表示该系统中最少需要多少占比的机器正常才正常，算得结果向上取整，此时 r n [0, 1]
 
+            若为列表，则一次算出每个门限对应的可靠性
+
         Returns
         -------
-        out: float
-            该系统的可靠性
+        out: float | ndarray
+            该系统的可靠性，r 为列表时返回与之等长的数组
 
         Examples
         --------
@@ -106,33 +158,44 @@ def vote(num, p, r):
         >>> vote(3, 0.1, 2)
         0.972
 
+        >>> vote(3, [0.1, 0.2, 0.3], [1, 2, 3]).tolist()
+        [0.994, 0.902, 0.504]
+
         """
-    if isinstance(p, float):
+    if isinstance(p, (int, float)):
         if p < 0 or p > 1:
             raise ValueError("p must be between 0 and 1")
         p = [p] * num  # 展开为每个部件的故障率列表
-    else:
-        raise ValueError('p值必须是一个数字')
-
-    def binom(k, n, p2):
-        # 根据k、n、p计算二项分布概率值
-        return math.comb(n, k) * p2 ** k * (1 - p2) ** (n - k)
-
-    result = 0
-
-    # 若r为占比，则计算对应需要的最小数量，并向上取整
-    if isinstance(r, float) and 0 < r < 1:
-        r = math.ceil(num * r)
+    if len(p) != num:
+        raise IndexError('length of p must be equal to num')
 
-    # 尽可能减少循环次数
-    if r > num / 2:
-        # 如果需要的正常设备占多数，则直接计算从r到n所有正常情况的概率和
-        for i, _p in zip(range(r, num + 1), p[r - 1:]):
-            result += binom(i, num, 1 - _p)
+    scalar = np.ndim(r) == 0
+    thresholds = []
+    for t in np.atleast_1d(r).tolist():
+        # 若r为占比，则计算对应需要的最小数量，并向上取整
+        if isinstance(t, float) and 0 < t < 1:
+            t = math.ceil(num * t)
+        thresholds.append(min(max(int(t), 0), num + 1))
+    thresholds = np.array(thresholds)
+
+    # 门限较小时对正常数量截断递推，门限较大时对故障数量截断递推（P(正常 >= t) = P(故障 <= num - t)），
+    # 两种情况都直接对需要的项求和，不经过 1 - x
+    reliable = 1 - np.asarray(p, dtype=float)
+    low, high = int(thresholds.min()), min(int(thresholds.max()), num)
+    if high <= num - low + 1:
+        dist = poisson_binomial(reliable, high)
+        # tail[j] = P(正常 >= j)，j = 0..high
+        tail = np.cumsum(dist[::-1])[::-1]
+        result = tail[np.minimum(thresholds, high)]
+        result = np.where(thresholds > num, 0.0, result)
     else:
-        # 否则先计算失败的概率（低于r个正常），再用 1 减去得到可靠性
-        for i, _p in zip(range(r), p[:r]):
-            result += binom(i, num, 1 - _p)
-        result = 1 - result
-
-    return round(result, 5)
+        m = max(num - low, 0)
+        dist = poisson_binomial(1 - reliable, m + 1)
+        # head[j] = P(故障 <= j)，j = 0..m
+        head = np.cumsum(dist[:m + 1])
+        fails = num - thresholds
+        result = np.where(fails < 0, 0.0, head[np.clip(fails, 0, m)])
+
+    if scalar:
+        return round(float(result[0]), 5)
+    return np.round(result, 5)
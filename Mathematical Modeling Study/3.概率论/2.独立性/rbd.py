@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/9 10:05
+    @file  : rbd.py
+
+    可靠性框图（Reliability Block Diagram）
+
+    把 core.py 中扁平的串联、并联、表决系统推广为任意嵌套的树：
+    叶子是 Component（给出故障率），内部节点是 Series / Parallel / KofN，子节点可以继续嵌套。
+    各元件相互独立，每个节点的可靠性只由子节点的可靠性决定，自底向上一遍即可算出整个系统。
+
+    每个节点缓存自己的可靠性；修改某个元件的故障率时只把它和它的祖先标记为失效，
+    再次求值只重算这一条链，其余子树直接用缓存。
+
+    birnbaum / criticality 在求值之后自顶向下再走一遍，按链式法则一次得到全部元件的重要度：
+    串联、并联节点用前缀积 × 后缀积，表决节点用前缀、后缀计数分布的卷积，
+    总计算量与求一次系统可靠性同阶，不必对每个元件重算两次整个系统
+"""
+import math
+
+import numpy as np
+
+from core import poisson_binomial
+
+
+def at_least(rs, k):
+    """
+    n 个独立元件中至少 k 个正常的概率，各元件可靠性可以不同（泊松二项分布的尾概率，
+    由 core.poisson_binomial 截断到 k 递推，计算量 O(n·k)）
+
+    Parameters
+    ----------
+    rs: list[float]
+        各元件的可靠性
+    k: int
+        至少需要正常的元件数量
+
+    Returns
+    -------
+    out: float
+        至少 k 个正常的概率
+
+    Examples
+    --------
+    >>> round(at_least([0.9, 0.9, 0.9], 2), 6)
+    0.972
+    """
+    if k <= 0:
+        return 1.0
+    if k > len(rs):
+        return 0.0
+    return float(poisson_binomial(rs, k)[k])
+
+
+class Node:
+    """
+        可靠性框图节点的基类
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self.parent = None
+        self._value = None
+
+    def invalidate(self):
+        """
+            把本节点与全部祖先的缓存标记为失效；遇到已经失效的祖先即可停止
+        """
+        node = self
+        while node is not None and node._value is not None:
+            node._value = None
+            node = node.parent
+
+    def reliability(self):
+        """
+            节点（子系统）的可靠性，只重算缓存失效的节点
+
+        Returns
+        -------
+        out: float
+        """
+        if self._value is not None:
+            return self._value
+        # 迭代的后序遍历，嵌套很深也不会触发递归深度限制
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node._value is not None:
+                continue
+            if expanded or isinstance(node, Component):
+                node._value = node._compute()
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children if child._value is None)
+        return self._value
+
+    def unreliability(self):
+        """
+            节点（子系统）的故障率 1 - R
+        """
+        return 1 - self.reliability()
+
+    def _compute(self):
+        raise NotImplementedError
+
+    def _gradient(self):
+        """
+            ∂R / ∂R_child，对每个子节点各一个值，调用前子节点的缓存必须有效
+        """
+        raise NotImplementedError
+
+
+def _exclusive_products(values):
+    """
+        out[i] = Π_{j != i} values[j]，由前缀积与后缀积相乘得到，values 中有 0 时也不做除法
+    """
+    values = np.asarray(values, dtype=float)
+    prefix = np.concatenate(([1.0], np.cumprod(values[:-1])))
+    suffix = np.concatenate((np.cumprod(values[:0:-1])[::-1], [1.0]))
+    return prefix * suffix
+
+
+class Component(Node):
+    """
+        元件（叶子节点），需要指定参数p故障率
+
+    Parameters
+    ----------
+    p: float
+        故障率，[0, 1] 之间
+    name: str
+        元件名称，用于 Block.find 查找
+    """
+
+    def __init__(self, p, name=None):
+        super().__init__(name)
+        self.p = p
+
+    @property
+    def p(self):
+        return self._p
+
+    @p.setter
+    def p(self, value):
+        if not 0 <= value <= 1:
+            raise ValueError("p must be between 0 and 1")
+        self._p = float(value)
+        self.invalidate()
+
+    def _compute(self):
+        return 1 - self._p
+
+    def __repr__(self):
+        return f"Component(p={self._p}, name={self.name!r})"
+
+
+class Block(Node):
+    """
+        由若干子节点组成的子系统
+    """
+
+    def __init__(self, children, name=None):
+        super().__init__(name)
+        self.children = []
+        for child in children:
+            self.add(child)
+        if not self.children:
+            raise ValueError("a block must have at least one child")
+
+    def add(self, child):
+        """
+            追加一个子节点；同一节点只能属于一个父节点（各元件相互独立）
+        """
+        if not isinstance(child, Node):
+            raise TypeError("children must be Component or Block")
+        if child.parent is not None:
+            raise ValueError("the node already belongs to another block")
+        child.parent = self
+        self.children.append(child)
+        self.invalidate()
+        return child
+
+    def components(self):
+        """
+            按深度优先顺序产出子树中的全部元件
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Component):
+                yield node
+            else:
+                stack.extend(reversed(node.children))
+
+    def find(self, name):
+        """
+            按名称查找子树中的元件，找不到时抛出 KeyError
+        """
+        for component in self.components():
+            if component.name == name:
+                return component
+        raise KeyError(name)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.children!r}, name={self.name!r})"
+
+
+class Series(Block):
+    """
+        串联：全部子节点正常系统才正常，R = Π R_i
+    """
+
+    def _compute(self):
+        return math.prod(child._value for child in self.children)
+
+    def _gradient(self):
+        # ∂R/∂R_i = Π_{j != i} R_j
+        return _exclusive_products([child._value for child in self.children])
+
+
+class Parallel(Block):
+    """
+        并联：至少一个子节点正常系统就正常，R = 1 - Π (1 - R_i)
+    """
+
+    def _compute(self):
+        return 1 - math.prod(1 - child._value for child in self.children)
+
+    def _gradient(self):
+        # ∂R/∂R_i = Π_{j != i} (1 - R_j)
+        return _exclusive_products([1 - child._value for child in self.children])
+
+
+class KofN(Block):
+    """
+        表决（k/n）：至少 k 个子节点正常系统才正常
+
+    Parameters
+    ----------
+    k: int | float
+        若为整数，表示最少需要多少个子节点正常，k <= 子节点数；
+        若为 (0, 1) 之间的小数，表示最少需要的占比，向上取整（与 core.vote 相同）
+    children: list[Node]
+        子节点
+    """
+
+    def __init__(self, k, children, name=None):
+        super().__init__(children, name)
+        if isinstance(k, float) and 0 < k < 1:
+            k = math.ceil(len(self.children) * k)
+        if not 0 <= k <= len(self.children):
+            raise ValueError("k must be between 0 and the number of children")
+        self.k = int(k)
+
+    def _compute(self):
+        return at_least([child._value for child in self.children], self.k)
+
+    def _gradient(self):
+        """
+            ∂R/∂R_i = P(其余子节点中恰好 k-1 个正常)
+            prefix[i] 为前 i 个子节点中正常数量 0..k-1 的分布，suffix[i] 为第 i 个及以后的，
+            两者卷积后取第 k-1 项，全部子节点合计 O(n·k)
+        """
+        rs = np.array([child._value for child in self.children])
+        n, k = len(rs), self.k
+        if k == 0:
+            return np.zeros(n)
+        prefix = np.zeros((n + 1, k))
+        suffix = np.zeros((n + 1, k))
+        prefix[0, 0] = suffix[n, 0] = 1.0
+        for i in range(n):
+            prefix[i + 1] = prefix[i] * (1 - rs[i])
+            prefix[i + 1, 1:] += prefix[i, :-1] * rs[i]
+            j = n - 1 - i
+            suffix[j] = suffix[j + 1] * (1 - rs[j])
+            suffix[j, 1:] += suffix[j + 1, :-1] * rs[j]
+        return np.sum(prefix[:-1] * suffix[1:, ::-1], axis=1)
+
+    def __repr__(self):
+        return f"KofN({self.k}, {self.children!r}, name={self.name!r})"
+
+
+def birnbaum(system):
+    """
+    全部元件的 Birnbaum 重要度 I_B(i) = ∂R_sys / ∂R_i = R_sys(i 正常) - R_sys(i 故障)
+
+    先求一次系统可靠性（只重算失效的缓存），再自顶向下传递 ∂R_sys/∂R_node，
+    每个节点按 _gradient 乘上对各子节点的偏导
+
+    Parameters
+    ----------
+    system: Node
+        可靠性框图的根节点
+
+    Returns
+    -------
+    out: dict[Component, float]
+        元件 -> Birnbaum 重要度，按 components() 的顺序
+
+    Examples
+    --------
+    >>> a, b = Component(0.1, 'a'), Component(0.2, 'b')
+    >>> {c.name: round(v, 6) for c, v in birnbaum(Series([a, b])).items()}
+    {'a': 0.8, 'b': 0.9}
+    """
+    system.reliability()
+    if isinstance(system, Component):
+        return {system: 1.0}
+    out = {}
+    stack = [(system, 1.0)]
+    while stack:
+        node, grad = stack.pop()
+        if isinstance(node, Component):
+            out[node] = grad
+            continue
+        partial = node._gradient()
+        # 逆序压栈，使结果按深度优先的元件顺序排列
+        for child, d in zip(reversed(node.children), partial[::-1]):
+            stack.append((child, grad * float(d)))
+    return out
+
+
+def criticality(system):
+    """
+    全部元件的（故障）关键重要度 I_C(i) = I_B(i) · p_i / (1 - R_sys)，
+    即系统故障时由元件 i 的故障导致的概率
+
+    Parameters
+    ----------
+    system: Node
+        可靠性框图的根节点
+
+    Returns
+    -------
+    out: dict[Component, float]
+        元件 -> 关键重要度；系统不会故障（R_sys = 1）时均为 nan
+    """
+    importance = birnbaum(system)
+    q = system.unreliability()
+    return {c: v * c.p / q if q > 0 else math.nan for c, v in importance.items()}
+
+
+if __name__ == '__main__':
+    # 独立性.py 中的桥式系统不是串并联结构；这里给出一个两条冗余管线 + 2/3 表决控制器的例子
+    system = Series([
+        Parallel([
+            Series([Component(0.05, 'pump1'), Component(0.02, 'valve1')]),
+            Series([Component(0.05, 'pump2'), Component(0.02, 'valve2')]),
+        ]),
+        KofN(2, [Component(0.1, f'ctrl{i}') for i in range(3)]),
+    ])
+    print(f'系统可靠性{system.reliability():.6f}')
+    system.find('pump1').p = 0.5  # 只重算 pump1 所在的支路和根节点
+    print(f'pump1 故障率升至 0.5 后{system.reliability():.6f}')
+
+    # 重要度：按 Birnbaum 重要度排序，决定冗余预算先投向哪个元件
+    crit = criticality(system)
+    for c, v in sorted(birnbaum(system).items(), key=lambda item: -item[1]):
+        print(f'{c.name}: Birnbaum {v:.6f}  关键重要度 {crit[c]:.6f}')
@@ -8,7 +8,7 @@
 
 import os
 import sys
-sys.path.insert(0, os.path.abspath('..'))  # 使项目根目录可被导入
+sys.path.insert(0, os.path.abspath('../..'))  # 使共享的 distribute 包可被导入
 
 
 project = 'distribution'
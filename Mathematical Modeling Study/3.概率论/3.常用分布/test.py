@@ -4,15 +4,13 @@
     @time  : 2025/8/1 14:57
     @file  : test.py
 """
-import Hypergeom
-import beta
-import binom
-import gamma
-import geom
-import norm
-import poisson
-import uniform
-import exp
+import os
+import sys
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from distribute import Hypergeom, beta, binom, gamma, geom, norm, poisson, uniform, exp
 
 # 1. 二项分布：n=10, p=0.3, P(X=3)
 bd = binom.Binom(n=10, p=0.3)
@@ -5,6 +5,12 @@
     @file  : test.py
 """
 
+import os
+import sys
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
 from distribute.binom import Binom
 from distribute.poisson import Poisson
 from distribute.Hypergeom import HyperGeom
@@ -7,6 +7,8 @@
 
 import math
 
+import numpy as np
+
 
 def bound_deviation(var, deviation):
     """
@@ -50,6 +52,125 @@ def bound_k(k):
     return min(1.0, 1.0 / (k ** 2))
 
 
+class CovAccumulator:
+    r"""
+    流式协方差累加器（Welford / Chan 合并公式）
+
+    只保存 n、两个均值、两个离差平方和 M2 与离差积和 C，数据按块送入，每块只遍历一次：
+    块内先算出块的均值和离差和，再按 Chan 等人的合并公式并入
+        δ = mean_b - mean_a,  M2 = M2_a + M2_b + δ² · n_a n_b / n,
+        C = C_a + C_b + δx δy · n_a n_b / n
+    不出现 Σx² - n·mean² 这样的大数相减，数据量很大、均值远离 0 时仍然稳定。
+    两个累加器可以 merge，用于并行计算后汇总
+
+    属性
+    ------
+    n : int
+        已累计的样本数
+    mean_x, mean_y : float
+        X、Y 的均值
+    m2_x, m2_y : float
+        Σ(x - mean_x)²、Σ(y - mean_y)²
+    c_xy : float
+        Σ(x - mean_x)(y - mean_y)
+
+    方法
+    ------
+    update(x, y)             送入一块数据（标量、列表或 ndarray）
+    merge(other)             并入另一个累加器的结果
+    var_x(sample=True)       X 的方差
+    var_y(sample=True)       Y 的方差
+    cov(sample=True)         协方差 Cov(X, Y)，与 cov(x, y) 相同
+    corr()                   皮尔逊相关系数，与 corr(x, y) 相同
+    """
+
+    __slots__ = ('n', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy')
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def _combine(self, n, mean_x, mean_y, m2_x, m2_y, c_xy):
+        if n == 0:
+            return
+        total = self.n + n
+        dx = mean_x - self.mean_x
+        dy = mean_y - self.mean_y
+        w = self.n * n / total
+        self.mean_x += dx * n / total
+        self.mean_y += dy * n / total
+        self.m2_x += m2_x + dx * dx * w
+        self.m2_y += m2_y + dy * dy * w
+        self.c_xy += c_xy + dx * dy * w
+        self.n = total
+
+    def update(self, x, y):
+        """
+        送入一块数据
+
+        参数
+        ------
+        x, y : float 或 list of float 或 ndarray
+            同一批样本的 X、Y，长度需相同
+
+        返回
+        ------
+        CovAccumulator
+            自身，便于链式调用
+        """
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if len(x) != len(y):
+            raise ValueError("x, y 长度必须相同")
+        if len(x):
+            mx, my = x.mean(), y.mean()
+            dx, dy = x - mx, y - my
+            self._combine(len(x), float(mx), float(my), float(dx @ dx), float(dy @ dy), float(dx @ dy))
+        return self
+
+    def merge(self, other):
+        """
+        并入另一个累加器（如另一个进程处理的数据块）的结果
+
+        参数
+        ------
+        other : CovAccumulator
+
+        返回
+        ------
+        CovAccumulator
+            自身
+        """
+        self._combine(other.n, other.mean_x, other.mean_y, other.m2_x, other.m2_y, other.c_xy)
+        return self
+
+    def _ddof(self, sample):
+        if sample and self.n < 2:
+            raise ValueError("样本协方差要求 n >= 2")
+        if self.n == 0:
+            raise ValueError("没有数据")
+        return self.n - 1 if sample else self.n
+
+    def var_x(self, sample=True):
+        return self.m2_x / self._ddof(sample)
+
+    def var_y(self, sample=True):
+        return self.m2_y / self._ddof(sample)
+
+    def cov(self, sample=True):
+        return self.c_xy / self._ddof(sample)
+
+    def corr(self, sample=True):
+        """
+        皮尔逊相关系数 C / √(M2_x · M2_y)；分母 n-1 或 n 约去，sample 只用于检查样本数
+        """
+        self._ddof(sample)
+        if self.m2_x == 0 or self.m2_y == 0:
+            raise ValueError("标准差为零，无法计算相关系数")
+        return self.c_xy / math.sqrt(self.m2_x * self.m2_y)
+
+
 def cov(x, y, sample=True):
     """
     计算协方差 Cov(X, Y)
@@ -67,21 +188,12 @@ def cov(x, y, sample=True):
     ------
     float
         Cov(X, Y)
+
+    数据放不进内存时用 CovAccumulator 分块累加，结果相同
     """
-    n = len(x)
-    if n != len(y):
+    if len(x) != len(y):
         raise ValueError("x, y 长度必须相同")
-    if sample and n < 2:
-        raise ValueError("样本协方差要求 n >= 2")
-    # 计算均值
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
-    # 计算 ∑(xi - mean_x)*(yi - mean_y)
-    total = 0.0
-    for xi, yi in zip(x, y):
-        total += (xi - mean_x) * (yi - mean_y)
-    # 样本用 n-1，总体用 n
-    return total / (n - 1 if sample else n)
+    return CovAccumulator().update(x, y).cov(sample)
 
 
 def corr(x, y, sample=True):
@@ -101,20 +213,213 @@ def corr(x, y, sample=True):
     ------
     float
         Pearson 相关系数，范围 [-1, 1]
+
+    协方差与两个方差在同一遍中得到，不再分别求均值
+    """
+    if len(x) != len(y):
+        raise ValueError("x, y 长度必须相同")
+    return CovAccumulator().update(x, y).corr(sample)
+
+
+class CovMatrixAccumulator:
+    r"""
+    多变量流式协方差矩阵累加器，CovAccumulator 的矩阵版本
+
+    每块数据 (行数 × k) 减去块均值后做一次矩阵乘法 Xcᵀ Xc 得到块内离差积矩阵，
+    再按 Chan 合并公式并入：M = M_a + M_b + δ δᵀ · n_a n_b / n。
+
+    pairwise=True 时按成对完整（pairwise-complete）处理 NaN：第 i、j 列的协方差只用这两列都不缺失的行。
+    此时样本数、均值、离差平方和都是 k × k 矩阵（第 (i, j) 格为第 i 列在 i、j 同时有值的行上的统计量），
+    每块用 4 次矩阵乘法得到，合并公式逐格套用，与 pandas.DataFrame.cov / corr 的口径相同
+
+    属性
+    ------
+    n : int 或 ndarray
+        样本数（pairwise 时为 k × k 矩阵）
+    mean : ndarray
+        均值（pairwise 时为 k × k 矩阵）
+    m2 : ndarray
+        离差积矩阵 Σ(x_i - mean_i)(x_j - mean_j)；pairwise 时另有 sq 保存各对上的离差平方和
+
+    方法
+    ------
+    update(chunk)            送入一块数据，形状 (行数, k)
+    merge(other)             并入另一个累加器的结果
+    cov(sample=True)         协方差矩阵
+    corr()                   相关系数矩阵，方差为零的列对应 nan
     """
-    # 协方差
-    cova = cov(x, y, sample=sample)
-    # 计算标准差
-    n = len(x)
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
-    var_x = sum((xi - mean_x) ** 2 for xi in x) / (n - 1 if sample else n)
-    var_y = sum((yi - mean_y) ** 2 for yi in y) / (n - 1 if sample else n)
-    std_x = math.sqrt(var_x)
-    std_y = math.sqrt(var_y)
-    if std_x == 0 or std_y == 0:
-        raise ValueError("标准差为零，无法计算相关系数")
-    return cova / (std_x * std_y)
+
+    __slots__ = ('pairwise', 'n', 'mean', 'm2', 'sq')
+
+    def __init__(self, pairwise=False):
+        self.pairwise = pairwise
+        self.n = 0
+        self.mean = self.m2 = self.sq = None
+
+    def _chunk_stats(self, x):
+        """块内的 (n, mean, m2, sq)"""
+        if not self.pairwise:
+            mean = x.mean(axis=0)
+            xc = x - mean
+            return len(x), mean, xc.T @ xc, None
+        valid = ~np.isnan(x)
+        w = valid.astype(float)
+        # 先按块内各列均值平移，下面的原点矩公式不会出现大数相减
+        with np.errstate(invalid='ignore'):
+            shift = np.nanmean(np.where(valid.any(axis=0), x, 0.0), axis=0)
+        z = np.where(valid, x - shift, 0.0)
+        n = w.T @ w
+        sx = z.T @ w                        # sx[i, j] = Σ x_i，求和范围为 i、j 都有值的行
+        with np.errstate(invalid='ignore', divide='ignore'):
+            inv = np.where(n > 0, 1 / n, 0.0)
+        mean = sx * inv + shift[:, None]
+        m2 = z.T @ z - sx * sx.T * inv
+        sq = (z * z).T @ w - sx * sx * inv
+        return n, mean, m2, sq
+
+    def _combine(self, n, mean, m2, sq):
+        if self.mean is None:
+            self.n, self.mean, self.m2, self.sq = n, mean, m2, sq
+            return
+        if mean.shape != self.mean.shape:
+            raise ValueError("数据的列数与之前不一致")
+        total = self.n + n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            frac = np.where(total > 0, n / np.where(total > 0, total, 1), 0.0)
+        w = self.n * frac
+        d = mean - self.mean
+        if self.pairwise:
+            # d[i, j] 为第 i 列在 (i, j) 这一对上的均值差，第 j 列对应 d[j, i]
+            self.m2 = self.m2 + m2 + d * d.T * w
+            self.sq = self.sq + sq + d * d * w
+        else:
+            self.m2 = self.m2 + m2 + np.outer(d, d) * w
+        self.mean = self.mean + d * frac
+        self.n = total
+
+    def update(self, chunk):
+        """
+        送入一块数据
+
+        参数
+        ------
+        chunk : array_like 或 DataFrame
+            形状 (行数, k)，各块的列数必须相同
+
+        返回
+        ------
+        CovMatrixAccumulator
+            自身
+        """
+        x = np.asarray(chunk.to_numpy() if hasattr(chunk, 'to_numpy') else chunk, dtype=float)
+        if x.ndim != 2:
+            raise ValueError("数据必须是二维数组（行为样本，列为变量）")
+        if len(x):
+            self._combine(*self._chunk_stats(x))
+        return self
+
+    def merge(self, other):
+        """
+        并入另一个累加器的结果，两者的 pairwise 设置必须相同
+        """
+        if other.pairwise != self.pairwise:
+            raise ValueError("pairwise 设置不同的累加器不能合并")
+        if other.mean is not None:
+            self._combine(other.n, other.mean, other.m2, other.sq)
+        return self
+
+    def cov(self, sample=True):
+        """
+        协方差矩阵；pairwise 时有效样本数不足（n < 2 或 n < 1）的格为 nan
+        """
+        if self.mean is None:
+            raise ValueError("没有数据")
+        ddof = self.n - 1 if sample else self.n
+        if not self.pairwise:
+            if ddof <= 0:
+                raise ValueError("样本协方差要求 n >= 2")
+            return self.m2 / ddof
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(ddof > 0, self.m2 / np.where(ddof > 0, ddof, 1), np.nan)
+
+    def corr(self):
+        """
+        相关系数矩阵，pairwise 时每一格用该对的有效行上的两个方差
+        """
+        if self.mean is None:
+            raise ValueError("没有数据")
+        if self.pairwise:
+            denom = np.sqrt(self.sq * self.sq.T)
+        else:
+            d = np.sqrt(np.diag(self.m2))
+            denom = np.outer(d, d)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = np.where(denom > 0, self.m2 / np.where(denom > 0, denom, 1), np.nan)
+        # 舍入可能让 |ρ| 略大于 1
+        return np.clip(out, -1.0, 1.0)
+
+
+def _accumulate(data, chunk, pairwise):
+    """
+    data 为二维数组 / DataFrame 时按 chunk 行一块送入（chunk=None 时整块），
+    为迭代器（如逐块读文件的生成器）时逐块送入
+    """
+    acc = CovMatrixAccumulator(pairwise)
+    if hasattr(data, '__next__'):
+        for part in data:
+            acc.update(part)
+        return acc
+    x = np.asarray(data.to_numpy() if hasattr(data, 'to_numpy') else data, dtype=float)
+    if chunk is None:
+        return acc.update(x)
+    if chunk <= 0:
+        raise ValueError("chunk 必须为正整数")
+    for start in range(0, len(x), chunk):
+        acc.update(x[start:start + chunk])
+    return acc
+
+
+def _labelled(result, data):
+    """输入为 DataFrame 时按列名返回同类型的表"""
+    columns = getattr(data, 'columns', None)
+    if columns is None or hasattr(data, '__next__'):
+        return result
+    return type(data)(result, index=columns, columns=columns)
+
+
+def cov_matrix(data, sample=True, chunk=None, pairwise=False):
+    """
+    协方差矩阵：一次矩阵乘法得到全部变量两两之间的协方差
+
+    参数
+    ------
+    data : array_like 或 DataFrame 或 迭代器
+        形状 (样本数, 变量数) 的数据；也可以是逐块产出二维数组的迭代器，数据不必一次读入内存
+    sample : bool
+        是否使用样本协方差（除以 N-1），默认 True
+    chunk : int, 可选
+        按行分块的大小，数据很高时限制临时数组的大小
+    pairwise : bool
+        是否按成对完整处理 NaN；默认 False，此时含 NaN 的列结果为 NaN
+
+    返回
+    ------
+    ndarray 或 DataFrame
+        k × k 协方差矩阵，第 (i, j) 格与 cov(data[:, i], data[:, j]) 相同
+    """
+    return _labelled(_accumulate(data, chunk, pairwise).cov(sample), data)
+
+
+def corr_matrix(data, chunk=None, pairwise=False):
+    """
+    皮尔逊相关系数矩阵，参数同 cov_matrix
+
+    返回
+    ------
+    ndarray 或 DataFrame
+        k × k 相关系数矩阵，第 (i, j) 格与 corr(data[:, i], data[:, j]) 相同；方差为零的列对应 NaN
+    """
+    return _labelled(_accumulate(data, chunk, pairwise).corr(), data)
 
 
 # ========== 使用示例 ==========
@@ -129,3 +434,13 @@ print("样本协方差 =", cov(x1, y1))
 print("总体协方差 =", cov(x1, y1, sample=False))
 print("样本相关系数 =", corr(x1, y1))
 print("总体相关系数 =", corr(x1, y1, sample=False))
+
+# 分块流式计算：数据逐块读入，结果与一次性计算相同；两个累加器可以合并
+acc_a = CovAccumulator().update(x1[:2], y1[:2])
+acc_b = CovAccumulator().update(x1[2:], y1[2:])
+print("分块合并的样本协方差 =", acc_a.merge(acc_b).cov(), "相关系数 =", acc_a.corr())
+
+# 多变量：一次得到协方差矩阵与相关系数矩阵，NaN 按成对完整处理
+data = np.column_stack([x1, y1, [1.0, np.nan, 0.5, 2.0]])
+print("协方差矩阵 =\n", cov_matrix(data[:, :2]))
+print("相关系数矩阵（成对完整）=\n", corr_matrix(data, pairwise=True, chunk=2))
@@ -4,10 +4,30 @@
     @time  : 2025/8/1 16:58
     @file  : approx.py
 """
+import math
+import os
+import sys
+
+import numpy as np
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
 from distribute.Hypergeom import HyperGeom
 from distribute.binom import Binom
+from distribute.norm import Norm
 from distribute.poisson import Poisson
 
+# Berry–Esseen 常数（Shevtsova, 2011）：sup|F_n - Φ| <= C ρ / (σ³ √n)
+BERRY_ESSEEN = 0.4748
+
+# 候选近似按单次查询的开销从低到高排列，route 选第一个满足误差要求的
+_COST_ORDER = ('normal', 'poisson', 'binom', 'exact')
+
+# 误差度量：'tv' 为全变差距离 sup_A |P(A) - Q(A)|，'kolmogorov' 为分布函数的距离 sup_k |F(k) - G(k)|；
+# d_K <= d_TV，全变差的上界同时也是 Kolmogorov 距离的上界
+METRICS = ('tv', 'kolmogorov')
+
 
 def b2poisson(n, p):
     """
@@ -45,6 +65,177 @@ def h2binom(N, M, n):
     # p = M / N
     return Binom(n, M / N)
 
+
+class LatticeNorm:
+    """
+    整数格点上带连续性校正的正态近似：P(X <= k) ≈ Φ((⌊k⌋ + 0.5 - μ) / σ)，
+    P(X = k) ≈ Φ((k + 0.5 - μ)/σ) - Φ((k - 0.5 - μ)/σ)
+
+    Parameters
+    ----------
+    mu: float
+        均值
+    sigma: float
+        标准差，必须为正数
+    """
+
+    __slots__ = ('norm',)
+
+    def __init__(self, mu, sigma):
+        self.norm = Norm(mu, sigma)
+
+    def pmf(self, k):
+        """
+        P(X = k) ≈ Φ((k + 0.5 - μ)/σ) - Φ((k - 0.5 - μ)/σ)，非整数 k 为 0
+
+        Parameters
+        ----------
+        k: int | array_like
+
+        Returns
+        -------
+        ndarray，与 k 同形状
+        """
+        k = np.asarray(k, dtype=float)
+        return np.where(k == np.floor(k), self.norm.cdf(k + 0.5) - self.norm.cdf(k - 0.5), 0.0)
+
+    def cdf(self, k):
+        """
+        P(X <= k) ≈ Φ((⌊k⌋ + 0.5 - μ) / σ)
+
+        Parameters
+        ----------
+        k: float | array_like
+
+        Returns
+        -------
+        float | ndarray
+        """
+        return self.norm.cdf(np.floor(k) + 0.5)
+
+    def sf(self, k):
+        """
+        P(X > k) ≈ 1 - Φ((⌊k⌋ + 0.5 - μ) / σ)，右尾由 Norm.sf 直接算出
+
+        Parameters
+        ----------
+        k: float | array_like
+
+        Returns
+        -------
+        float | ndarray
+        """
+        return self.norm.sf(np.floor(k) + 0.5)
+
+    def expectation(self):
+        """
+        期望 μ
+        """
+        return self.norm.mu
+
+    def variance(self):
+        """
+        方差 σ²
+        """
+        return self.norm.sigma ** 2
+
+    def __str__(self):
+        """
+        返回近似分布的参数
+        """
+        return f"LatticeNorm(mu={self.norm.mu}, sigma={self.norm.sigma})"
+
+
+def _binom_bounds(n, p, metric):
+    """Binom(n, p) 到泊松、正态近似在给定度量下的误差上界"""
+    lam, q = n * p, 1 - p
+    bounds = {'exact': 0.0}
+    # Le Cam 不等式 d_TV <= n p² 的加强形式（Barbour–Hall）：d_TV <= (1 - e^{-λ}) p
+    bounds['poisson'] = -math.expm1(-lam) * p if lam > 0 else math.inf
+    # Berry–Esseen 只控制分布函数的 Kolmogorov 距离；连续性校正后的正态近似没有可用的全变差上界
+    var = lam * q
+    if metric == 'kolmogorov' and var > 0:
+        bounds['normal'] = BERRY_ESSEEN * (p * p + q * q) / math.sqrt(var)
+    else:
+        bounds['normal'] = math.inf
+    return bounds
+
+
+def error_bounds(dist, metric='tv'):
+    """
+    各候选近似在给定度量下的误差上界
+
+    Binom(n, p)：泊松近似用 Le Cam / Barbour–Hall 不等式 d_TV <= (1 - e^{-np}) p；
+    正态近似用 Berry–Esseen 不等式，它只给出 Kolmogorov 距离，metric='tv' 时正态一项为 inf。
+    HyperGeom(N, M, n)：二项近似用 Ehm 不等式 d_TV <= (n - 1)/(N - 1)，
+    泊松、正态近似在二项近似的界上按三角不等式相加。
+    全变差上界也是 Kolmogorov 距离的上界，metric='kolmogorov' 时沿用
+
+    Parameters
+    ----------
+    dist: Binom 或 HyperGeom
+        待近似的分布
+    metric: str
+        'tv'（全变差距离，默认）或 'kolmogorov'（分布函数的最大差）
+
+    Returns
+    -------
+    dict，方法名 -> 误差上界（不可用的近似为 inf，上界不超过 1）
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric 只能是 {METRICS} 之一，收到 {metric!r}")
+    if isinstance(dist, Binom):
+        bounds = _binom_bounds(dist.n, dist.p, metric)
+    elif isinstance(dist, HyperGeom):
+        p = dist.M / dist.N
+        binom = (dist.n - 1) / (dist.N - 1) if dist.N > 1 else 0.0
+        bounds = {name: b + binom for name, b in _binom_bounds(dist.n, p, metric).items()}
+        bounds['binom'] = binom
+        bounds['exact'] = 0.0
+    else:
+        raise ValueError(f"只支持 Binom 与 HyperGeom，收到 {type(dist).__name__}")
+    return {name: b if math.isinf(b) else min(b, 1.0) for name, b in bounds.items()}
+
+
+def route(dist, tol=1e-2, metric='tv'):
+    """
+    自动选择近似：在误差上界不超过 tol 的候选中取开销最低的一个
+    开销从低到高依次为 正态（连续性校正）、泊松、二项、精确分布。
+    默认按全变差距离保证误差，此时正态近似不参与选择（Berry–Esseen 不给出全变差的界）；
+    只关心分布函数（尾概率、分位数）时可用 metric='kolmogorov'，正态近似才可能被选中
+
+    Parameters
+    ----------
+    dist: Binom 或 HyperGeom
+        待近似的分布
+    tol: float
+        允许的误差上界
+    metric: str
+        'tv'（全变差距离，默认）或 'kolmogorov'，见 error_bounds
+
+    Returns
+    -------
+    (近似分布对象, 方法名, 误差上界, 度量)，误差上界是在该度量下的
+    """
+    if tol < 0:
+        raise ValueError("tol 必须非负")
+    bounds = error_bounds(dist, metric)
+    name = next(m for m in _COST_ORDER if bounds.get(m, math.inf) <= tol)
+    if name == 'exact':
+        return dist, name, 0.0, metric
+    if isinstance(dist, Binom):
+        n, p = dist.n, dist.p
+    else:
+        n, p = dist.n, dist.M / dist.N
+    if name == 'binom':
+        approx = h2binom(dist.N, dist.M, dist.n)
+    elif name == 'poisson':
+        approx = b2poisson(n, p)
+    else:
+        approx = LatticeNorm(n * p, math.sqrt(n * p * (1 - p)))
+    return approx, name, bounds[name], metric
+
+
 n, p = 1000, 0.003
 poi = b2poisson(n, p)  # λ=3
 # 比较二项分布和泊松分布概率，k=0,1,2,3,4
@@ -58,3 +249,11 @@ hg = HyperGeom(N, M, n_sample)
 bino = h2binom(N, M, n_sample)
 print("超几何分布与二项近似（N=1000, M=100, n=10）:")
 print(f"k=5   HyperGeom P(X=5)={hg.pmf(5):.5f}   Binom P(X=5)={bino.pmf(5):.5f}")
+
+# --- 案例3：按误差上界自动选择近似 ---
+for d in (Binom(1000, 0.003), Binom(10000, 0.4), HyperGeom(100000, 300, 50), HyperGeom(50, 20, 10)):
+    for metric in METRICS:
+        approx, name, bound, metric = route(d, tol=0.01, metric=metric)
+        k = math.floor(d.expectation())
+        print(f"{d.__class__.__name__}: 选择 {name}（{metric} 误差上界 {bound:.2e}），"
+              f"P(X<={k}) ≈ {float(approx.cdf(k)):.5f}，精确值 {d.cdf(k):.5f}")
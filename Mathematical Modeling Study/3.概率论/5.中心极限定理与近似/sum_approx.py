@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/8 14:30
+    @file  : sum_approx.py
+
+    独立同分布和 S_n = X_1 + ... + X_n 的分布函数近似
+
+    normal       中心极限定理（格点分布加连续性校正），即 clt.py 的做法
+    edgeworth    Edgeworth 展开，用偏度、超额峰度修正正态近似，适合中心区域
+    saddlepoint  鞍点近似（Lugannani–Rice，格点分布用 Daniels 的第二连续性校正），
+                 尾部相对误差为 O(1/n)
+    exact        有闭式的用闭式（Binom、Poisson 的可加性，Gamma 族，负二项），
+                 超几何用卷积
+
+    X_i 可以是 distribute 中任一分布类的实例；每种方法都同时返回 (P(S_n <= x), P(S_n > x))，
+    较小的一侧直接算出，尾部不经过 1 - x。
+    choose_method 按 z 值估计正态、Edgeworth 的误差，在满足相对误差要求的方法里选最便宜的
+"""
+import math
+import os
+import sys
+
+import numpy as np
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from distribute import Binom, Gamma, Norm, Poisson
+from distribute.integrate import tanh_sinh
+
+# 超几何分布的卷积：n 倍支撑集长度不超过 CONV_CHEAP 时卷积比鞍点更划算，超过 CONV_MAX 时不再卷积
+CONV_CHEAP = 2000
+CONV_MAX = 200000
+
+
+def _ndtr_pair(z):
+    """(Φ(z), 1 - Φ(z))，两侧都由 erfc 直接算出"""
+    return 0.5 * math.erfc(-z / math.sqrt(2)), 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _phi(z):
+    return math.exp(-0.5 * z * z) / math.sqrt(2 * math.pi)
+
+
+def _lattice(dist):
+    """整数格点上的离散分布"""
+    return hasattr(dist, 'pmf')
+
+
+# ---------------------------------------------------------------- 累积量生成函数
+
+def _expit(x):
+    """1 / (1 + e^{-x})，两侧都不溢出"""
+    if x >= 0:
+        return 1 / (1 + math.exp(-x))
+    e = math.exp(x)
+    return e / (1 + e)
+
+
+def _finite_cgf(values, logp):
+    """有限支撑集离散分布的 K(t)，按 log-sum-exp 计算，t 很大时不溢出"""
+    def cgf(t):
+        w = logp + t * values
+        top = w.max()
+        q = np.exp(w - top)
+        total = q.sum()
+        q /= total
+        k1 = float(q @ values)
+        return top + math.log(total), k1, float(q @ (values - k1) ** 2)
+    return cgf
+
+
+def _bounded_cgf(logpdf, a, b):
+    """
+    有界支撑集连续分布的 K(t)，矩母函数用 tanh-sinh 求积
+
+    以 t 方向上的端点 c 为中心，被积函数 e^{t(x-c)} f(x) 不会溢出
+    """
+    def cgf(t):
+        c = b if t > 0 else a
+        m = [tanh_sinh(lambda x, j=j: (x - c) ** j * np.exp(logpdf(x) + t * (x - c)), a, b)[0]
+             for j in range(3)]
+        mean = m[1] / m[0]
+        return t * c + math.log(m[0]), c + mean, m[2] / m[0] - mean * mean
+    return cgf
+
+
+def _cgf(dist):
+    """
+    单个 X 的累积量生成函数 K(t) = log E[e^{tX}]
+
+    返回
+    ------
+    tuple : (cgf, (t_lo, t_hi), (x_lo, x_hi))
+        cgf(t) 返回 (K(t), K'(t), K''(t))；t 的定义域为开区间 (t_lo, t_hi)，
+        (x_lo, x_hi) 为 X 的取值范围
+    """
+    name = type(dist).__name__
+    inf = math.inf
+    if name == 'Binom':
+        m, p = dist.n, dist.p
+        logit = math.log(p) - math.log1p(-p)
+
+        def cgf(t):
+            # π = p e^t / (1 - p + p e^t)，log(1 - p + p e^t) = log(1-p) - log(1-π) = log p + t - log π
+            pi = _expit(t + logit)
+            k = math.log1p(-p) - math.log1p(-pi) if pi < 0.5 else math.log(p) + t - math.log(pi)
+            return m * k, m * pi, m * pi * (1 - pi)
+        return cgf, (-inf, inf), (0, m)
+    if name == 'Poisson':
+        lam = dist.lam
+        return (lambda t: (lam * math.expm1(t), lam * math.exp(t), lam * math.exp(t))), (-inf, inf), (0, inf)
+    if name == 'Geom':
+        p = dist.p
+        r = math.log1p(-p)
+
+        def cgf(t):
+            # e^t (1-p) < 1，记 d = 1 - (1-p)e^t
+            d = -math.expm1(t + r)
+            return math.log(p) + t - math.log(d), 1 / d, (1 - d) / (d * d)
+        return cgf, (-inf, -r), (1, inf)
+    if name == 'Norm':
+        mu, var = dist.mu, dist.sigma ** 2
+        return (lambda t: (mu * t + var * t * t / 2, mu + var * t, var)), (-inf, inf), (-inf, inf)
+    if name in ('Exp', 'Gamma'):
+        k = 1.0 if name == 'Exp' else dist.k
+        lam = dist.lam
+        return ((lambda t: (-k * math.log1p(-t / lam), k / (lam - t), k / (lam - t) ** 2)),
+                (-inf, lam), (0, inf))
+    if name == 'Uniform':
+        c, h = (dist.a + dist.b) / 2, (dist.b - dist.a) / 2
+
+        def cgf(t):
+            # X = c + hV，V ~ U(-1, 1)：K_V(s) = log(sinh s / s)
+            s = h * t
+            a = abs(s)
+            if a < 1e-4:
+                kv, k1, k2 = s * s / 6, s / 3, 1 / 3 - s * s / 15
+            else:
+                kv = a + math.log(-math.expm1(-2 * a)) - math.log(2 * a)
+                k1 = 1 / math.tanh(s) - 1 / s
+                k2 = 1 / (s * s) - (1 / math.sinh(s) ** 2 if a < 350 else 0.0)
+            return c * t + kv, c + h * k1, h * h * k2
+        return cgf, (-inf, inf), (dist.a, dist.b)
+    if name == 'HyperGeom':
+        low, high = max(0, dist.n + dist.M - dist.N), min(dist.n, dist.M)
+        values = np.arange(low, high + 1, dtype=float)
+        return _finite_cgf(values, dist.logpmf(values)), (-inf, inf), (low, high)
+    if name == 'Beta':
+        return _bounded_cgf(dist.logpdf, 0.0, 1.0), (-inf, inf), (0.0, 1.0)
+    raise ValueError(f"不支持的分布类型: {name}")
+
+
+def _saddle(cgf, domain, s, tol=1e-13, max_iter=200):
+    """
+    解鞍点方程 K'(t) = s：Newton 迭代，跳出当前括区间时改为二分（无穷端点则倍增）
+    """
+    lo, hi = domain
+    t = 0.0
+    for _ in range(max_iter):
+        _, k1, k2 = cgf(t)
+        diff = k1 - s
+        if abs(diff) <= tol * max(1.0, abs(s)):
+            break
+        if diff > 0:
+            hi = t
+        else:
+            lo = t
+        step = t - diff / k2
+        if not lo < step < hi:
+            if math.isfinite(lo) and math.isfinite(hi):
+                step = (lo + hi) / 2
+            elif math.isfinite(lo):
+                step = t + max(1.0, abs(t))
+            else:
+                step = t - max(1.0, abs(t))
+        t = step
+    return t
+
+
+# ---------------------------------------------------------------- 各近似方法
+
+def normal(dist, n, x):
+    """
+    中心极限定理近似，格点分布用连续性校正 x + 0.5
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    n : int
+        求和的项数
+    x : float
+
+    返回
+    ------
+    tuple : (P(S_n <= x), P(S_n > x))
+    """
+    if _lattice(dist):
+        x = math.floor(x) + 0.5
+    sd = math.sqrt(n * dist.variance())
+    return _ndtr_pair((x - n * dist.expectation()) / sd)
+
+
+def _edgeworth_terms(dist, n, z):
+    """Edgeworth 一阶、二阶修正项（乘 φ(z) 之前）"""
+    g1 = dist.skewness() / math.sqrt(n)
+    g2 = dist.kurtosis(excess=True) / n
+    he2 = z * z - 1
+    he3 = z * (z * z - 3)
+    he5 = z * (z ** 4 - 10 * z * z + 15)
+    return g1 / 6 * he2, g2 / 24 * he3 + g1 * g1 / 72 * he5
+
+
+def edgeworth(dist, n, x):
+    """
+    Edgeworth 展开 F(x) ≈ Φ(z) - φ(z)[γ₁/6 He₂(z) + γ₂/24 He₃(z) + γ₁²/72 He₅(z)]
+    γ₁ = Skew[X]/√n，γ₂ = 超额峰度/n；格点分布用连续性校正 x + 0.5
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    n : int
+    x : float
+
+    返回
+    ------
+    tuple : (P(S_n <= x), P(S_n > x))，截断到 [0, 1]
+    """
+    if _lattice(dist):
+        x = math.floor(x) + 0.5
+    z = (x - n * dist.expectation()) / math.sqrt(n * dist.variance())
+    first, second = _edgeworth_terms(dist, n, z)
+    corr = _phi(z) * (first + second)
+    lower, upper = _ndtr_pair(z)
+    return min(max(lower - corr, 0.0), 1.0), min(max(upper + corr, 0.0), 1.0)
+
+
+def saddlepoint(dist, n, x):
+    """
+    鞍点近似（Lugannani–Rice）
+
+    连续分布：P(S_n <= x) ≈ Φ(w) + φ(w)(1/w - 1/u)，
+    w = sgn(t̂)√(2(t̂x - nK(t̂)))，u = t̂√(nK''(t̂))，t̂ 为 nK'(t) = x 的根；
+    格点分布用 Daniels 的第二连续性校正：在 x + 1/2 处求鞍点，u = 2 sinh(t̂/2)√(nK''(t̂))。
+    鞍点靠近均值（|u| < 1e-4）时 1/w - 1/u 会抵消，改用 Edgeworth
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    n : int
+    x : float
+
+    返回
+    ------
+    tuple : (P(S_n <= x), P(S_n > x))
+    """
+    lattice = _lattice(dist)
+    if lattice:
+        x = math.floor(x)
+    if dist.variance() == 0:
+        return (1.0, 0.0) if x >= n * dist.expectation() else (0.0, 1.0)
+    cgf, domain, (x_lo, x_hi) = _cgf(dist)
+    if lattice:
+        if x < n * x_lo:
+            return 0.0, 1.0
+        if x >= n * x_hi:
+            return 1.0, 0.0
+        s = x + 0.5
+    else:
+        if x <= n * x_lo:
+            return 0.0, 1.0
+        if x >= n * x_hi:
+            return 1.0, 0.0
+        s = x
+    t = _saddle(cgf, domain, s / n)
+    k, _, k2 = cgf(t)
+    scale = math.sqrt(n * k2)
+    u = (2 * math.sinh(t / 2) if lattice else t) * scale
+    if abs(u) < 1e-4:
+        return edgeworth(dist, n, x)
+    w = math.copysign(math.sqrt(max(2 * (t * s - n * k), 0.0)), t)
+    corr = _phi(w) * (1 / w - 1 / u)
+    lower, upper = _ndtr_pair(w)
+    return min(max(lower + corr, 0.0), 1.0), min(max(upper - corr, 0.0), 1.0)
+
+
+def _hypergeom_sum(dist, n):
+    """n 个独立超几何变量之和的 pmf（二进制幂次卷积），返回 (下界, pmf 数组)"""
+    low, high = max(0, dist.n + dist.M - dist.N), min(dist.n, dist.M)
+    base = np.exp(dist.logpmf(np.arange(low, high + 1)))
+    result = np.ones(1)
+    while n:
+        if n & 1:
+            result = np.convolve(result, base)
+        n >>= 1
+        if n:
+            base = np.convolve(base, base)
+    return 0, result
+
+
+def _conv_size(dist, n):
+    """超几何和的支撑集长度，其他分布返回 None"""
+    if type(dist).__name__ != 'HyperGeom':
+        return None
+    return n * (min(dist.n, dist.M) - max(0, dist.n + dist.M - dist.N)) + 1
+
+
+def _exact_closed(dist, n):
+    """
+    S_n 有闭式分布时返回 x -> (cdf, sf)，否则返回 None
+    """
+    name = type(dist).__name__
+    if name == 'Binom':
+        d = Binom(n * dist.n, dist.p)
+    elif name == 'Poisson':
+        d = Poisson(n * dist.lam)
+    elif name == 'Norm':
+        d = Norm(n * dist.mu, math.sqrt(n) * dist.sigma)
+    elif name == 'Exp':
+        d = Gamma(n, dist.lam)
+    elif name == 'Gamma':
+        d = Gamma(n * dist.k, dist.lam)
+    elif name == 'Geom':
+        # 第 n 次成功所需试验数 S_n <= k  ⇔  前 k 次试验中至少 n 次成功
+        def geom_sum(x):
+            k = math.floor(x)
+            if k < n:
+                return 0.0, 1.0
+            b = Binom(k, dist.p)
+            return b.sf(n - 1), b.cdf(n - 1)
+        return geom_sum
+    else:
+        return None
+    return lambda x: (d.cdf(x), d.sf(x))
+
+
+def exact(dist, n, x):
+    """
+    S_n 的精确分布函数
+
+    Binom、Poisson、Norm、Gamma 族由可加性得到同族分布，Geom 之和为负二项分布，
+    HyperGeom 对 pmf 做卷积；Uniform、Beta 没有可用的精确形式，抛出 ValueError
+
+    返回
+    ------
+    tuple : (P(S_n <= x), P(S_n > x))
+    """
+    closed = _exact_closed(dist, n)
+    if closed is not None:
+        return closed(x)
+    size = _conv_size(dist, n)
+    if size is None:
+        raise ValueError(f"{type(dist).__name__} 之和没有可用的精确分布")
+    if size > CONV_MAX:
+        raise ValueError(f"卷积长度 {size} 超过 CONV_MAX")
+    low, pmf = _hypergeom_sum(dist, n)
+    k = math.floor(x) - low
+    if k < 0:
+        return 0.0, 1.0
+    if k >= len(pmf) - 1:
+        return 1.0, 0.0
+    return float(pmf[:k + 1].sum()), float(pmf[k + 1:].sum())
+
+
+_METHODS = {
+    'normal': normal,
+    'edgeworth': edgeworth,
+    'saddlepoint': saddlepoint,
+    'exact': exact,
+}
+
+
+# ---------------------------------------------------------------- 方法选择
+
+def _next_edgeworth(dist, n, z):
+    """
+    Edgeworth 展开下一阶各项（γ₁γ₂ He₆、γ₁³ He₈，以及对称分布时起主导的 γ₂² He₇，
+    不含 κ₅、κ₆ 项）的大小，作为二阶展开的误差估计
+    """
+    g1 = dist.skewness() / math.sqrt(n)
+    g2 = dist.kurtosis(excess=True) / n
+    z2 = z * z
+    he6 = ((z2 - 15) * z2 + 45) * z2 - 15
+    he7 = (((z2 - 21) * z2 + 105) * z2 - 105) * z
+    he8 = (((z2 - 28) * z2 + 210) * z2 - 420) * z2 + 105
+    return abs(g1 * g2 / 144 * he6) + abs(g1 ** 3 / 1296 * he8) + abs(g2 * g2 / 1152 * he7)
+
+
+def choose_method(dist, n, x, rtol=1e-3):
+    """
+    按精度与开销选择近似方法
+
+    以 x 所在一侧的尾概率 P = min(Φ(z), 1 - Φ(z)) 为基准：
+    1. 正态近似的误差（Edgeworth 一、二阶修正项之和）不超过 rtol·P 时用 'normal'；
+    2. Edgeworth 的误差（三阶项的大小）不超过 rtol·P 时用 'edgeworth'；
+    3. 有 O(1) 闭式精确分布时用 'exact'；
+    4. 超几何且卷积长度不超过 CONV_CHEAP 时用 'exact'；
+    5. 否则用 'saddlepoint'（尾部相对误差 O(1/n)）
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    n : int
+    x : float
+    rtol : float
+        允许的相对误差
+
+    返回
+    ------
+    str : 'normal'、'edgeworth'、'exact' 或 'saddlepoint'
+    """
+    if dist.variance() == 0:
+        return 'exact' if _exact_closed(dist, n) is not None else 'normal'
+    xc = math.floor(x) + 0.5 if _lattice(dist) else x
+    z = (xc - n * dist.expectation()) / math.sqrt(n * dist.variance())
+    tail = min(_ndtr_pair(z))
+    first, second = _edgeworth_terms(dist, n, z)
+    density = _phi(z)
+    if density * (abs(first) + abs(second)) <= rtol * tail:
+        return 'normal'
+    if density * _next_edgeworth(dist, n, z) <= rtol * tail:
+        return 'edgeworth'
+    if _exact_closed(dist, n) is not None:
+        return 'exact'
+    size = _conv_size(dist, n)
+    if size is not None and size <= CONV_CHEAP:
+        return 'exact'
+    return 'saddlepoint'
+
+
+def _dispatch(dist, n, x, method, rtol, side):
+    if n < 1 or n != int(n):
+        raise ValueError("n 必须为正整数")
+    if np.ndim(x) != 0:
+        return np.array([_dispatch(dist, n, v, method, rtol, side) for v in np.ravel(x)]).reshape(np.shape(x))
+    name = choose_method(dist, n, x, rtol) if method == 'auto' else method
+    if name not in _METHODS:
+        raise ValueError(f"未知的方法: {method}")
+    return _METHODS[name](dist, n, x)[side]
+
+
+def sum_cdf(dist, n, x, method='auto', rtol=1e-3):
+    """
+    P(S_n <= x)，S_n 为 n 个与 dist 同分布的独立变量之和
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    n : int
+        项数
+    x : float 或 array_like
+    method : str
+        'auto'（由 choose_method 选择）、'normal'、'edgeworth'、'saddlepoint' 或 'exact'
+    rtol : float
+        method='auto' 时允许的相对误差
+
+    返回
+    ------
+    float 或 ndarray
+    """
+    return _dispatch(dist, n, x, method, rtol, 0)
+
+
+def sum_sf(dist, n, x, method='auto', rtol=1e-3):
+    """
+    P(S_n > x)，右尾直接算出，参数同 sum_cdf
+    """
+    return _dispatch(dist, n, x, method, rtol, 1)
+
+
+if __name__ == '__main__':
+    from distribute import Exp, HyperGeom, Uniform
+
+    # 100 个 Exp(1) 之和的右尾：精确值为 Gamma(100, 1)
+    for x in (110, 130, 160):
+        row = {m: sum_sf(Exp(1), 100, x, m) for m in ('normal', 'edgeworth', 'saddlepoint', 'exact')}
+        print(f"P(S_100 > {x}):", ', '.join(f"{m}={v:.6e}" for m, v in row.items()),
+              '自动选择:', choose_method(Exp(1), 100, x))
+
+    # 50 个超几何变量之和的左尾
+    hg = HyperGeom(50, 10, 8)
+    for x in (40, 60, 70):
+        print(f"HG 和 P(S_50 <= {x}): saddlepoint={sum_cdf(hg, 50, x, 'saddlepoint'):.6e}",
+              f"exact={sum_cdf(hg, 50, x, 'exact'):.6e}")
+
+    # Uniform 之和没有精确式，自动选择 Edgeworth 或鞍点
+    print("P(S_30 <= 10) ≈", sum_cdf(Uniform(0, 1), 30, 10), choose_method(Uniform(0, 1), 30, 10))
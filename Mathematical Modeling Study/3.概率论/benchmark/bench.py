@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/6 15:40
+    @file  : bench.py
+
+    distribute 的基准测试
+
+    对每个分布类的每个公开方法，在不同参数规模（小/大）、不同取值位置（中心/尾部）、
+    标量与数组输入下计时，并与 reference.py 的高精度参考值比较误差，结果写成 JSON；
+    --compare 读入旧版本的结果，列出变慢或精度变差的条目，有回退时返回码为 1
+
+    用法
+    ------
+    python bench.py -o new.json
+    python bench.py -o new.json --compare old.json
+    python bench.py --quick --only Binom Norm
+"""
+
+import argparse
+import inspect
+import json
+import math
+import os
+import platform
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
+
+# 未 pip install 时从上一级目录导入共享的 distribute 包
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import distribute
+from reference import reference, central, ln
+
+# 每个类的小/大两组参数，以及中心、尾部两个取值点（离散为整数 k，连续为 x）
+CASES = [
+    ('Binom', dict(n=20, p=0.3), 6, 18),
+    ('Binom', dict(n=5000, p=0.3), 1500, 1700),
+    ('Poisson', dict(lam=3.0), 3, 15),
+    ('Poisson', dict(lam=500.0), 500, 640),
+    ('HyperGeom', dict(N=50, M=20, n=10), 4, 9),
+    ('HyperGeom', dict(N=10000, M=3000, n=2000), 600, 710),
+    ('Geom', dict(p=0.3), 3, 40),
+    ('Geom', dict(p=0.01), 100, 2000),
+    ('Norm', dict(mu=0.0, sigma=1.0), 0.3, -8.0),
+    ('Norm', dict(mu=1000.0, sigma=50.0), 1010.0, 1400.0),
+    ('Uniform', dict(a=0.0, b=1.0), 0.3, 1e-9),
+    ('Uniform', dict(a=-1000.0, b=1000.0), 17.0, 999.999),
+    ('Exp', dict(lam=1.0), 0.7, 40.0),
+    ('Exp', dict(lam=1000.0), 0.0007, 0.04),
+    ('Gamma', dict(k=3, lam=2.0), 1.4, 15.0),
+    ('Gamma', dict(k=50, lam=0.5), 100.0, 30.0),
+    ('Beta', dict(alpha=2, beta=5), 0.3, 0.999),
+    ('Beta', dict(alpha=40, beta=60), 0.4, 0.05),
+]
+
+# 方法名 -> 参数类型；未列出的公开方法若不需要参数则按 'none' 处理，否则记为跳过
+METHOD_KIND = {
+    'pmf': 'point', 'pdf': 'point', 'cdf': 'point', 'sf': 'point',
+    'logpmf': 'point', 'logpdf': 'point', 'logcdf': 'point', 'logsf': 'point',
+    'quantile': 'prob', 'isf': 'prob',
+    'raw_moment': 'order', 'central_moment': 'order',
+    'rvs': 'size',
+}
+
+PROBS = {'center': 0.5, 'tail': 1e-10}
+ORDERS = {'low': 3, 'high': 10}
+ARRAY_SIZE = 10000
+
+
+def _timeit(func, budget):
+    """
+    单次调用的耗时（秒）：先把循环次数倍增到约 budget/5，再重复 3 次取最小值
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= budget / 5 or number >= 1 << 20:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(2):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def _rel(got, ref, scale=None):
+    """
+    相对误差 |got - ref| / max(|ref|, scale)；got 为 inf/nan 或两者恰有一个为 0 时为 inf
+    """
+    if ref is None:
+        return None
+    if not math.isfinite(got):
+        return 0.0 if Decimal(got) == ref else math.inf
+    denom = max(abs(ref), Decimal(scale or 0))
+    if denom == 0:
+        return 0.0 if got == 0 else math.inf
+    return float(abs(Decimal(got) - ref) / denom)
+
+
+def _log_err(got, ref):
+    """对数值的绝对误差，即概率的相对误差"""
+    if ref is None:
+        return None
+    if ref == Decimal('-Infinity') or not math.isfinite(got):
+        return 0.0 if Decimal(got) == ref else math.inf
+    return float(abs(Decimal(got) - ref))
+
+
+def point_error(method, dist, ref, x, got):
+    """pmf/pdf/cdf/sf 及其对数版本的误差"""
+    if ref is None:
+        return None
+    density = ref.pmf if hasattr(ref, 'pmf') else ref.pdf
+    if method in ('pmf', 'pdf'):
+        return _rel(got, density(x))
+    if method == 'cdf':
+        return _rel(got, ref.cdf(x))
+    if method == 'sf':
+        return _rel(got, ref.sf(x))
+    if method in ('logpmf', 'logpdf'):
+        return _log_err(got, ln(density(x)))
+    if method == 'logcdf':
+        return _log_err(got, ln(ref.cdf(x)))
+    if method == 'logsf':
+        return _log_err(got, ln(ref.sf(x)))
+    return None
+
+
+def quantile_error(dist, ref, q, got):
+    """
+    分位数的往返误差：连续分布为 F(Q(q)) 相对 q（上半段用 1 - F 相对 1 - q）的相对误差；
+    离散分布满足 F(k-1) < q <= F(k) 时为 0，否则为 1
+    """
+    if ref is None:
+        return None
+    q_dec = Decimal(q)
+    if hasattr(ref, 'pmf'):
+        ok = ref.cdf(got - 1) < q_dec <= ref.cdf(got)
+        return 0.0 if ok else 1.0
+    if q < 0.5:
+        return _rel(0.0, Decimal(0)) if q == 0 else float(abs(ref.cdf(got) / q_dec - 1))
+    return float(abs(ref.sf(got) / (1 - q_dec) - 1))
+
+
+def isf_error(dist, ref, q, got):
+    """
+    逆生存函数的往返误差：连续分布为 1 - F(ISF(q)) 相对 q（q >= 0.5 时用 F 相对 1 - q）的相对误差；
+    离散分布满足 SF(k) <= q < SF(k-1) 时为 0，否则为 1
+    """
+    if ref is None:
+        return None
+    q_dec = Decimal(q)
+    if hasattr(ref, 'pmf'):
+        ok = ref.sf(got) <= q_dec < ref.sf(got - 1)
+        return 0.0 if ok else 1.0
+    if q < 0.5:
+        return _rel(0.0, Decimal(0)) if q == 0 else float(abs(ref.sf(got) / q_dec - 1))
+    return float(abs(ref.cdf(got) / (1 - q_dec) - 1))
+
+
+def summary_error(method, ref, got):
+    """期望、方差等无参方法的误差，参考值由精确原点矩得到"""
+    if ref is None:
+        return None
+    mu = ref.raw(1)
+    var = central(ref, 2)
+    sd = var.sqrt()
+    values = {
+        'expectation': (mu, None),
+        'variance': (var, None),
+        'std_dev': (sd, None),
+        'coef_variation': (sd / mu if mu != 0 else None, None),
+        'skewness': (central(ref, 3) / sd ** 3, 1),
+        'kurtosis': (central(ref, 4) / var ** 2, 1),
+    }
+    if method not in values or values[method][0] is None:
+        return None
+    value, scale = values[method]
+    return _rel(got, value, scale)
+
+
+def _entry(results, cls, case, method, regime, arg, seconds, error):
+    results.append({
+        'class': cls,
+        'case': case,
+        'method': method,
+        'regime': regime,
+        'arg': arg,
+        'seconds': seconds,
+        'error': error,
+    })
+
+
+def bench_case(name, params, center, tail, budget, results):
+    """
+    对一组参数下的全部公开方法计时并检查误差
+    """
+    cls = getattr(distribute, name)
+    dist = cls(**params)
+    ref = reference(dist)
+    case = ','.join(f'{k}={v}' for k, v in params.items())
+    discrete = hasattr(dist, 'pmf')
+    points = {'center': center, 'tail': tail}
+    grid = (np.round(np.linspace(center, tail, ARRAY_SIZE)) if discrete
+            else np.linspace(center, tail, ARRAY_SIZE))
+
+    for method, func in inspect.getmembers(dist, inspect.ismethod):
+        if method.startswith('_'):
+            continue
+        kind = METHOD_KIND.get(method)
+        if kind is None:
+            required = [p for p in inspect.signature(func).parameters.values()
+                        if p.default is inspect.Parameter.empty]
+            kind = 'none' if not required else 'skip'
+
+        if kind == 'point':
+            for regime, x in points.items():
+                got = func(x)
+                _entry(results, name, case, method, regime, x, _timeit(lambda: func(x), budget),
+                       point_error(method, dist, ref, x, got))
+            _entry(results, name, case, method, 'array', ARRAY_SIZE,
+                   _timeit(lambda: func(grid), budget), None)
+        elif kind == 'prob':
+            prob_error = isf_error if method == 'isf' else quantile_error
+            for regime, q in PROBS.items():
+                got = func(q)
+                _entry(results, name, case, method, regime, q, _timeit(lambda: func(q), budget),
+                       prob_error(dist, ref, q, got))
+            # 冷启动：新建对象后第一次调用（包括缓存表的构造）
+            _entry(results, name, case, method, 'cold', 0.5,
+                   _timeit(lambda: getattr(cls(**params), method)(0.5), budget), None)
+            qs = np.linspace(1e-6, 1 - 1e-6, ARRAY_SIZE)
+            _entry(results, name, case, method, 'array', ARRAY_SIZE,
+                   _timeit(lambda: func(qs), budget), None)
+        elif kind == 'order':
+            for regime, m in ORDERS.items():
+                got = func(m)
+                if ref is None:
+                    error = None
+                elif method == 'raw_moment':
+                    error = _rel(got, ref.raw(m))
+                else:
+                    error = _rel(got, central(ref, m), central(ref, 2).sqrt() ** m)
+                _entry(results, name, case, method, regime, m, _timeit(lambda: func(m), budget), error)
+        elif kind == 'size':
+            rng = np.random.default_rng(0)
+            _entry(results, name, case, method, 'scalar', None,
+                   _timeit(lambda: func(rng=rng), budget), None)
+            _entry(results, name, case, method, 'array', ARRAY_SIZE,
+                   _timeit(lambda: func(ARRAY_SIZE, rng=rng), budget), None)
+        elif kind == 'none':
+            got = func()
+            _entry(results, name, case, method, 'scalar', None,
+                   _timeit(func, budget), summary_error(method, ref, got))
+        else:
+            _entry(results, name, case, method, 'skip', None, None, None)
+
+
+def compare(old, new, slower=1.5, worse=4.0, floor=1e-13):
+    """
+    比较两次结果
+
+    参数
+    ------
+    old, new : dict
+        两次运行的 JSON 内容
+    slower : float
+        耗时超过旧值的倍数视为性能回退
+    worse : float
+        误差超过旧值的倍数（且大于 floor）视为精度回退
+    floor : float
+        低于该值的误差不参与比较
+
+    返回
+    ------
+    list : 回退条目的说明文字
+    """
+    key = lambda r: (r['class'], r['case'], r['method'], r['regime'])
+    before = {key(r): r for r in old['results']}
+    messages = []
+    for r in new['results']:
+        b = before.get(key(r))
+        if b is None:
+            continue
+        tag = '{} {} {} [{}]'.format(*key(r))
+        if r['seconds'] and b['seconds'] and r['seconds'] > slower * b['seconds']:
+            messages.append(f'慢了 {r["seconds"] / b["seconds"]:.2f} 倍  {tag}')
+        if r['error'] is not None and b['error'] is not None:
+            if r['error'] > floor and r['error'] > worse * max(b['error'], floor):
+                messages.append(f'误差 {b["error"]:.2e} -> {r["error"]:.2e}  {tag}')
+    return messages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='distribute 基准测试')
+    parser.add_argument('-o', '--output', default='bench_result.json', help='结果 JSON 路径')
+    parser.add_argument('--compare', metavar='OLD', help='与旧结果比较，回退时返回码为 1')
+    parser.add_argument('--label', default='', help='写入结果的版本标签')
+    parser.add_argument('--budget', type=float, default=0.02, help='每个条目的计时预算（秒）')
+    parser.add_argument('--quick', action='store_true', help='只跑每个类的第一组参数')
+    parser.add_argument('--only', nargs='+', metavar='CLASS', help='只测这些类')
+    args = parser.parse_args(argv)
+
+    results = []
+    seen = set()
+    for name, params, center, tail in CASES:
+        if args.only and name not in args.only:
+            continue
+        if args.quick and name in seen:
+            continue
+        seen.add(name)
+        start = time.perf_counter()
+        bench_case(name, params, center, tail, args.budget, results)
+        print(f'{name:<10} {params}  {time.perf_counter() - start:.1f}s')
+
+    data = {
+        'meta': {
+            'label': args.label,
+            'version': distribute.__version__,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+
+    bad = [r for r in results if r['error'] is not None and r['error'] > 1e-9]
+    for r in bad:
+        print(f'误差 {r["error"]:.2e}  {r["class"]} {r["case"]} {r["method"]} [{r["regime"]}]')
+    print(f'{len(results)} 条结果写入 {args.output}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            old = json.load(f)
+        messages = compare(old, data)
+        for line in messages:
+            print(line)
+        return 1 if messages else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/6 15:10
+    @file  : reference.py
+
+    基准测试用的高精度参考值
+
+    只用标准库 decimal / fractions 计算，与被测代码没有共享实现：
+    离散分布在支撑集上用递推得到全部 pmf，cdf、sf 分别用前缀和、后缀和（尾部不经过 1 - x）；
+    正态分布用全正项的 erf 级数；Gamma 只支持整数 k（Erlang 分布的有限和）；
+    Beta 只支持整数 α, β（二项分布求和，全程有理数）。
+    不支持的参数返回 None，对应条目只计时不检查精度
+"""
+
+import math
+from decimal import Decimal, getcontext
+from fractions import Fraction
+
+getcontext().prec = 100
+
+_PI = Decimal('3.14159265358979323846264338327950288419716939937510'
+              '58209749445923078164062862089986280348253421170679')
+
+
+def _dec(x):
+    """float / int / Fraction 精确转换为 Decimal（在当前精度下舍入）"""
+    if isinstance(x, Fraction):
+        return Decimal(x.numerator) / Decimal(x.denominator)
+    return Decimal(x)
+
+
+def ln(x):
+    """Decimal 的自然对数，x = 0 时为 -inf"""
+    return Decimal('-Infinity') if x == 0 else x.ln()
+
+
+class _Discrete:
+    """
+    有限（或截断后有限）支撑集上的离散参考分布
+
+    子类在 __init__ 里给出 low 和 pmf 列表 self.p
+    """
+
+    def _finish(self, low, probs):
+        self.low = low
+        self.p = probs
+        prefix, total = [], Decimal(0)
+        for v in probs:
+            total += v
+            prefix.append(total)
+        suffix, total = [Decimal(0)] * len(probs), Decimal(0)
+        for i in range(len(probs) - 1, -1, -1):
+            total += probs[i]
+            suffix[i] = total
+        self.prefix, self.suffix = prefix, suffix
+        self._raw = {}
+
+    def pmf(self, k):
+        i = k - self.low
+        return self.p[i] if 0 <= i < len(self.p) else Decimal(0)
+
+    def cdf(self, k):
+        i = math.floor(k) - self.low
+        if i < 0:
+            return Decimal(0)
+        return self.prefix[min(i, len(self.p) - 1)]
+
+    def sf(self, k):
+        i = math.floor(k) - self.low + 1
+        if i >= len(self.p):
+            return Decimal(0)
+        return self.suffix[max(i, 0)]
+
+    def raw(self, m):
+        if m not in self._raw:
+            self._raw[m] = sum((self.low + i) ** m * v for i, v in enumerate(self.p))
+        return self._raw[m]
+
+
+class _Binom(_Discrete):
+    def __init__(self, d):
+        p, q = _dec(d.p), 1 - _dec(d.p)
+        probs = [q ** d.n]
+        for k in range(d.n):
+            probs.append(probs[-1] * (d.n - k) / (k + 1) * p / q)
+        self._finish(0, probs)
+
+
+class _Poisson(_Discrete):
+    def __init__(self, d):
+        lam = _dec(d.lam)
+        top = int(d.lam + 40 * math.sqrt(d.lam) + 100)
+        probs = [(-lam).exp()]
+        for k in range(top):
+            probs.append(probs[-1] * lam / (k + 1))
+        self._finish(0, probs)
+
+
+class _HyperGeom(_Discrete):
+    def __init__(self, d):
+        N, M, n = d.N, d.M, d.n
+        low, high = max(0, n + M - N), min(n, M)
+        first = Fraction(math.comb(M, low) * math.comb(N - M, n - low), math.comb(N, n))
+        probs = [_dec(first)]
+        for k in range(low, high):
+            probs.append(probs[-1] * (M - k) * (n - k) / ((k + 1) * (N - M - n + k + 1)))
+        self._finish(low, probs)
+
+
+class _Geom(_Discrete):
+    def __init__(self, d):
+        p, q = _dec(d.p), 1 - _dec(d.p)
+        # 截断到尾部质量（含 k^10 权重）远小于双精度
+        top = int(math.log(1e-130) / math.log1p(-d.p)) + 100
+        probs = [p]
+        for _ in range(top):
+            probs.append(probs[-1] * q)
+        self._finish(1, probs)
+
+
+class _Continuous:
+    """
+    连续参考分布：子类实现 pdf、cdf、sf 与精确原点矩 raw
+    """
+
+    def raw(self, m):
+        raise NotImplementedError
+
+
+class _Norm(_Continuous):
+    def __init__(self, d):
+        self.mu, self.sigma = _dec(d.mu), _dec(d.sigma)
+        self.fmu, self.fsigma = Fraction(d.mu), Fraction(d.sigma)
+
+    @staticmethod
+    def _erfc(t):
+        """erfc(t)，t >= 0：erf(t) = 2/√π e^{-t²} Σ 2^n t^{2n+1} / (2n+1)!!，各项全为正"""
+        term = t
+        total = t
+        n = 0
+        eps = Decimal(10) ** (-getcontext().prec - 5)
+        while term > eps * total:
+            n += 1
+            term = term * 2 * t * t / (2 * n + 1)
+            total += term
+        return 1 - 2 / _PI.sqrt() * (-t * t).exp() * total
+
+    def pdf(self, x):
+        z = (_dec(x) - self.mu) / self.sigma
+        return (-z * z / 2).exp() / (self.sigma * (2 * _PI).sqrt())
+
+    def _tails(self, x):
+        """(cdf, sf)，较小的一侧由 erfc 直接算出"""
+        z = (_dec(x) - self.mu) / self.sigma
+        tail = self._erfc(abs(z) / Decimal(2).sqrt()) / 2
+        return (tail, 1 - tail) if z < 0 else (1 - tail, tail)
+
+    def cdf(self, x):
+        return self._tails(x)[0]
+
+    def sf(self, x):
+        return self._tails(x)[1]
+
+    def raw(self, m):
+        total = Fraction(0)
+        for j in range(0, m + 1, 2):
+            total += math.comb(m, j) * self.fmu ** (m - j) * self.fsigma ** j * math.prod(range(1, j, 2))
+        return _dec(total)
+
+
+class _Uniform(_Continuous):
+    def __init__(self, d):
+        self.a, self.b = Fraction(d.a), Fraction(d.b)
+
+    def pdf(self, x):
+        return _dec(1 / (self.b - self.a)) if self.a <= x <= self.b else Decimal(0)
+
+    def cdf(self, x):
+        x = min(max(Fraction(x), self.a), self.b)
+        return _dec((x - self.a) / (self.b - self.a))
+
+    def sf(self, x):
+        return 1 - self.cdf(x)
+
+    def raw(self, m):
+        return _dec((self.b ** (m + 1) - self.a ** (m + 1)) / ((m + 1) * (self.b - self.a)))
+
+
+class _Exp(_Continuous):
+    def __init__(self, d):
+        self.lam = _dec(d.lam)
+        self.flam = Fraction(d.lam)
+
+    def pdf(self, x):
+        return self.lam * (-self.lam * _dec(x)).exp() if x >= 0 else Decimal(0)
+
+    def cdf(self, x):
+        return 1 - self.sf(x)
+
+    def sf(self, x):
+        return (-self.lam * _dec(x)).exp() if x >= 0 else Decimal(1)
+
+    def raw(self, m):
+        return _dec(math.factorial(m) / self.flam ** m)
+
+
+class _Gamma(_Continuous):
+    """只支持整数形状参数 k（Erlang 分布）"""
+
+    def __init__(self, d):
+        self.k = int(d.k)
+        self.lam = _dec(d.lam)
+        self.flam = Fraction(d.lam)
+
+    def pdf(self, x):
+        if x <= 0:
+            return Decimal(0)
+        x = _dec(x)
+        return self.lam ** self.k * x ** (self.k - 1) * (-self.lam * x).exp() / math.factorial(self.k - 1)
+
+    def sf(self, x):
+        if x <= 0:
+            return Decimal(1)
+        y = self.lam * _dec(x)
+        term, total = Decimal(1), Decimal(1)
+        for j in range(1, self.k):
+            term = term * y / j
+            total += term
+        return (-y).exp() * total
+
+    def cdf(self, x):
+        return 1 - self.sf(x)
+
+    def raw(self, m):
+        return _dec(Fraction(math.prod(range(self.k, self.k + m))) / self.flam ** m)
+
+
+class _Beta(_Continuous):
+    """只支持整数 α, β：I_x(α, β) = Σ_{j=α}^{α+β-1} C(α+β-1, j) x^j (1-x)^{α+β-1-j}"""
+
+    def __init__(self, d):
+        self.a, self.b = int(d.alpha), int(d.beta)
+
+    def pdf(self, x):
+        if not 0 < x < 1:
+            return Decimal(0)
+        x = Fraction(x)
+        inv_b = Fraction(math.factorial(self.a + self.b - 1), math.factorial(self.a - 1) * math.factorial(self.b - 1))
+        return _dec(inv_b * x ** (self.a - 1) * (1 - x) ** (self.b - 1))
+
+    def _tail(self, x, lower):
+        x = min(max(Fraction(x), Fraction(0)), Fraction(1))
+        n = self.a + self.b - 1
+        js = range(self.a, n + 1) if lower else range(0, self.a)
+        return _dec(sum(math.comb(n, j) * x ** j * (1 - x) ** (n - j) for j in js))
+
+    def cdf(self, x):
+        return self._tail(x, True)
+
+    def sf(self, x):
+        return self._tail(x, False)
+
+    def raw(self, m):
+        return _dec(math.prod(Fraction(self.a + i, self.a + self.b + i) for i in range(m)))
+
+
+_REFERENCES = {
+    'Binom': _Binom,
+    'Poisson': _Poisson,
+    'HyperGeom': _HyperGeom,
+    'Geom': _Geom,
+    'Norm': _Norm,
+    'Uniform': _Uniform,
+    'Exp': _Exp,
+    'Gamma': _Gamma,
+    'Beta': _Beta,
+}
+
+
+def reference(dist):
+    """
+    返回 dist 对应的高精度参考分布，不支持的参数返回 None
+
+    参数
+    ------
+    dist : distribute 中任一分布类的实例
+    """
+    name = type(dist).__name__
+    if name == 'Gamma' and dist.k != int(dist.k):
+        return None
+    if name == 'Beta' and (dist.alpha != int(dist.alpha) or dist.beta != int(dist.beta)):
+        return None
+    return _REFERENCES[name](dist)
+
+
+def central(ref, m):
+    """
+    m 阶中心矩，对高精度原点矩做二项展开（100 位有效数字，抵消误差可以忽略）
+    """
+    mu = ref.raw(1)
+    total, power = Decimal(0), Decimal(1)
+    for i in range(m, -1, -1):
+        total += math.comb(m, i) * ref.raw(i) * power
+        power *= -mu
+    return total
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 09:33
+    @file  : HyperGeom.py
+"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from ._moments import check_order, falling, raw_from_factorial, shift, stirling2, to_float
+from ._lazy import lazy
+from ._sampling import ALIAS_MAX, alias_table, alias_draw
+from .logfact import hypergeom_pmf, log_hypergeom_pmf
+from ._vector import is_scalar, discrete_cdf, discrete_sf, cumulative_table, table_quantile, survival_table, table_isf
+
+class HyperGeom:
+    """
+    超几何分布类：用于模拟从有限总体中不放回抽样的概率问题
+
+    属性
+    ------
+    N : int
+        总体总数
+    M : int
+        总体中感兴趣的元素数量（“成功”元素）
+    n : int
+        抽样数量（样本容量）
+
+    方法
+    ------
+    pmf(k)               计算概率质量函数 P(X = k)
+    cdf(k)               计算累积分布函数 P(X <= k)
+    sf(k)                生存函数 P(X > k)，从支撑集上端往下累加
+    logpmf(k)            对数概率质量函数 log P(X = k)
+    logcdf(k)            对数累积分布函数 log P(X <= k)
+    logsf(k)             对数生存函数 log P(X > k)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m)        m 阶原点矩 E[X^m]
+    central_moment(m)    m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = min{k: CDF(k) >= q}
+    isf(q)               逆生存函数 ISF(q) = min{k: SF(k) <= q}
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X] = E[(X-μ)^3]/Std^3
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    __str__()            分布概要信息
+    """
+
+    __slots__ = ('N', 'M', 'n', '_E', '_Var', '_std', '_coef', '_skew', '_kurt', '_cum_table', '_sf_table', '_alias')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+    # 分位数查找用的累积分布表，第一次调用 quantile 时构造
+    cum_table = lazy('_cumulative_table')
+    # 逆生存函数查找用的生存函数表，第一次调用 isf 时构造
+    sf_table = lazy('_survival_table')
+    # 小支撑集抽样用的 alias 表，第一次调用 rvs 时构造
+    alias = lazy('_alias_table')
+
+    def __init__(self, N, M, n):
+        """
+        初始化超几何分布参数
+
+        参数
+        ------
+        N : int
+            总体总数（必须 >= 1）
+        M : int
+            总体中成功元素数量（0 <= M <= N）
+        n : int
+            抽样数量（0 <= n <= N）
+        """
+        if not (0 <= M <= N):
+            raise ValueError("M 必须满足 0 <= M <= N")
+        if not (0 <= n <= N):
+            raise ValueError("n 必须满足 0 <= n <= N")
+        self.N = N
+        self.M = M
+        self.n = n
+
+
+    def pmf(self, k):
+        """
+        概率质量函数 P(X = k)，k 可以是 int 或 array_like
+        N 不超过 COMB_MAX_N 时用 math.comb 精确计算，更大时取鞍点展开的指数，见 logfact.hypergeom_pmf
+        """
+        if not is_scalar(k):
+            return np.exp(self.logpmf(k))
+        return hypergeom_pmf(k, self.N, self.M, self.n)
+
+    def cdf(self, k):
+        """
+        累积分布函数 P(X <= k)，k 可以是 int 或 array_like
+        对支撑集下端到 max(k) 一次求出 pmf 并累加成表，见 discrete_cdf
+        """
+        low = max(0, self.n + self.M - self.N)
+        return discrete_cdf(self.logpmf, k, low, min(self.n, self.M))
+
+    def sf(self, k):
+        """
+        生存函数 P(X > k)，从支撑集上端往下累加 pmf，上尾概率不经过 1 - CDF，见 discrete_sf
+        """
+        low = max(0, self.n + self.M - self.N)
+        return discrete_sf(self.logpmf, k, low, min(self.n, self.M))
+
+    def logpmf(self, k):
+        """
+        对数概率质量函数 log P(X = k)，化为三个二项概率之比做鞍点展开（logfact.log_hypergeom_pmf）
+        """
+        return log_hypergeom_pmf(k, self.N, self.M, self.n)
+
+    def logcdf(self, k):
+        """
+        对数累积分布函数 log P(X <= k)，对支撑集内各项做 np.logaddexp.accumulate
+        """
+        low = max(0, self.n + self.M - self.N)
+        return discrete_cdf(self.logpmf, k, low, min(self.n, self.M), log=True)
+
+    def logsf(self, k):
+        """
+        对数生存函数 log P(X > k)，从支撑集上端往下做 np.logaddexp.accumulate
+        """
+        low = max(0, self.n + self.M - self.N)
+        return discrete_sf(self.logpmf, k, low, min(self.n, self.M), log=True)
+
+    def expectation(self):
+        """
+        返回期望 E[X] = n * M / N
+        """
+        return self.n * self.M / self.N
+
+    def variance(self):
+        """
+        返回方差 Var[X] = n*(M/N)*(1-M/N)*(N-n)/(N-1)
+        """
+        return (self.n * (self.M / self.N) * (1 - self.M / self.N)
+                * (self.N - self.n) / (self.N - 1))
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X]
+        """
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.std / mu if mu != 0 else float('inf')
+
+    def _factorial_moments(self, m):
+        """
+        精确的阶乘矩 E[(X)_j] = (n)_j (M)_j / (N)_j，j = 0..m（Fraction）
+        """
+        def factor(i):
+            num = (self.n - i) * (self.M - i)
+            return Fraction(num, self.N - i) if num else Fraction(0)
+        return falling(m, factor)
+
+    def raw_moment(self, m):
+        """
+        m 阶原点矩 E[X^m] = Σ S(m, j) (n)_j (M)_j / (N)_j，只求第 m 行
+        """
+        check_order(m)
+        return to_float(sum(s * f for s, f in zip(stirling2(m), self._factorial_moments(m))))
+
+    def central_moment(self, m):
+        """
+        m 阶中心矩 E[(X-μ)^m]，对精确的原点矩做二项展开
+        累积量有正有负，浮点递推会抵消，保留有理数运算，代价是 O(m^3) 左右
+        """
+        check_order(m)
+        mu = Fraction(self.n * self.M, self.N)
+        return to_float(shift(raw_from_factorial(self._factorial_moments(m)), -mu))
+
+    def _cumulative_table(self):
+        """
+        μ ± (12σ + 20) 范围内的累积分布表，见 cumulative_table
+        """
+        low = max(0, self.n + self.M - self.N)
+        high = min(self.n, self.M)
+        return cumulative_table(self.logpmf, self.cdf, self.E, self.std, low, high)
+
+    def _alias_table(self):
+        """
+        支撑集上的 alias 表，见 alias_table
+        """
+        return alias_table(self.logpmf, max(0, self.n + self.M - self.N), min(self.n, self.M))
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = min{k: CDF(k) >= q}，q 可以是 float 或 array_like
+        在缓存的累积分布表上二分查找
+        """
+        low = max(0, self.n + self.M - self.N)
+        high = min(self.n, self.M)
+        return table_quantile(self.cum_table, self.cdf, q, low, high)
+
+    def _survival_table(self):
+        """
+        μ ± (12σ + 20) 范围内的生存函数表，见 survival_table
+        """
+        low = max(0, self.n + self.M - self.N)
+        high = min(self.n, self.M)
+        return survival_table(self.logpmf, self.sf, self.E, self.std, low, high)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = min{k: P(X > k) <= q}，q 可以是 float 或 array_like
+        在缓存的生存函数表上二分查找
+        """
+        low = max(0, self.n + self.M - self.N)
+        high = min(self.n, self.M)
+        return table_isf(self.sf_table, self.sf, q, low, high)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样
+        支撑集不超过 64 个点时用缓存的 alias 表，否则调用 Generator.hypergeometric
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        int 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        low = max(0, self.n + self.M - self.N)
+        high = min(self.n, self.M)
+        if high - low < ALIAS_MAX:
+            return alias_draw(self.alias, size, rng)
+        return rng.hypergeometric(self.M, self.N - self.M, self.n, size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = E[(X-μ)^3] / Std[X]^3
+        """
+        return self.central_moment(3) / (self.std ** 3)
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+        """
+        k4 = self.central_moment(4) / (self.std ** 4)
+        return (k4 - 3) if excess else k4
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$超几何分布：X~HG(N={self.N}, M={self.M}, n={self.n})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/5 16:30
+    @file  : __init__.py
+
+    常用概率分布
+
+    from distribute import Binom, Norm
+    各分布类在第一次访问时才导入对应子模块（PEP 562），import distribute 本身不加载 numpy
+"""
+
+import importlib
+
+# 类名 -> 子模块名
+_CLASSES = {
+    'Binom': 'binom',
+    'Poisson': 'poisson',
+    'HyperGeom': 'Hypergeom',
+    'Geom': 'geom',
+    'Norm': 'norm',
+    'Uniform': 'uniform',
+    'Exp': 'exp',
+    'Gamma': 'gamma',
+    'Beta': 'beta',
+    'Weibull': 'weibull',
+    # 参数数组族，见 family.py
+    'BinomFamily': 'family',
+    'PoissonFamily': 'family',
+    'HyperGeomFamily': 'family',
+    'GeomFamily': 'family',
+    'NormFamily': 'family',
+    'UniformFamily': 'family',
+    'ExpFamily': 'family',
+    'GammaFamily': 'family',
+    'BetaFamily': 'family',
+}
+
+__all__ = list(_CLASSES)
+__version__ = '0.1'
+
+
+def __getattr__(name):
+    if name in _CLASSES:
+        module = importlib.import_module('.' + _CLASSES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
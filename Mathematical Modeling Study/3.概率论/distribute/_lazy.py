@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/4 09:12
+    @file  : _lazy.py
+
+    惰性统计量描述符
+
+    functools.cached_property 依赖实例 __dict__，不能和 __slots__ 一起用，
+    这里把结果缓存到 __slots__ 中名为 '_' + 属性名 的槽位
+"""
+
+
+class lazy:
+    """
+    惰性属性：首次访问时调用同一对象上的无参方法计算，之后直接返回缓存值
+
+    用法
+    ------
+    __slots__ = ('lam', '_E')
+    E = lazy('expectation')
+    """
+
+    __slots__ = ('method', 'slot')
+
+    def __init__(self, method):
+        """
+        参数
+        ------
+        method : str
+            计算该属性的方法名，如 'expectation'
+        """
+        self.method = method
+        self.slot = None
+
+    def __set_name__(self, owner, name):
+        self.slot = '_' + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = getattr(obj, self.method)()
+            setattr(obj, self.slot, value)
+            return value
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/4 15:40
+    @file  : _moments.py
+
+    任意阶矩的解析计算工具
+
+    离散分布：先写出阶乘矩 E[(X)_j] = E[X(X-1)...(X-j+1)]，再用第二类 Stirling 数
+    E[X^m] = Σ_j S(m, j) E[(X)_j] 得到原点矩。
+    参数转成 Fraction 做精确有理数运算，中心矩的二项展开不会因 μ 很大而出现抵消误差；
+    代价是分子分母的位数随阶数线性增长，一次查询约 O(m^3)（Binom 的 m = 200 约 1 s），只用于累积量有正有负的 Binom、HyperGeom
+
+    累积量 κ_r 已知时，用递推
+    μ'_m = Σ_{k=0}^{m-1} C(m-1, k) κ_{m-k} μ'_k（原点矩），μ_m 同式取 κ_1 = 0（中心矩）
+    得到各阶矩，O(m²) 次浮点运算。Gamma、Poisson、Geom 等累积量全为正的分布各项同号，不存在抵消
+"""
+
+import math
+from fractions import Fraction
+
+_STIRLING = [(1,)]
+
+
+def stirling2(m):
+    """
+    第二类 Stirling 数 S(m, 0..m)，按行递推并缓存
+
+    参数
+    ------
+    m : int, m >= 0
+
+    返回
+    ------
+    tuple : (S(m, 0), ..., S(m, m))
+    """
+    while len(_STIRLING) <= m:
+        prev = _STIRLING[-1]
+        size = len(prev)
+        row = [0] * (size + 1)
+        for j in range(1, size + 1):
+            row[j] = prev[j - 1] + (j * prev[j] if j < size else 0)
+        _STIRLING.append(tuple(row))
+    return _STIRLING[m]
+
+
+def check_order(m):
+    """
+    检查阶数 m 为非负整数
+    """
+    if not isinstance(m, int) or m < 0:
+        raise ValueError("阶数 m 必须为非负整数")
+
+
+def falling(m, factor):
+    """
+    阶乘矩序列 E[(X)_j] = Π_{i<j} factor(i)，j = 0..m
+
+    某一项为 0 后（如 (n)_j 中 j > n）后面全部为 0，不再调用 factor，避免除零
+
+    参数
+    ------
+    m : int
+    factor : callable
+        factor(i) 返回第 i 个因子（Fraction）
+    """
+    out = [Fraction(1)]
+    for i in range(m):
+        if out[-1] == 0:
+            out.append(Fraction(0))
+        else:
+            out.append(out[-1] * factor(i))
+    return out
+
+
+def raw_from_factorial(fact):
+    """
+    由阶乘矩 E[(X)_j] (j = 0..m) 得到原点矩 E[X^i] (i = 0..m)
+
+    返回
+    ------
+    list : [E[X^0], ..., E[X^m]]
+    """
+    return [sum(s * f for s, f in zip(stirling2(i), fact)) for i in range(len(fact))]
+
+
+def shift(raw, c):
+    """
+    已知 Y 的原点矩 raw = [E[Y^0], ..., E[Y^m]]，返回 X = Y + c 的 m 阶原点矩
+
+    E[(Y + c)^m] = Σ_i C(m, i) c^{m-i} E[Y^i]；c = -μ 时即为中心矩
+    """
+    m = len(raw) - 1
+    return sum(math.comb(m, i) * c ** (m - i) * raw[i] for i in range(m + 1))
+
+
+def to_float(x):
+    """
+    精确的矩（Fraction）转成 float，超出浮点范围时返回 ±inf，不抛出 OverflowError
+    """
+    try:
+        return float(x)
+    except OverflowError:
+        return math.inf if x > 0 else -math.inf
+
+
+def raw_from_cumulants(m, kappa):
+    """
+    由累积量递推 m 阶原点矩
+
+    μ'_0 = 1, μ'_m = Σ_{k=0}^{m-1} C(m-1, k) κ_{m-k} μ'_k
+
+    参数
+    ------
+    m : int
+    kappa : callable
+        kappa(r) 返回 r 阶累积量 (r >= 1)
+    """
+    mu = [1.0]
+    kap = [None] + [kappa(r) for r in range(1, m + 1)]
+    for j in range(1, m + 1):
+        mu.append(sum(math.comb(j - 1, k) * kap[j - k] * mu[k] for k in range(j)))
+    return mu[m]
+
+
+def central_from_cumulants(m, kappa):
+    """
+    由累积量递推 m 阶中心矩
+
+    μ_0 = 1, μ_1 = 0, μ_m = Σ_{k=0}^{m-2} C(m-1, k) κ_{m-k} μ_k
+
+    参数
+    ------
+    m : int
+    kappa : callable
+        kappa(r) 返回 r 阶累积量 (r >= 2)
+    """
+    mu = [1.0, 0.0]
+    kap = [None, None] + [kappa(r) for r in range(2, m + 1)]
+    for j in range(2, m + 1):
+        # 跳过 μ_1 = 0 的项，累积量上溢为 inf 时不产生 inf * 0 = nan
+        mu.append(sum(math.comb(j - 1, k) * kap[j - k] * mu[k] for k in range(j - 1) if k != 1))
+    return mu[m]
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/5 10:20
+    @file  : _sampling.py
+
+    随机抽样的公共工具
+
+    各分布类的 rvs 统一接受 numpy.random.Generator（或种子），
+    大参数的情形直接调用 Generator 中的 C 实现：binomial 为 BTPE，poisson 为 PTRS，
+    standard_gamma 为 Marsaglia–Tsang；支撑集较小的离散分布用 Walker/Vose alias 表，
+    每个样本只需一次均匀整数和一次均匀实数
+"""
+
+import numpy as np
+
+# 支撑集不超过该大小时用 alias 表抽样
+ALIAS_MAX = 64
+
+
+def alias_table(logpmf, low, high):
+    """
+    构造 Vose alias 表
+
+    参数
+    ------
+    logpmf : callable
+        接受数组的对数概率质量函数
+    low, high : int
+        支撑集的上下界
+
+    返回
+    ------
+    tuple : (low, accept, alias)，第 i 格以概率 accept[i] 取 low + i，否则取 low + alias[i]
+    """
+    prob = np.exp(logpmf(np.arange(low, high + 1)))
+    size = len(prob)
+    scaled = prob * (size / prob.sum())
+    accept = np.ones(size)
+    alias = np.arange(size)
+    small = [i for i in range(size) if scaled[i] < 1]
+    large = [i for i in range(size) if scaled[i] >= 1]
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        accept[s] = scaled[s]
+        alias[s] = g
+        scaled[g] -= 1 - scaled[s]
+        (small if scaled[g] < 1 else large).append(g)
+    return low, accept, alias
+
+
+def alias_draw(table, size, rng):
+    """
+    从 alias 表批量抽样
+
+    参数
+    ------
+    table : tuple
+        alias_table 的返回值
+    size : int, tuple 或 None
+        样本形状，None 返回单个 int
+    rng : numpy.random.Generator
+    """
+    low, accept, alias = table
+    i = rng.integers(len(accept), size=size)
+    k = low + np.where(rng.random(size) < accept[i], i, alias[i])
+    return int(k) if size is None else k
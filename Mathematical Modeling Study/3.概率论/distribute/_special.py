@@ -0,0 +1,728 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/3 14:20
+    @file  : _special.py
+
+    正则化不完全伽马函数与不完全贝塔函数
+
+    P(a, x) = γ(a, x) / Γ(a),  Q(a, x) = 1 - P(a, x)
+    I_x(a, b) = B(x; a, b) / B(a, b)
+
+    参考 Numerical Recipes 6.2 / 6.4：靠近原点的一侧用级数展开，另一侧用 Lentz 算法求连分式；
+    x 接近 a 时级数和连分式都要 O(√a) 步，所以 a >= _TEMME_A 且 |η| <= 1 时改用 Temme 的一致渐近展开
+    （DLMF 8.12），每次调用的计算量与 a、x 的大小无关。
+    参数较大时前置因子 x^a e^{-x} / Γ(a) 与 x^a (1-x)^b / B(a, b) 由 logfact 的斯特林余项 stirlerr
+    与偏差项 bd0 组成，不再由 a log x - lgamma(a) 之类的大数相减得到，参数到 1e12 仍有双精度；
+    迭代达到 _MAX_ITER 仍未收敛时发出 RuntimeWarning。
+    *_pair 函数同时返回 (下尾, 上尾)，两者中直接算出的那一个不经过 1 - x，尾部精度不受抵消误差影响；
+    log_*_pair 返回对应的对数值，极端尾部也不会下溢为 -inf
+"""
+
+import math
+import sys
+import warnings
+from fractions import Fraction
+
+from .logfact import _stirlerr, _bd0
+
+_EPS = sys.float_info.epsilon
+# exp 不上溢的最大指数
+_LOG_MAX = math.log(sys.float_info.max)
+_TINY = 1e-300
+_MAX_ITER = 100000
+
+# 参数超过 _STIRLING_A 时前置因子改用 stirlerr/bd0 的形式（logfact 的 stirlerr 精确表也到 15 为止）
+_STIRLING_A = 15
+
+# a >= _TEMME_A 且 bd0(a, x) <= a/2（即 |η| <= 1）时用 Temme 展开，
+# 取 a^{-k} 的前 _TEMME_K 项，每个系数 c_k(η) 取 η 的前 _TEMME_N 阶 Taylor 多项式；
+# 系数大致按 (|η| / 2√π)^n 衰减（2√π 是 μ(η) 的收敛半径），求值时只取达到双精度所需的项
+_TEMME_A = 50
+_TEMME_K = 10
+_TEMME_N = 30
+_TEMME_RADIUS = 2 * math.sqrt(math.pi)
+_LOG_EPS = math.log(_EPS)
+_TEMME = []
+
+
+def log1mexp(x):
+    """log(1 - e^x)，x <= 0"""
+    if x >= 0:
+        return -math.inf
+    if x > -math.log(2):
+        return math.log(-math.expm1(x))
+    return math.log1p(-math.exp(x))
+
+
+def logsumexp(values):
+    """
+    log Σ exp(v)，先减去最大值防止上溢/下溢
+    """
+    values = list(values)
+    if not values:
+        return -math.inf
+    top = max(values)
+    if top == -math.inf:
+        return -math.inf
+    return top + math.log(math.fsum(math.exp(v - top) for v in values))
+
+
+def xlogy(x, y):
+    """x * log(y)，约定 x = 0 时结果为 0（即使 y = 0）"""
+    if x == 0:
+        return 0.0
+    return x * math.log(y) if y > 0 else -math.inf
+
+
+def xlog1py(x, y):
+    """x * log(1 + y)，约定 x = 0 时结果为 0（即使 y = -1）"""
+    if x == 0:
+        return 0.0
+    return x * math.log1p(y) if y > -1 else -math.inf
+
+
+def log_ndtr(z):
+    """
+    标准正态分布累积分布函数的对数 log Φ(z)
+
+    z >= -30 时直接由 erfc 计算；更小的 z 用渐近展开
+    log Φ(z) ≈ -z²/2 - log(-z) - log(2π)/2 + log(1 - 1/z² + 3/z⁴ - ...)，避免 erfc 下溢
+    """
+    if z > 0:
+        return math.log1p(-0.5 * math.erfc(z / math.sqrt(2)))
+    if z >= -30:
+        return math.log(0.5 * math.erfc(-z / math.sqrt(2)))
+    z2 = z * z
+    series = 1 - 1 / z2 + 3 / z2 ** 2 - 15 / z2 ** 3 + 105 / z2 ** 4 - 945 / z2 ** 5 + 10395 / z2 ** 6
+    return -0.5 * z2 - math.log(-z) - 0.5 * math.log(2 * math.pi) + math.log(series)
+
+
+def _not_converged(name):
+    """迭代达到 _MAX_ITER 仍未收敛时的警告，返回值是截断后的结果"""
+    warnings.warn(f"{name}在 {_MAX_ITER} 次迭代内未收敛，结果可能不准确", RuntimeWarning, stacklevel=4)
+
+
+def _log_gamma_prefactor(a, x, d):
+    """
+    log(x^a e^{-x} / Γ(a))，d = bd0(a, x)
+
+    a > _STIRLING_A 时写成 log(a / 2π)/2 - stirlerr(a) - d，没有 a log x 与 lgamma(a) 的大数相减；
+    较小的 a 两种写法误差相当，直接用 a log x - x - lgamma(a)，不需要 d
+    """
+    if a > _STIRLING_A:
+        return 0.5 * math.log(a / (2 * math.pi)) - _stirlerr(a) - d
+    return a * math.log(x) - x - math.lgamma(a)
+
+
+def _temme_coefficients():
+    """
+    Temme 展开的系数表 c_k(η) = Σ_n C[k][n] η^n，首次调用时用有理数精确生成
+
+    μ = x/a - 1 与 η 满足 η²/2 = μ - log(1 + μ)，逐项比较 η(1 + μ) = μ μ' 得到 μ(η) 的级数；
+    c_0 = 1/μ - 1/η，c_k = c_{k-1}'/η + (-1)^k g_k / μ，g_k 为 Γ(a) 斯特林级数 Γ*(a) ~ Σ g_k a^{-k} 的系数
+    """
+    if _TEMME:
+        return _TEMME
+    size = _TEMME_N + 2 * _TEMME_K + 2
+    mu = [Fraction(0), Fraction(1)] + [Fraction(0)] * size
+    for n in range(2, size + 1):
+        s = sum(mu[i] * (n - i + 1) * mu[n - i + 1] for i in range(2, n))
+        mu[n] = (mu[n - 1] - s) / (n + 1)
+    # psi = η/μ，由 μ/η = Σ mu[n+1] η^n 求倒数
+    psi = [Fraction(1)] + [Fraction(0)] * (size - 1)
+    for n in range(1, size):
+        psi[n] = -sum(mu[i + 1] * psi[n - i] for i in range(1, n + 1))
+    # 伯努利数给出 log Γ*(a) = Σ B_{2j} / (2j(2j-1) a^{2j-1})，再取指数得到 g_k
+    bern = [Fraction(1)]
+    for m in range(1, _TEMME_K + 2):
+        bern.append(-sum(math.comb(m + 1, j) * bern[j] for j in range(m)) / (m + 1))
+    log_g = [Fraction(0)] * (_TEMME_K + 1)
+    for j in range(1, _TEMME_K // 2 + 2):
+        if 2 * j - 1 <= _TEMME_K:
+            log_g[2 * j - 1] = bern[2 * j] / (2 * j * (2 * j - 1))
+    g = [Fraction(1)] + [Fraction(0)] * _TEMME_K
+    for n in range(1, _TEMME_K + 1):
+        g[n] = sum(i * log_g[i] * g[n - i] for i in range(1, n + 1)) / n
+    row = [psi[n + 1] for n in range(size - 1)]
+    rows = [row]
+    for k in range(1, _TEMME_K):
+        # c_{k-1}' 的常数项与 (-1)^k g_k / μ 的 1/η 项相消
+        sign = g[k] if k % 2 == 0 else -g[k]
+        row = [(n + 2) * row[n + 2] + sign * psi[n + 1] for n in range(len(row) - 2)]
+        rows.append(row)
+    _TEMME.extend(tuple(float(v) for v in reversed(r[:_TEMME_N])) for r in rows)
+    return _TEMME
+
+
+def _erfcx_large(t):
+    """e^{t²} erfc(t) 的渐近级数，t >= 26 时取到双精度"""
+    t2 = 2 * t * t
+    total = term = 1.0
+    k = 1
+    while abs(term) > _EPS * total:
+        term *= -(2 * k - 1) / t2
+        total += term
+        k += 1
+    return total / (t * math.sqrt(math.pi))
+
+
+def _temme_terms(eta):
+    """|η| 处 c_k(η) 的 Taylor 多项式取到双精度需要的项数"""
+    if eta == 0:
+        return 1
+    return min(_TEMME_N, int(_LOG_EPS / math.log(eta / _TEMME_RADIUS)) + 2)
+
+
+def _log_gammainc_temme(a, x, d):
+    """
+    Temme 一致渐近展开（DLMF 8.12.3-8.12.4）求 (log P(a, x), log Q(a, x))，d = bd0(a, x) = aη²/2
+
+    Q = erfc(η√(a/2))/2 + R，P = erfc(-η√(a/2))/2 - R，R = e^{-d} / √(2πa) Σ_k c_k(η) a^{-k}；
+    η 与 x - a 同号，较小的一侧直接算出，t = |η|√(a/2) >= 26 时把 e^{-d} 提到对数外面，不下溢
+    """
+    eta = math.copysign(math.sqrt(2 * d / a), x - a)
+    terms = _temme_terms(abs(eta))
+    total = 0.0
+    scale = 1.0
+    for coef in _temme_coefficients():
+        total += _polyval(coef[-terms:], eta) * scale
+        scale /= a
+        if scale < _EPS:
+            break
+    r = total / math.sqrt(2 * math.pi * a)
+    if eta < 0:
+        r = -r
+    t = math.sqrt(d)
+    if t < 26:
+        log_small = math.log(0.5 * math.erfc(t) + math.exp(-d) * r)
+    else:
+        log_small = -d + math.log(0.5 * _erfcx_large(t) + r)
+    if eta < 0:
+        return log_small, log1mexp(log_small)
+    return log1mexp(log_small), log_small
+
+
+def _gamma_series(a, x):
+    """P(a, x) 的级数部分（不含前置因子），x < a + 1 时收敛快"""
+    ap = a
+    term = 1.0 / a
+    total = term
+    for _ in range(_MAX_ITER):
+        ap += 1
+        term *= x / ap
+        total += term
+        if abs(term) < abs(total) * _EPS:
+            break
+    else:
+        _not_converged("不完全伽马函数的级数")
+    return total
+
+
+def _gamma_cf(a, x):
+    """Q(a, x) 的连分式部分（不含前置因子），x >= a + 1 时收敛快"""
+    b = x + 1 - a
+    c = 1 / _TINY
+    d = 1 / b
+    h = d
+    for i in range(1, _MAX_ITER):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        if abs(d) < _TINY:
+            d = _TINY
+        c = b + an / c
+        if abs(c) < _TINY:
+            c = _TINY
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _EPS:
+            break
+    else:
+        _not_converged("不完全伽马函数的连分式")
+    return h
+
+
+def gammainc_pair(a, x):
+    """
+    正则化不完全伽马函数 (P(a, x), Q(a, x))
+
+    参数
+    ------
+    a : float, a > 0
+    x : float, x >= 0
+
+    返回
+    ------
+    tuple : (P, Q)，a 或 x 为 nan 时都是 nan
+    """
+    if math.isnan(a) or math.isnan(x):
+        return math.nan, math.nan
+    if x <= 0:
+        return 0.0, 1.0
+    if math.isinf(x):
+        return 1.0, 0.0
+    a, x = float(a), float(x)
+    d = _bd0(a, x) if a > _STIRLING_A else 0.0
+    if a >= _TEMME_A and d <= 0.5 * a:
+        log_p, log_q = _log_gammainc_temme(a, x, d)
+        return math.exp(log_p), math.exp(log_q)
+    front = math.exp(_log_gamma_prefactor(a, x, d))
+    if x < a + 1:
+        p = front * _gamma_series(a, x)
+        return p, 1 - p
+    q = front * _gamma_cf(a, x)
+    return 1 - q, q
+
+
+def log_gammainc_pair(a, x):
+    """
+    (log P(a, x), log Q(a, x))，直接算出的一侧不经过 exp，极端尾部不下溢
+    """
+    if math.isnan(a) or math.isnan(x):
+        return math.nan, math.nan
+    if x <= 0:
+        return -math.inf, 0.0
+    if math.isinf(x):
+        return 0.0, -math.inf
+    a, x = float(a), float(x)
+    d = _bd0(a, x) if a > _STIRLING_A else 0.0
+    if a >= _TEMME_A and d <= 0.5 * a:
+        return _log_gammainc_temme(a, x, d)
+    log_front = _log_gamma_prefactor(a, x, d)
+    if x < a + 1:
+        log_p = log_front + math.log(_gamma_series(a, x))
+        return log_p, log1mexp(log_p)
+    log_q = log_front + math.log(_gamma_cf(a, x))
+    return log1mexp(log_q), log_q
+
+
+def gammainc(a, x):
+    """
+    正则化下不完全伽马函数 P(a, x) = γ(a, x) / Γ(a)
+    """
+    return gammainc_pair(a, x)[0]
+
+
+def gammaincc(a, x):
+    """
+    正则化上不完全伽马函数 Q(a, x) = Γ(a, x) / Γ(a)
+    """
+    return gammainc_pair(a, x)[1]
+
+
+def _beta_cf(a, b, x):
+    """I_x(a, b) 的连分式部分（修正 Lentz 算法）"""
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+    c = 1.0
+    d = 1 - qab * x / qap
+    if abs(d) < _TINY:
+        d = _TINY
+    d = 1 / d
+    h = d
+    for m in range(1, _MAX_ITER):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        if abs(d) < _TINY:
+            d = _TINY
+        c = 1 + aa / c
+        if abs(c) < _TINY:
+            c = _TINY
+        d = 1 / d
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        if abs(d) < _TINY:
+            d = _TINY
+        c = 1 + aa / c
+        if abs(c) < _TINY:
+            c = _TINY
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _EPS:
+            break
+    else:
+        _not_converged("不完全贝塔函数的连分式")
+    return h
+
+
+def _log_beta_prefactor(a, b, x):
+    """
+    log(x^a (1-x)^b / B(a, b))，记 n = a + b，n > _STIRLING_A 时写成
+    log(ab / 2πn)/2 + stirlerr(n) - stirlerr(a) - stirlerr(b) - bd0(a, nx) - bd0(b, n(1-x))
+
+    即 Loader 二项概率的鞍点形式乘上 ab/n，a、b 很大时没有 lgamma 之间的抵消；
+    n 较小时两种写法误差相当，直接用 lgamma
+    """
+    n = a + b
+    if n <= _STIRLING_A:
+        return math.lgamma(n) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    return (0.5 * (math.log(a) + math.log(b) - math.log(2 * math.pi * n))
+            + _stirlerr(n) - _stirlerr(a) - _stirlerr(b) - _bd0(a, n * x) - _bd0(b, n * (1 - x)))
+
+
+def betainc_pair(a, b, x):
+    """
+    正则化不完全贝塔函数 (I_x(a, b), 1 - I_x(a, b))
+
+    参数
+    ------
+    a, b : float, > 0
+    x : float, ∈ [0, 1]
+
+    返回
+    ------
+    tuple : (I, 1 - I)，参数或 x 为 nan 时都是 nan
+    """
+    if math.isnan(a) or math.isnan(b) or math.isnan(x):
+        return math.nan, math.nan
+    if x <= 0:
+        return 0.0, 1.0
+    if x >= 1:
+        return 1.0, 0.0
+    a, b, x = float(a), float(b), float(x)
+    front = math.exp(_log_beta_prefactor(a, b, x))
+    if x < (a + 1) / (a + b + 2):
+        lower = front * _beta_cf(a, b, x) / a
+        return lower, 1 - lower
+    upper = front * _beta_cf(b, a, 1 - x) / b
+    return 1 - upper, upper
+
+
+def log_betainc_pair(a, b, x):
+    """
+    (log I_x(a, b), log(1 - I_x(a, b)))，直接算出的一侧不经过 exp，极端尾部不下溢
+    """
+    if math.isnan(a) or math.isnan(b) or math.isnan(x):
+        return math.nan, math.nan
+    if x <= 0:
+        return -math.inf, 0.0
+    if x >= 1:
+        return 0.0, -math.inf
+    a, b, x = float(a), float(b), float(x)
+    log_front = _log_beta_prefactor(a, b, x)
+    if x < (a + 1) / (a + b + 2):
+        log_lower = log_front + math.log(_beta_cf(a, b, x) / a)
+        return log_lower, log1mexp(log_lower)
+    log_upper = log_front + math.log(_beta_cf(b, a, 1 - x) / b)
+    return log1mexp(log_upper), log_upper
+
+
+def betainc(a, b, x):
+    """
+    正则化不完全贝塔函数 I_x(a, b)
+    """
+    return betainc_pair(a, b, x)[0]
+
+
+def betaincc(a, b, x):
+    """
+    正则化不完全贝塔函数的补 1 - I_x(a, b)
+    """
+    return betainc_pair(a, b, x)[1]
+
+
+# Acklam 正态分位数有理逼近的系数，相对误差约 1.15e-9
+_ACKLAM_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+             1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_ACKLAM_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+             6.680131188771972e+01, -1.328068155288572e+01)
+_ACKLAM_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+             -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_ACKLAM_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+             3.754408661907416e+00)
+
+
+def _polyval(coef, x):
+    """Horner 法求多项式值，coef 从高次到低次"""
+    total = 0.0
+    for c in coef:
+        total = total * x + c
+    return total
+
+
+def ndtri(p):
+    """
+    标准正态分布分位数 Φ^{-1}(p)
+
+    Acklam 有理逼近给出初值，再做一步 Halley 迭代达到机器精度；
+    p > 0.5 时利用对称性 Φ^{-1}(p) = -Φ^{-1}(1-p)，1 - p 在该区间内没有舍入误差
+
+    参数
+    ------
+    p : float, ∈ [0, 1]
+
+    返回
+    ------
+    float : p = 0 / 1 时为 -inf / inf
+    """
+    if p <= 0:
+        return -math.inf
+    if p >= 1:
+        return math.inf
+    if p > 0.5:
+        return -ndtri(1 - p)
+    if p < 0.02425:
+        t = math.sqrt(-2 * math.log(p))
+        x = _polyval(_ACKLAM_C, t) / (_polyval(_ACKLAM_D, t) * t + 1)
+    else:
+        t = p - 0.5
+        r = t * t
+        x = _polyval(_ACKLAM_A, r) * t / (_polyval(_ACKLAM_B, r) * r + 1)
+    # Halley 修正：e = Φ(x) - p, u = e / φ(x)
+    if x * x < 1400:
+        e = 0.5 * math.erfc(-x / math.sqrt(2)) - p
+        u = e * math.sqrt(2 * math.pi) * math.exp(x * x / 2)
+        x -= u / (1 + x * u / 2)
+    return x
+
+
+# 目标尾概率低于此值时改在对数空间迭代
+_DEEP_TAIL = 1e-30
+
+
+def _gammaincinv_log(a, log_target, upper, x, tol, max_iter):
+    """
+    极端尾部的反函数：对 log P(a, x) = log p（upper=False）或 log Q(a, x) = log q（upper=True）做 Newton 迭代
+
+    d log Q / dx = -f(x) / Q(x) 是故障率，右尾趋于 1，不会像 f(x) 本身那样下溢；
+    左尾对 log x 迭代，d log P / d log x = x f(x) / P(x) 趋于 a。
+    迭代同时维护一个包含根的区间，Newton 步落在区间外时改为二分
+    """
+    gln = math.lgamma(a)
+    lo, hi = 0.0, math.inf
+    for _ in range(max_iter):
+        log_p, log_q = log_gammainc_pair(a, x)
+        f = (log_q if upper else log_p) - log_target
+        # log Q 关于 x 递减、log P 递增：f > 0 时根在右侧（upper）或左侧（lower）
+        if (f > 0) == upper:
+            lo = x
+        else:
+            hi = x
+        log_pdf = (a - 1) * math.log(x) - x - gln
+        if upper:
+            new = x - f / -math.exp(log_pdf - log_q)
+        else:
+            # 步长截断到 ±700，避免 exp 上溢；越出区间的步会被下面的二分替代
+            new = x * math.exp(max(-700.0, min(700.0, -f / math.exp(log_pdf - log_p + math.log(x)))))
+        if abs(new - x) <= tol * new:
+            return new
+        if not lo <= new <= hi:
+            new = 0.5 * (lo + hi) if hi < math.inf else 2 * x
+        x = new
+    return x
+
+
+def _gammaincinv(a, p, q, tol, max_iter):
+    """
+    P(a, x) = p、Q(a, x) = q 的公共迭代，q = 1 - p；
+    p < 0.5 时以 p 为准，否则以 q 为准，极小的尾概率不经过 1 - p 的舍入。
+    目标尾概率小于 _DEEP_TAIL，或迭代中密度下溢为 0、上溢出浮点范围时，改用 _gammaincinv_log
+    """
+    if p <= 0:
+        return 0.0
+    if q <= 0:
+        return math.inf
+    a1 = a - 1
+    gln = math.lgamma(a)
+    if a > 1:
+        z = ndtri(p) if p < 0.5 else -ndtri(q)
+        x = a * (1 - 1 / (9 * a) + z / (3 * math.sqrt(a))) ** 3
+        if x < 0.01 * a:
+            # 极左尾 P(a, x) ≈ x^a / Γ(a+1)
+            x = math.exp((math.log(p) + math.lgamma(a + 1)) / a)
+    else:
+        t = 1 - a * (0.253 + a * 0.12)
+        x = (p / t) ** (1 / a) if p < t else 1 - math.log(q / (1 - t))
+    upper = p >= 0.5
+    if min(p, q) < _DEEP_TAIL and x > 0:
+        return _gammaincinv_log(a, math.log(q if upper else p), upper, x, tol, max_iter)
+    for _ in range(max_iter):
+        if x <= 0:
+            return 0.0
+        lower, upper_tail = gammainc_pair(a, x)
+        # 在概率较小的一侧计算误差，右尾不经过 1 - Q 的抵消
+        err = lower - p if not upper else q - upper_tail
+        log_pdf = a1 * math.log(x) - x - gln
+        # 初值落到密度下溢的远端，或 a < 1 时 x 极小、密度 x^{a-1} 上溢，Halley 步都无法计算
+        if log_pdf > _LOG_MAX:
+            return _gammaincinv_log(a, math.log(q if upper else p), upper, x, tol, max_iter)
+        pdf = math.exp(log_pdf)
+        if pdf == 0:
+            return _gammaincinv_log(a, math.log(q if upper else p), upper, x, tol, max_iter)
+        u = err / pdf
+        step = u / (1 - 0.5 * min(1.0, u * (a1 / x - 1)))
+        x -= step
+        if x <= 0:
+            x = 0.5 * (x + step)
+        if abs(step) <= tol * x:
+            break
+    return x
+
+
+def gammaincinv(a, p, tol=1e-12, max_iter=100):
+    """
+    P(a, x) = p 的反函数
+
+    Wilson–Hilferty 立方根正态近似（a > 1）或左尾幂近似 x^a / Γ(a+1) 给出初值，
+    再用 Halley 迭代（Numerical Recipes invgammp），通常 2~4 次收敛；
+    p < 1e-30 的极端左尾在对数空间迭代
+
+    >>> x = gammaincinv(3, 1e-250)
+    >>> round(math.log10(gammainc(3, x)), 9)
+    -250.0
+
+    参数
+    ------
+    a : float, a > 0
+    p : float, ∈ [0, 1]
+    tol : float
+        相对误差容限
+    max_iter : int
+        最大迭代次数
+    """
+    return _gammaincinv(a, p, 1 - p, tol, max_iter)
+
+
+def gammainccinv(a, q, tol=1e-12, max_iter=100):
+    """
+    Q(a, x) = q 的反函数，与 gammaincinv 共用迭代；q 很小（右尾）时直接对 Q 求解，
+    q < 1e-30 时对 log Q 做 Newton 迭代，迭代中 Q 远小于最小的双精度正数时也能解出
+
+    参数
+    ------
+    a : float, a > 0
+    q : float, ∈ [0, 1]
+    tol : float
+        相对误差容限
+    max_iter : int
+        最大迭代次数
+    """
+    return _gammaincinv(a, 1 - q, q, tol, max_iter)
+
+
+def _betaincinv_log(a, b, log_p, x, tol, max_iter):
+    """
+    极端左尾的反函数：对 log I_x(a, b) = log p 关于 log x 做 Newton 迭代
+
+    x → 0 时 I_x(a, b) ≈ x^a / (a B(a, b))，log I 关于 log x 近似为斜率 a 的直线，Newton 步几乎一步到位；
+    迭代同时维护包含根的区间 [lo, hi] ⊂ [0, 1]，越出区间时改为二分
+    """
+    afac = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+    lo, hi = 0.0, 1.0
+    for _ in range(max_iter):
+        log_i = log_betainc_pair(a, b, x)[0]
+        f = log_i - log_p
+        if f > 0:
+            hi = x
+        else:
+            lo = x
+        log_pdf = (a - 1) * math.log(x) + (b - 1) * math.log1p(-x) + afac
+        slope = math.exp(log_pdf - log_i + math.log(x))
+        new = x * math.exp(max(-700.0, min(700.0, -f / slope)))
+        if abs(new - x) <= tol * new:
+            return new
+        if not lo <= new <= hi:
+            new = 0.5 * (lo + hi)
+        x = new
+    return x
+
+
+def betaincinv(a, b, p, tol=1e-12, max_iter=100):
+    """
+    I_x(a, b) = p 的反函数
+
+    a, b >= 1 时用正态分位数的 Cornish–Fisher 型修正给出初值，否则用两端的幂近似，
+    再用 Halley 迭代（Numerical Recipes invbetai）；
+    p > 0.5 时转为求 I_{1-x}(b, a) = 1 - p，避免初值在 1 附近被舍入成 1；
+    p < 1e-30 的极端左尾以幂近似 (p a B(a, b))^{1/a} 为初值，在对数空间迭代（见 _betaincinv_log）
+
+    >>> x = betaincinv(200, 2, 1e-100)
+    >>> round(log_betainc_pair(200, 2, x)[0] / math.log(10), 9)
+    -100.0
+    >>> round(betaincinv(1000, 1, 1.1e-16), 12)
+    0.963920890719
+
+    参数
+    ------
+    a, b : float, > 0
+    p : float, ∈ [0, 1]
+    tol : float
+        相对误差容限
+    max_iter : int
+        最大迭代次数
+    """
+    if p <= 0:
+        return 0.0
+    if p >= 1:
+        return 1.0
+    if p > 0.5:
+        return 1 - betaincinv(b, a, 1 - p, tol, max_iter)
+    log_beta = math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+    if p < _DEEP_TAIL:
+        x = math.exp(min((math.log(p) + math.log(a) + log_beta) / a, math.log(0.5)))
+        return _betaincinv_log(a, b, math.log(p), x, tol, max_iter) if x > 0 else 0.0
+    a1, b1 = a - 1, b - 1
+    if a >= 1 and b >= 1:
+        y = -ndtri(p)
+        al = (y * y - 3) / 6
+        h = 2 / (1 / (2 * a - 1) + 1 / (2 * b - 1))
+        w = y * math.sqrt(al + h) / h - (1 / (2 * b - 1) - 1 / (2 * a - 1)) * (al + 5 / 6 - 2 / (3 * h))
+        x = a / (a + b * math.exp(2 * w))
+    else:
+        lna = math.log(a / (a + b))
+        lnb = math.log(b / (a + b))
+        t = math.exp(a * lna) / a
+        u = math.exp(b * lnb) / b
+        w = t + u
+        x = (a * w * p) ** (1 / a) if p < t / w else 1 - (b * w * (1 - p)) ** (1 / b)
+    afac = -log_beta
+    for _ in range(max_iter):
+        if x <= 0 or x >= 1:
+            return x
+        err = betainc(a, b, x) - p
+        log_pdf = a1 * math.log(x) + b1 * math.log1p(-x) + afac
+        # 初值离根太远（如 Beta(1000, 1) 的 p ≈ 1e-16 时 I_x 比 p 小两百个数量级），
+        # Halley 步的二阶修正把步长压到接近 0 而误判收敛；a < 1 时幂近似的初值可以小到 1e-300，
+        # 密度 x^{a-1} 超出浮点范围。这两种情况都改在对数空间带区间迭代
+        if log_pdf > _LOG_MAX or abs(err) > 0.5 * p:
+            return _betaincinv_log(a, b, math.log(p), x, tol, max_iter)
+        pdf = math.exp(log_pdf)
+        if pdf == 0:
+            return _betaincinv_log(a, b, math.log(p), x, tol, max_iter)
+        u = err / pdf
+        step = u / (1 - 0.5 * min(1.0, u * (a1 / x - b1 / (1 - x))))
+        x -= step
+        if x <= 0:
+            x = 0.5 * (x + step)
+        if x >= 1:
+            x = 0.5 * (x + step + 1)
+        if abs(step) <= tol * x:
+            break
+    return x
+
+
+def betainccinv(a, b, q, tol=1e-12, max_iter=100):
+    """
+    1 - I_x(a, b) = q 的反函数
+
+    q <= 0.5 时由对称性 1 - I_x(a, b) = I_{1-x}(b, a) 直接对小概率 q 求解，
+    不经过 1 - q 的舍入
+
+    参数
+    ------
+    a, b : float, > 0
+    q : float, ∈ [0, 1]
+    tol : float
+        相对误差容限
+    max_iter : int
+        最大迭代次数
+    """
+    if q > 0.5:
+        return betaincinv(a, b, 1 - q, tol, max_iter)
+    return 1 - betaincinv(b, a, q, tol, max_iter)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/3 10:05
+    @file  : _vector.py
+
+    数组输入的公共工具
+
+    各分布类的 pmf/pdf/cdf/quantile 在收到标量时仍走原来的计算路径，
+    收到 array_like 时调用 _vspecial（不完全伽马/贝塔函数、正态分位数及其反函数）
+    与 logfact（离散分布的对数概率质量）的向量化函数，这里放它们共用的参数检查与查表工具
+"""
+
+import math
+
+import numpy as np
+
+
+def is_scalar(x):
+    """
+    判断输入是否为标量（Python 数值或 0 维数组）
+
+    每次标量调用都要经过这里，先用 isinstance 判断最常见的 int/float（含 np.float64），
+    其余类型才交给开销大一个数量级的 np.ndim
+    """
+    return isinstance(x, (int, float)) or np.ndim(x) == 0
+
+
+def elementwise(func, x):
+    """
+    对数组 x 逐元素调用标量函数 func（np.frompyfunc），返回同形状的浮点数组
+
+    只用于本身就要逐点计算的场合（cdf 指定 tol 时的自适应数值积分），
+    其余数组路径都直接调用 _vspecial / logfact 的向量化函数
+    """
+    return np.frompyfunc(func, 1, 1)(np.asarray(x, dtype=float)).astype(float)
+
+
+def check_q(q):
+    """
+    检查分位数参数 q 的每个元素都在 [0, 1] 内，返回浮点数组
+    """
+    q = np.asarray(q, dtype=float)
+    if np.any((q < 0) | (q > 1)):
+        raise ValueError("q 必须在 [0, 1] 之间")
+    return q
+
+
+def discrete_cdf(logpmf, k, low, high, log=False):
+    """
+    有限支撑集上的累积分布 P(X <= k) = Σ_{i=low}^{min(k, high)} P(X = i)
+
+    对 low..max(k) 一次求出 logpmf 并累加成表，再按下标取值；
+    log=True 时用 np.logaddexp.accumulate 在对数空间累加，极小的尾概率不下溢
+
+    参数
+    ------
+    logpmf : callable
+        接受数组的对数概率质量函数
+    k : float 或 array_like
+        非整数的 k 向下取整，nan 对应 nan
+    low, high : int
+        支撑集上下界
+    log : bool
+        是否返回 log P(X <= k)
+
+    返回
+    ------
+    float 或 ndarray
+    """
+    scalar = is_scalar(k)
+    k = np.floor(np.asarray(k, dtype=float))
+    empty = -math.inf if log else 0.0
+    # nan 不参与建表，先当作支撑集左侧的点查表，最后再写回 nan
+    nan = np.isnan(k)
+    k = np.where(nan, low - 1, k)
+    top = min(k.max(), high) if k.size else low - 1
+    if top < low:
+        out = np.full(k.shape, empty)
+    else:
+        top = int(top)
+        terms = logpmf(np.arange(low, top + 1))
+        cum = np.logaddexp.accumulate(terms) if log else np.cumsum(np.exp(terms))
+        idx = np.clip(k, low - 1, top) - low
+        out = np.where(idx < 0, empty, cum[np.maximum(idx, 0).astype(int)])
+    out = np.where(nan, np.nan, out)
+    return float(out) if scalar else out
+
+
+def discrete_sf(logpmf, k, low, high, log=False):
+    """
+    有限支撑集上的生存函数 P(X > k) = Σ_{i=max(k+1, low)}^{high} P(X = i)
+
+    从支撑集上端往下累加，上尾概率直接由尾部各项相加得到，不经过 1 - CDF
+
+    参数
+    ------
+    logpmf : callable
+        接受数组的对数概率质量函数
+    k : float 或 array_like
+        非整数的 k 向下取整，nan 对应 nan
+    low, high : int
+        支撑集上下界
+    log : bool
+        是否返回 log P(X > k)
+
+    返回
+    ------
+    float 或 ndarray
+    """
+    scalar = is_scalar(k)
+    k = np.floor(np.asarray(k, dtype=float))
+    empty = -math.inf if log else 0.0
+    # nan 不参与建表，先当作支撑集右端的点查表，最后再写回 nan
+    nan = np.isnan(k)
+    k = np.where(nan, high, k)
+    start = max(k.min() + 1, low) if k.size else high + 1
+    if start > high:
+        out = np.full(k.shape, empty)
+    else:
+        start = int(start)
+        terms = logpmf(np.arange(start, high + 1))[::-1]
+        cum = (np.logaddexp.accumulate(terms) if log else np.cumsum(np.exp(terms)))[::-1]
+        # cum[j] = P(X >= start + j)，末尾补上 P(X > high) = 0
+        cum = np.append(cum, empty)
+        out = cum[(np.clip(k + 1, start, high + 1) - start).astype(int)]
+    out = np.where(nan, np.nan, out)
+    return float(out) if scalar else out
+
+
+def cumulative_table(logpmf, cdf, mu, sigma, low, high=None):
+    """
+    分位数查找用的累积分布表
+
+    只覆盖 μ ± (12σ + 20) 与支撑集的交集，窗口外的概率远小于双精度能分辨的量级；
+    窗口左侧的质量用 O(1) 的 cdf 一次算出作为基数
+
+    参数
+    ------
+    logpmf : callable
+        接受数组的对数概率质量函数
+    cdf : callable
+        标量累积分布函数
+    mu, sigma : float
+        分布的期望与标准差
+    low : int
+        支撑集下界
+    high : int or None
+        支撑集上界，None 表示无上界
+
+    返回
+    ------
+    tuple : (lo, base, cum)，cum[i] = P(X <= lo + i)，base = P(X < lo)
+    """
+    width = 12 * sigma + 20
+    lo = max(low, math.floor(mu - width))
+    hi = math.ceil(mu + width)
+    if high is not None:
+        hi = min(hi, high)
+    base = cdf(lo - 1) if lo > low else 0.0
+    cum = base + np.cumsum(np.exp(logpmf(np.arange(lo, hi + 1))))
+    return lo, base, cum
+
+
+def table_quantile(table, cdf, q, low, high=None):
+    """
+    在累积分布表上二分查找分位数 Q(q) = min{k: CDF(k) >= q}
+
+    数组输入一次 np.searchsorted；q 落在表左侧的极小尾概率时退回对 cdf 的整数二分
+
+    参数
+    ------
+    table : tuple
+        cumulative_table 的返回值
+    cdf : callable
+        标量累积分布函数
+    q : float 或 array_like, ∈ [0, 1]
+    low : int
+        支撑集下界，Q(0) = low
+    high : int or None
+        支撑集上界，Q(1) = high；无上界时 q = 1 返回表的右端
+
+    返回
+    ------
+    int 或 ndarray : 分位数 k
+    """
+    lo, base, cum = table
+    scalar = is_scalar(q)
+    q = check_q(q)
+    shape = q.shape
+    q = q.ravel()
+    k = np.minimum(np.searchsorted(cum, q, side='left'), len(cum) - 1) + lo
+    k[q == 0] = low
+    if high is not None:
+        k[q == 1] = high
+    for i in np.flatnonzero((q > 0) & (q <= base)):
+        a, b = low, lo - 1
+        while a < b:
+            mid = (a + b) // 2
+            if cdf(mid) >= q[i]:
+                b = mid
+            else:
+                a = mid + 1
+        k[i] = a
+    return int(k[0]) if scalar else k.reshape(shape)
+
+
+def survival_table(logpmf, sf, mu, sigma, low, high=None):
+    """
+    逆生存函数查找用的生存函数表，覆盖与 cumulative_table 相同的窗口
+
+    从窗口右端往左累加 pmf，右尾概率直接由尾部各项相加得到，不经过 1 - CDF；
+    窗口右侧的质量用 O(1) 的 sf 一次算出作为基数
+
+    参数
+    ------
+    logpmf : callable
+        接受数组的对数概率质量函数
+    sf : callable
+        标量生存函数 P(X > k)
+    mu, sigma : float
+        分布的期望与标准差
+    low : int
+        支撑集下界
+    high : int or None
+        支撑集上界，None 表示无上界
+
+    返回
+    ------
+    tuple : (lo, top, surv)，surv[i] = P(X > lo + i)，top = P(X > 表的右端)
+    """
+    width = 12 * sigma + 20
+    lo = max(low, math.floor(mu - width))
+    hi = math.ceil(mu + width)
+    if high is not None:
+        hi = min(hi, high)
+    top = sf(hi) if high is None or hi < high else 0.0
+    tail = np.exp(logpmf(np.arange(lo + 1, hi + 1)))[::-1]
+    surv = np.append((top + np.cumsum(tail))[::-1], top)
+    return lo, top, surv
+
+
+def table_isf(table, sf, q, low, high=None):
+    """
+    在生存函数表上二分查找逆生存函数 ISF(q) = min{k: SF(k) <= q}
+
+    数组输入一次 np.searchsorted；q 小于表右端的尾概率时，
+    先按 1, 2, 4, ... 的步长向右找到上界，再对 sf 做整数二分
+
+    参数
+    ------
+    table : tuple
+        survival_table 的返回值
+    sf : callable
+        标量生存函数
+    q : float 或 array_like, ∈ [0, 1]
+    low : int
+        支撑集下界，ISF(1) = low
+    high : int or None
+        支撑集上界，ISF(0) = high；无上界时 q = 0 返回 sf 在双精度下变为 0 的位置
+
+    返回
+    ------
+    int 或 ndarray : k
+    """
+    lo, top, surv = table
+    scalar = is_scalar(q)
+    q = check_q(q)
+    shape = q.shape
+    q = q.ravel()
+    # surv 单调不增，对 -surv 查找第一个满足 surv[i] <= q 的位置
+    i = np.searchsorted(-surv, -q, side='left')
+    k = np.minimum(i, len(surv) - 1) + lo
+    k[(q == 1) | ((i == 0) & (lo > low))] = low
+    if high is not None:
+        k[q == 0] = high
+    for j in np.flatnonzero(i == len(surv)):
+        if high is not None and q[j] == 0:
+            continue
+        a, step = lo + len(surv), 1
+        b = a
+        while sf(b) > q[j]:
+            a = b + 1
+            b += step
+            step *= 2
+            if high is not None and b >= high:
+                b = high
+                break
+        while a < b:
+            mid = (a + b) // 2
+            if sf(mid) <= q[j]:
+                b = mid
+            else:
+                a = mid + 1
+        k[j] = a
+    for j in np.flatnonzero((i == 0) & (lo > low) & (q < 1)):
+        a, b = low, lo
+        while a < b:
+            mid = (a + b) // 2
+            if sf(mid) <= q[j]:
+                b = mid
+            else:
+                a = mid + 1
+        k[j] = a
+    return int(k[0]) if scalar else k.reshape(shape)
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 10:22
+    @file  : beta.py
+"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from ._moments import check_order, shift
+from ._lazy import lazy
+from .integrate import quad, tanh_sinh
+from . import _vspecial
+from ._special import betainc, betaincc, betaincinv, betainccinv, log_betainc_pair
+from ._vector import is_scalar, elementwise, check_q
+
+class Beta:
+    """
+    贝塔分布类（Beta Distribution）
+
+    属性
+    ------
+    alpha : float
+        形状参数 α > 0
+    beta : float
+        形状参数 β > 0
+
+    方法
+    ------
+    pdf(x)                 概率密度函数 f(x)
+    cdf(x, tol=None)       累积分布函数 F(x)
+    sf(x)                  生存函数 1 - F(x)
+    logpdf(x)              对数概率密度 log f(x)
+    logcdf(x)              对数累积分布函数 log F(x)
+    logsf(x)               对数生存函数 log(1 - F(x))
+    expectation()          期望 E[X]
+    variance()             方差 Var[X]
+    std_dev()              标准差 Std[X]
+    coef_variation()       变异系数 CV = Std[X]/E[X]
+    raw_moment(k)          k 阶原点矩 E[X^k]
+    central_moment(k)      k 阶中心矩 E[(X - μ)^k]
+    quantile(q, tol, max_iter)  分位数 Q(q) 使 F(Q) = q
+    isf(q, tol, max_iter)  逆生存函数 ISF(q) 使 1 - F = q
+    rvs(size=None, rng=None) 随机抽样
+    skewness()             偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('alpha', 'beta', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, alpha, beta):
+        """
+        初始化贝塔分布对象
+
+        参数
+        ------
+        alpha : float
+            α > 0
+        beta : float
+            β > 0
+        """
+        if alpha <= 0 or beta <= 0:
+            raise ValueError("alpha 和 beta 必须都大于 0")
+        self.alpha = alpha
+        self.beta = beta
+
+    @staticmethod
+    def _log_beta_function(a, b):
+        """贝塔函数的对数 log B(a, b) = log Γ(a) + log Γ(b) - log Γ(a+b)，参数很大时也不溢出"""
+        return math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+
+    def pdf(self, x):
+        """
+        概率密度函数 PDF
+
+        参数
+        ------
+        x : float 或 array_like, 定义在 (0, 1)
+
+        返回
+        ------
+        float 或 ndarray : f(x)
+        """
+        # 由 logpdf 取指数，α、β 很大时 B(α, β) 不会溢出
+        if not is_scalar(x):
+            return np.exp(self.logpdf(x))
+        return math.exp(self._logpdf(x))
+
+    def cdf(self, x, tol=None):
+        """
+        累积分布函数 CDF：P(X <= x) = I_x(α, β)
+        默认用正则化不完全贝塔函数计算，精度到机器精度；指定 tol 时改用自适应数值积分，
+        α < 1 或 β < 1 时密度在端点处发散，用 tanh-sinh 求积，否则用 Gauss–Kronrod
+
+        参数
+        ------
+        x : float 或 array_like, ∈ [0, 1]
+        tol : float or None
+            数值积分的相对误差目标，None 表示不用数值积分
+
+        返回
+        ------
+        float 或 ndarray : F(x)
+        """
+        if tol is None:
+            if not is_scalar(x):
+                return _vspecial.betainc_pair(self.alpha, self.beta, np.asarray(x, dtype=float))[0]
+            return betainc(self.alpha, self.beta, x)
+        if not is_scalar(x):
+            return elementwise(lambda v: self.cdf(v, tol), x)
+        if x <= 0:
+            return 0.0
+        if x >= 1:
+            return 1.0
+        rule = tanh_sinh if min(self.alpha, self.beta) < 1 else quad
+        return rule(lambda t: np.exp(self.logpdf(t)), 0.0, x, tol)[0]
+
+    def sf(self, x):
+        """
+        生存函数 1 - F(x) = I_{1-x}(β, α)，右尾直接算出，不经过 1 - F(x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > x)
+        """
+        if not is_scalar(x):
+            return _vspecial.betainc_pair(self.alpha, self.beta, np.asarray(x, dtype=float))[1]
+        return betaincc(self.alpha, self.beta, x)
+
+    def logpdf(self, x):
+        """
+        对数概率密度 log f(x) = (α-1) log x + (β-1) log(1-x) - log B(α, β)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        if not is_scalar(x):
+            a, b = self.alpha, self.beta
+            log_b = self._log_beta_function(a, b)
+            x = np.asarray(x, dtype=float)
+            # 条件写成支撑集外，nan 落在计算分支里，结果仍为 nan
+            outside = (x <= 0) | (x >= 1)
+            t = np.where(outside, 0.5, x)
+            return np.where(outside, -math.inf, (a - 1) * np.log(t) + (b - 1) * np.log1p(-t) - log_b)
+        return self._logpdf(x)
+
+    def _logpdf(self, x):
+        """logpdf 的标量路径，pdf 直接调用，不再重复判断输入类型"""
+        if x <= 0 or x >= 1:
+            return -math.inf
+        a, b = self.alpha, self.beta
+        return (a - 1) * math.log(x) + (b - 1) * math.log1p(-x) - self._log_beta_function(a, b)
+
+    def logcdf(self, x):
+        """
+        对数累积分布函数 log F(x) = log I_x(α, β)
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            return _vspecial.log_betainc_pair(self.alpha, self.beta, np.asarray(x, dtype=float))[0]
+        return log_betainc_pair(self.alpha, self.beta, x)[0]
+
+    def logsf(self, x):
+        """
+        对数生存函数 log(1 - F(x))
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            return _vspecial.log_betainc_pair(self.alpha, self.beta, np.asarray(x, dtype=float))[1]
+        return log_betainc_pair(self.alpha, self.beta, x)[1]
+
+    def expectation(self):
+        """期望 E[X] = α / (α + β)"""
+        return self.alpha / (self.alpha + self.beta)
+
+    def variance(self):
+        """方差 Var[X] = αβ / [(α+β)^2 (α+β+1)]"""
+        a, b = self.alpha, self.beta
+        return (a * b) / ((a + b)**2 * (a + b + 1))
+
+    def std_dev(self):
+        """标准差 Std[X] = sqrt(Var[X])"""
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """变异系数 CV = Std[X] / E[X]"""
+        mu = self.expectation()
+        return self.std_dev() / mu if mu != 0 else float('inf')
+
+    def _raw_moments(self, k):
+        """
+        精确的原点矩 [E[X^0], ..., E[X^k]]（Fraction）
+        E[X^j] = Π_{i<j} (α+i)/(α+β+i)
+        """
+        a, b = Fraction(self.alpha), Fraction(self.beta)
+        raw = [Fraction(1)]
+        for i in range(k):
+            raw.append(raw[-1] * (a + i) / (a + b + i))
+        return raw
+
+    def raw_moment(self, k):
+        """
+        k 阶原点矩 E[X^k] = B(α+k, β) / B(α, β)
+        写成连乘 Π_{i<k} (α+i)/(α+β+i)，不会因 Γ 函数溢出
+        """
+        check_order(k)
+        a, b = self.alpha, self.beta
+        total = 1.0
+        for i in range(k):
+            total *= (a + i) / (a + b + i)
+        return total
+
+    def central_moment(self, k):
+        """
+        k 阶中心矩 E[(X - μ)^k]
+        对精确的原点矩做二项展开：sum_{i=0}^k C(k,i) (-μ)^{k-i} E[X^i]，全程有理数运算
+        """
+        check_order(k)
+        a, b = Fraction(self.alpha), Fraction(self.beta)
+        return float(shift(self._raw_moments(k), -a / (a + b)))
+
+    def quantile(self, q, tol = 1e-12, max_iter = 100):
+        """
+        分位数 Q(q)，解 F(x) = q
+        正态分位数修正或两端幂近似给初值，再对 I_x(α, β) = q 做 Halley 迭代
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+        tol : float
+            相对误差容限
+        max_iter : int
+            最大迭代次数
+
+        返回
+        ------
+        float 或 ndarray : Q，使得 CDF(Q) ≈ q
+        """
+        if not is_scalar(q):
+            return _vspecial.betaincinv(self.alpha, self.beta, check_q(q), tol, max_iter)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return betaincinv(self.alpha, self.beta, q, tol, max_iter)
+
+    def isf(self, q, tol = 1e-12, max_iter = 100):
+        """
+        逆生存函数 ISF(q)，解 1 - F(x) = q
+        q 较小时由 1 - F(x) = I_{1-x}(β, α) 直接对 q 求解
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+        tol : float
+            相对误差容限
+        max_iter : int
+            最大迭代次数
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        if not is_scalar(q):
+            return _vspecial.betainccinv(self.alpha, self.beta, check_q(q), tol, max_iter)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return betainccinv(self.alpha, self.beta, q, tol, max_iter)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样 X = G1 / (G1 + G2)，G1 ~ Gamma(α), G2 ~ Gamma(β)
+        α, β 都很小时两个 Gamma 变量可能同时下溢为 0，这些位置改用 Generator.beta 重抽
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        g1 = rng.standard_gamma(self.alpha, size)
+        g2 = rng.standard_gamma(self.beta, size)
+        with np.errstate(invalid='ignore'):
+            x = g1 / (g1 + g2)
+        if size is None:
+            return x if x == x else rng.beta(self.alpha, self.beta)
+        bad = np.isnan(x)
+        if bad.any():
+            x[bad] = rng.beta(self.alpha, self.beta, int(bad.sum()))
+        return x
+
+    def skewness(self):
+        """
+        偏度 Skew[X]
+        解析公式：
+        2*(β-α)*sqrt(α+β+1) / [ (α+β+2)*sqrt(αβ) ]
+        """
+        a, b = self.alpha, self.beta
+        num = 2 * (b - a) * math.sqrt(a + b + 1)
+        den = (a + b + 2) * math.sqrt(a * b)
+        return num / den
+
+    def kurtosis(self, excess = False) -> float:
+        """
+        峰度 Kurt[X] 或 超额峰度（excess=True）
+        解析公式（超额峰度）：
+        6*[(α-β)^2*(α+β+1) - αβ*(α+β+2)]
+          / [αβ(α+β+2)(α+β+3)]
+        总峰度 = excess + 3
+        """
+        a, b = self.alpha, self.beta
+        excess_k = 6 * (((a - b)**2 * (a + b + 1)) - (a * b * (a + b + 2))) \
+                   / (a * b * (a + b + 2) * (a + b + 3))
+        return excess_k if excess else excess_k + 3
+
+    def __str__(self):
+        return f"""$贝塔分布：X~Be(\\alpha={self.alpha}, \\beta={self.beta})$
+            期望: {self.E}
+            方差：{self.Var}
+            变异系数：{self.coef}
+            偏度：{self.skew}
+            峰度：{self.kurt}
+        """
+
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 08:44
+    @file  : binom.py
+"""
+
+import math
+from fractions import Fraction
+
+import numpy as np
+
+from ._moments import check_order, falling, raw_from_factorial, shift, stirling2, to_float
+from ._lazy import lazy
+from ._sampling import ALIAS_MAX, alias_table, alias_draw
+from ._special import betainc, betaincc, log_betainc_pair
+from . import _vspecial
+from .logfact import log_binom_pmf, _log_binom_scalar
+from ._vector import is_scalar, cumulative_table, table_quantile, survival_table, table_isf
+
+class Binom:
+    """
+    二项分布
+
+    Property
+    ------
+    n : int
+        重复试验的次数
+    p : float
+        每次试验成功的概率，必须满足 0 <= p <= 1
+
+    Method
+    ------
+    pmf(k)
+        计算概率质量函数 P(X = k)
+    cdf(k)
+        计算累积分布函数 P(X <= k)
+    sf(k)
+        生存函数 P(X > k)，直接计算上尾，不经过 1 - CDF
+    logpmf(k) / logcdf(k) / logsf(k)
+        log P(X = k)、log P(X <= k)、log P(X > k)，大 n 下不下溢
+    expectation()
+        返回期望 E[X]
+    variance()
+        返回方差 Var[X]
+    std_dev()
+        返回标准差 Std[X]
+    coef_variation()
+        变异系数 CV = Std[X]/E[X]
+    raw_moment(k)
+        k 阶原点矩 E[X^k]
+    central_moment(k)
+        k 阶中心矩 E[(X - μ)^k]
+    quantile(q)
+        分位数 Q(q) = min{k: CDF(k) >= q}
+    isf(q)
+        逆生存函数 ISF(q) = min{k: SF(k) <= q}
+    rvs(size=None, rng=None)
+        随机抽样，rng 为 numpy.random.Generator 或种子
+    skewness()
+        偏度 Skew[X]
+    kurtosis(excess=False)
+        峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('n', 'p', '_E', '_Var', '_Std', '_coef', '_skew', '_kurt', '_cum_table', '_sf_table', '_alias')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    Std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+    # 分位数查找用的累积分布表，第一次调用 quantile 时构造
+    cum_table = lazy('_cumulative_table')
+    # 逆生存函数查找用的生存函数表，第一次调用 isf 时构造
+    sf_table = lazy('_survival_table')
+    # 小支撑集抽样用的 alias 表，第一次调用 rvs 时构造
+    alias = lazy('_alias_table')
+
+    def __init__(self, n, p):
+        """
+        初始化二项分布对象
+
+        Parameters
+        ------
+        n : int
+            总的独立重复试验次数
+        p : float
+            每次成功的概率，0 <= p <= 1
+        """
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("实验次数 n 必须为正整数")
+        if not (0 <= p <= 1):
+            raise ValueError("成功概率 p 必须在 [0, 1] 区间内")
+
+        self.n = n
+        self.p = p
+
+    def pmf(self, k):
+        """
+        概率质量函数（PMF）
+
+        参数
+        ------
+        k : int 或 array_like
+            成功的次数
+
+        返回
+        ------
+        float 或 ndarray : P(X = k) 的概率，数组输入返回同形状数组
+        """
+        if not is_scalar(k):
+            return np.exp(self.logpmf(k))
+        if k < 0 or k > self.n:
+            return 0.0
+        return math.exp(_log_binom_scalar(k, self.n, self.p, 1 - self.p))
+
+    def _tails(self, k, log=False):
+        """
+        数组输入的 (P(X <= k), P(X > k))，支撑集内部的 k 一次调用 _vspecial.betainc_pair；
+        log=True 时改用 log_betainc_pair 返回对数值，k 为 nan 的元素两者都是 nan
+        """
+        k = np.floor(np.asarray(k, dtype=float))
+        one, zero = (0.0, -math.inf) if log else (1.0, 0.0)
+        cdf = np.where(k >= self.n, one, zero)
+        sf = np.where(k < 0, one, zero)
+        mid = (k >= 0) & (k < self.n)
+        if mid.any():
+            km = k[mid]
+            pair = _vspecial.log_betainc_pair if log else _vspecial.betainc_pair
+            sf[mid], cdf[mid] = pair(km + 1, self.n - km, self.p)
+        nan = np.isnan(k)
+        cdf[nan] = sf[nan] = np.nan
+        return cdf, sf
+
+    def cdf(self, k):
+        """
+        累积分布函数（CDF）
+        P(X <= k) = 1 - I_p(k+1, n-k)，用正则化不完全贝塔函数计算，耗时与 k 无关
+
+        参数
+        ------
+        k : int 或 array_like
+            成功次数阈值
+
+        返回
+        ------
+        float 或 ndarray : P(X <= k) 的累积概率
+        """
+        if not is_scalar(k):
+            return self._tails(k)[0]
+        if k < 0:
+            return 0.0
+        if k >= self.n:
+            return 1.0
+        k = math.floor(k)
+        return betaincc(k + 1, self.n - k, self.p)
+
+    def sf(self, k):
+        """
+        生存函数 P(X > k) = I_p(k+1, n-k)
+        直接用不完全贝塔函数算上尾，不经过 1 - CDF，极小的尾概率也保有相对精度
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > k)
+        """
+        if not is_scalar(k):
+            return self._tails(k)[1]
+        if k < 0:
+            return 1.0
+        if k >= self.n:
+            return 0.0
+        k = math.floor(k)
+        return betainc(k + 1, self.n - k, self.p)
+
+    def logpmf(self, k):
+        """
+        对数概率质量函数 log P(X = k)
+        用 logfact.log_binom_pmf 的鞍点展开，n 很大时既不下溢、也不因 log C(n, k) 的抵消丢失精度
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X = k)，k 不在支撑集内时为 -inf
+        """
+        return log_binom_pmf(k, self.n, self.p, 1 - self.p)
+
+    def logcdf(self, k):
+        """
+        对数累积分布函数 log P(X <= k)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X <= k)
+        """
+        if not is_scalar(k):
+            return self._tails(k, log=True)[0]
+        if k < 0:
+            return -math.inf
+        if k >= self.n:
+            return 0.0
+        k = math.floor(k)
+        return log_betainc_pair(k + 1, self.n - k, self.p)[1]
+
+    def logsf(self, k):
+        """
+        对数生存函数 log P(X > k)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X > k)
+        """
+        if not is_scalar(k):
+            return self._tails(k, log=True)[1]
+        if k < 0:
+            return 0.0
+        if k >= self.n:
+            return -math.inf
+        k = math.floor(k)
+        return log_betainc_pair(k + 1, self.n - k, self.p)[0]
+
+    def expectation(self):
+        """
+        返回期望值 E[X] = n * p
+        """
+        return self.n * self.p
+
+    def variance(self):
+        """
+        返回方差 Var[X] = n * p * (1 - p)
+        """
+        return self.n * self.p * (1 - self.p)
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = sqrt(Var[X])
+        """
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.Std / mu if mu != 0 else float('inf')
+
+    def _factorial_moments(self, m):
+        """
+        精确的阶乘矩 E[(X)_j] = n(n-1)...(n-j+1) p^j，j = 0..m（Fraction）
+        """
+        p = Fraction(self.p)
+        return falling(m, lambda i: (self.n - i) * p)
+
+    def raw_moment(self, k):
+        """
+        k 阶原点矩 E[X^k]
+        通过 Stirling 数 E[X^k] = Σ S(k, j) E[(X)_j] 计算，只求第 k 行，O(k) 次有理数运算，耗时与 n 无关
+        """
+        check_order(k)
+        return to_float(sum(s * f for s, f in zip(stirling2(k), self._factorial_moments(k))))
+
+    def central_moment(self, k):
+        """
+        k 阶中心矩 E[(X - μ)^k]
+        对精确的原点矩做二项展开，全程有理数运算，不受 μ 很大时的抵消误差影响；
+        二项分布的累积量有正有负，浮点递推会抵消，代价是 O(k^3) 左右（k = 200 约 1 s）
+        """
+        check_order(k)
+        mu = self.n * Fraction(self.p)
+        return to_float(shift(raw_from_factorial(self._factorial_moments(k)), -mu))
+
+    def _cumulative_table(self):
+        """
+        μ ± (12σ + 20) 范围内的累积分布表，见 cumulative_table
+        """
+        return cumulative_table(self.logpmf, self.cdf, self.E, self.Std, 0, self.n)
+
+    def _alias_table(self):
+        """
+        支撑集 0..n 上的 alias 表，见 alias_table
+        """
+        return alias_table(self.logpmf, 0, self.n)
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = min{k: CDF(k) >= q}
+        在缓存的累积分布表上二分查找，单次查询 O(log n)
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : 分位数 k
+        """
+        return table_quantile(self.cum_table, self.cdf, q, 0, self.n)
+
+    def _survival_table(self):
+        """
+        μ ± (12σ + 20) 范围内的生存函数表，见 survival_table
+        """
+        return survival_table(self.logpmf, self.sf, self.E, self.Std, 0, self.n)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = min{k: P(X > k) <= q}
+        在缓存的生存函数表上二分查找，q 是 1e-12 这样的极小尾概率时也不经过 1 - q
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : k
+        """
+        return table_isf(self.sf_table, self.sf, q, 0, self.n)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样
+        n < 64（支撑集不超过 64 个点）时用缓存的 alias 表，否则调用 Generator.binomial（n·min(p, 1-p) >= 30 时为 BTPE 算法）
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        int 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        if self.n < ALIAS_MAX:
+            return alias_draw(self.alias, size, rng)
+        return rng.binomial(self.n, self.p, size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = (1 - 2p) / sqrt(n p (1 - p))
+        """
+        return (1 - 2 * self.p) / math.sqrt(self.n * self.p * (1 - self.p))
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度，默认 False
+
+        返回
+        ------
+        float : 峰度值
+        """
+        ex_k = (1 - 6 * self.p * (1 - self.p)) / (self.n * self.p * (1 - self.p))
+        return ex_k if excess else ex_k + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$二项分布：X~B(n={self.n}, p={self.p})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 10:16
+    @file  : exp.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order, central_from_cumulants
+from ._lazy import lazy
+from . import _vspecial
+from ._special import log1mexp
+from ._vector import is_scalar, check_q
+
+class Exp:
+    """
+    指数分布类（Exponential Distribution）
+
+    属性
+    ------
+    lam : float
+        事件发生的速率参数 λ（lambda），必须大于 0
+
+    方法
+    ------
+    pdf(x)               概率密度函数 f(x)
+    cdf(x)               累积分布函数 P(X <= x)
+    sf(x)                生存函数 P(X > x) = e^{-λx}
+    logpdf(x)            对数概率密度 log f(x) = log λ - λx
+    logcdf(x)            对数累积分布函数 log P(X <= x)
+    logsf(x)             对数生存函数 log P(X > x) = -λx
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(k)        k 阶原点矩 E[X^k]
+    central_moment(k)    k 阶中心矩 E[(X - μ)^k]
+    quantile(q)          分位数 Q(q) = -ln(1-q)/λ
+    isf(q)               逆生存函数 ISF(q) = -ln(q)/λ
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('lam', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, lam):
+        """
+        初始化指数分布
+
+        参数
+        ------
+        lam : float
+            速率参数 λ（lambda），必须大于 0
+        """
+        if lam <= 0:
+            raise ValueError("λ (lambda) 必须为正数")
+        self.lam = lam
+
+    def pdf(self, x):
+        """
+        概率密度函数 PDF：f(x)
+
+        参数
+        ------
+        x : float 或 array_like
+            自变量 x ≥ 0
+
+        返回
+        ------
+        float 或 ndarray : 密度值 f(x)
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.where(x < 0, 0.0, self.lam * np.exp(-self.lam * np.maximum(x, 0)))
+        if x < 0:
+            return 0.0
+        return self.lam * math.exp(-self.lam * x)
+
+    def cdf(self, x):
+        """
+        累积分布函数 CDF：P(X <= x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : 累积概率 P(X <= x)
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.where(x < 0, 0.0, -np.expm1(-self.lam * np.maximum(x, 0)))
+        if x < 0:
+            return 0.0
+        return -math.expm1(-self.lam * x)
+
+    def sf(self, x):
+        """
+        生存函数 P(X > x) = e^{-λx}
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > x)
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.where(x < 0, 1.0, np.exp(-self.lam * np.maximum(x, 0)))
+        if x < 0:
+            return 1.0
+        return math.exp(-self.lam * x)
+
+    def logpdf(self, x):
+        """
+        对数概率密度 log f(x) = log λ - λx
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.where(x < 0, -math.inf, math.log(self.lam) - self.lam * x)
+        if x < 0:
+            return -math.inf
+        return math.log(self.lam) - self.lam * x
+
+    def logcdf(self, x):
+        """
+        对数累积分布函数 log P(X <= x) = log(1 - e^{-λx})
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return _vspecial.log1mexp(-self.lam * np.maximum(x, 0))
+        if x <= 0:
+            return -math.inf
+        return log1mexp(-self.lam * x)
+
+    def logsf(self, x):
+        """
+        对数生存函数 log P(X > x) = -λx
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.where(x < 0, 0.0, -self.lam * x)
+        if x < 0:
+            return 0.0
+        return -self.lam * x
+
+    def expectation(self):
+        """
+        返回期望 E[X] = 1 / λ
+        """
+        return 1 / self.lam
+
+    def variance(self):
+        """
+        返回方差 Var[X] = 1 / λ^2
+        """
+        return 1 / (self.lam ** 2)
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = 1 / λ
+        """
+        return 1 / self.lam
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.std / mu if mu != 0 else float('inf')
+
+    def raw_moment(self, k):
+        """
+        k 阶原点矩 E[X^k] = k! / λ^k
+        写成连乘 Π_{i<k} (i+1)/λ，k! 超出浮点范围时不会抛出 OverflowError
+        """
+        check_order(k)
+        total = 1.0
+        for i in range(k):
+            total *= (i + 1) / self.lam
+        return total
+
+    def central_moment(self, k):
+        """
+        k 阶中心矩 E[(X - μ)^k]
+        由累积量 κ_r = (r-1)! / λ^r 递推
+        """
+        check_order(k)
+        return central_from_cumulants(k, lambda r: math.factorial(r - 1) / self.lam ** r)
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = -ln(1 - q) / λ，用 log1p 计算，q 很小时不丢精度
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : 分位数值
+        """
+        if not is_scalar(q):
+            q = check_q(q)
+            with np.errstate(divide='ignore'):
+                return -np.log1p(-q) / self.lam
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        if q == 1:
+            return math.inf
+        return -math.log1p(-q) / self.lam
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = -ln(q) / λ
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : q = 0 时为 inf
+        """
+        if not is_scalar(q):
+            q = check_q(q)
+            with np.errstate(divide='ignore'):
+                return -np.log(q) / self.lam
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        if q == 0:
+            return math.inf
+        return -math.log(q) / self.lam
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样 E / λ，E 由 Generator.standard_exponential（ziggurat 算法）生成
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return rng.standard_exponential(size) / self.lam
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = 2
+        """
+        return 2
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度，默认 False
+
+        返回
+        ------
+        float : 峰度值
+        """
+        ex = 6
+        return ex if excess else ex + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$指数分布：X~Exp(\\lambda={self.lam})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,841 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/7 11:20
+    @file  : family.py
+
+    参数数组族：一个对象表示一整组参数
+
+    BinomFamily(n=[10, 20, 30], p=[[0.1], [0.5]]) 按 numpy 广播规则对齐参数，
+    pmf / cdf / 矩对所有参数组合一次向量运算算完，不再逐个构造标量分布对象。
+    自变量 x 再与参数形状广播，例如 x 形状 (k, 1, 1) 对参数形状 (2, 3) 得到 (k, 2, 3)
+"""
+
+import numpy as np
+
+from ._lazy import lazy
+from ._vspecial import gammaln, gammainc_pair, betainc_pair, ndtr_pair, xlogy, xlog1py
+from .logfact import log_binom_pmf, log_poisson_pmf, log_hypergeom_pmf
+
+
+class _Family:
+    """
+    参数数组族的公共部分
+
+    子类设置 _params（参数名元组），实现 expectation、variance、skewness、
+    _excess_kurtosis 以及 pmf/pdf、cdf
+    """
+
+    __slots__ = ('_E', '_Var', '_std', '_skew', '_kurt')
+
+    _params = ()
+
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    @property
+    def shape(self):
+        """参数广播后的形状"""
+        return getattr(self, self._params[0]).shape
+
+    def _align(self, x):
+        """把自变量与各参数广播成同形状数组，返回 (x, 参数1, 参数2, ...)"""
+        return np.broadcast_arrays(np.asarray(x, dtype=float),
+                                   *(getattr(self, name) for name in self._params))
+
+    def std_dev(self):
+        """
+        标准差 Std[X]
+        """
+        return np.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X]/E[X]
+        """
+        return self.std_dev() / self.expectation()
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+        """
+        k = self._excess_kurtosis()
+        return k if excess else k + 3
+
+    def _excess_kurtosis(self):
+        raise NotImplementedError
+
+    def __getitem__(self, index):
+        """按参数数组的下标取出子族，例如 family[0]、family[:, 1:]"""
+        params = [np.asarray(getattr(self, name)[index]) for name in self._params]
+        new = object.__new__(type(self))
+        for name, value in zip(self._params, params):
+            setattr(new, name, value)
+        return new
+
+    def __repr__(self):
+        return f"{type(self).__name__}(shape={self.shape})"
+
+
+class _DiscreteFamily(_Family):
+    """离散分布族：pmf 由 logpmf 取指数得到"""
+
+    __slots__ = ()
+
+    def pmf(self, k):
+        """
+        概率质量函数 P(X = k)
+
+        参数
+        ------
+        k : array_like
+            与参数形状可广播
+
+        返回
+        ------
+        ndarray : 广播后的形状
+        """
+        return np.exp(self.logpmf(k))
+
+
+class BinomFamily(_DiscreteFamily):
+    """
+    二项分布族 B(n, p)
+
+    Property
+    ------
+    n : ndarray[int]
+        重复试验的次数
+    p : ndarray[float]
+        每次试验成功的概率
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pmf(k) / logpmf(k) / cdf(k)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('n', 'p')
+    _params = ('n', 'p')
+
+    def __init__(self, n, p):
+        """
+        参数
+        ------
+        n : array_like[int]
+            正整数
+        p : array_like[float]
+            0 <= p <= 1
+        """
+        n, p = np.broadcast_arrays(np.asarray(n), np.asarray(p, dtype=float))
+        if np.any(n <= 0) or np.any(n != np.floor(n)):
+            raise ValueError("实验次数 n 必须为正整数")
+        if np.any((p < 0) | (p > 1)):
+            raise ValueError("成功概率 p 必须在 [0, 1] 区间内")
+        self.n = n.astype(np.int64)
+        self.p = p
+
+    def logpmf(self, k):
+        """
+        log P(X = k)，由 logfact.log_binom_pmf 的鞍点展开计算，支撑集外为 -inf
+        """
+        k, n, p = self._align(k)
+        valid = (k >= 0) & (k <= n) & (k == np.floor(k))
+        out = log_binom_pmf(np.where(valid, k, 0), n, p, 1 - p)
+        return np.where(valid, out, -np.inf)
+
+    def cdf(self, k):
+        """
+        P(X <= k) = 1 - I_p(k+1, n-k)
+        """
+        k, n, p = self._align(k)
+        k = np.floor(k)
+        mid = (k >= 0) & (k < n)
+        out = np.where(k >= n, 1.0, 0.0)
+        if mid.any():
+            out[mid] = betainc_pair(k[mid] + 1, n[mid] - k[mid], p[mid])[1]
+        return out
+
+    def expectation(self):
+        """
+        期望 E[X] = np
+        """
+        return self.n * self.p
+
+    def variance(self):
+        """
+        方差 Var[X] = np(1-p)
+        """
+        return self.n * self.p * (1 - self.p)
+
+    def skewness(self):
+        """
+        偏度 (1 - 2p) / sqrt(np(1-p))
+        """
+        return (1 - 2 * self.p) / np.sqrt(self.variance())
+
+    def _excess_kurtosis(self):
+        pq = self.p * (1 - self.p)
+        return (1 - 6 * pq) / (self.n * pq)
+
+
+class PoissonFamily(_DiscreteFamily):
+    """
+    泊松分布族 P(λ)
+
+    Property
+    ------
+    lam : ndarray[float]
+        强度参数 λ > 0
+    shape : tuple
+        参数形状
+
+    Method
+    ------
+    pmf(k) / logpmf(k) / cdf(k)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('lam',)
+    _params = ('lam',)
+
+    def __init__(self, lam):
+        """
+        参数
+        ------
+        lam : array_like[float]
+            λ > 0
+        """
+        lam = np.asarray(lam, dtype=float)
+        if np.any(lam <= 0):
+            raise ValueError("λ (lambda) 必须为正数")
+        self.lam = lam
+
+    def logpmf(self, k):
+        """
+        log P(X = k) = k log λ - λ - log k!，由 logfact.log_poisson_pmf 的鞍点展开计算
+        """
+        k, lam = self._align(k)
+        valid = (k >= 0) & (k == np.floor(k)) & np.isfinite(k)
+        out = log_poisson_pmf(np.where(valid, k, 0), lam)
+        return np.where(valid, out, -np.inf)
+
+    def cdf(self, k):
+        """
+        P(X <= k) = Q(k+1, λ)
+        """
+        k, lam = self._align(k)
+        k = np.floor(k)
+        out = np.where(k >= 0, 1.0, 0.0)
+        mid = (k >= 0) & np.isfinite(k)
+        if mid.any():
+            out[mid] = gammainc_pair(k[mid] + 1, lam[mid])[1]
+        return out
+
+    def expectation(self):
+        """
+        期望 E[X] = λ
+        """
+        return self.lam.copy()
+
+    def variance(self):
+        """
+        方差 Var[X] = λ
+        """
+        return self.lam.copy()
+
+    def skewness(self):
+        """
+        偏度 λ^(-1/2)
+        """
+        return 1 / np.sqrt(self.lam)
+
+    def _excess_kurtosis(self):
+        return 1 / self.lam
+
+
+class HyperGeomFamily(_DiscreteFamily):
+    """
+    超几何分布族 HG(N, M, n)
+
+    Property
+    ------
+    N : ndarray[int]
+        总体总数
+    M : ndarray[int]
+        总体中成功元素数量
+    n : ndarray[int]
+        抽样数量
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pmf(k) / logpmf(k) / cdf(k)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('N', 'M', 'n')
+    _params = ('N', 'M', 'n')
+
+    def __init__(self, N, M, n):
+        """
+        参数
+        ------
+        N : array_like[int]
+            总体总数
+        M : array_like[int]
+            0 <= M <= N
+        n : array_like[int]
+            0 <= n <= N
+        """
+        N, M, n = np.broadcast_arrays(np.asarray(N), np.asarray(M), np.asarray(n))
+        if np.any((M < 0) | (M > N)):
+            raise ValueError("M 必须满足 0 <= M <= N")
+        if np.any((n < 0) | (n > N)):
+            raise ValueError("n 必须满足 0 <= n <= N")
+        self.N = N.astype(np.int64)
+        self.M = M.astype(np.int64)
+        self.n = n.astype(np.int64)
+
+    def logpmf(self, k):
+        """
+        log P(X = k) = log C(M, k) + log C(N-M, n-k) - log C(N, n)，由 logfact.log_hypergeom_pmf 计算
+        """
+        k, N, M, n = self._align(k)
+        valid = (k >= np.maximum(0, n + M - N)) & (k <= np.minimum(n, M)) & (k == np.floor(k))
+        out = log_hypergeom_pmf(np.where(valid, k, np.maximum(0, n + M - N)), N, M, n)
+        return np.where(valid, out, -np.inf)
+
+    def cdf(self, k):
+        """
+        P(X <= k)，对支撑集逐点累加 pmf；每一步是一次整体的数组运算，
+        步数为所有参数组里最大的 min(n, M) + 1
+        """
+        k, N, M, n = self._align(k)
+        k = np.floor(k)
+        low = np.maximum(0, n + M - N)
+        high = np.minimum(n, M)
+        out = np.where(k >= high, 1.0, 0.0)
+        mid = (k >= low) & (k < high)
+        if mid.any():
+            k, N, M, n, low = k[mid], N[mid], M[mid], n[mid], low[mid]
+            total = np.zeros(k.shape)
+            for j in range(int(low.min()), int(k.max()) + 1):
+                on = (j >= low) & (j <= k)
+                jj = np.where(on, j, low)
+                term = np.exp(log_hypergeom_pmf(jj, N, M, n))
+                total += np.where(on, term, 0.0)
+            out[mid] = np.minimum(total, 1.0)
+        return out
+
+    def expectation(self):
+        """
+        期望 E[X] = nM/N
+        """
+        return self.n * self.M / self.N
+
+    def variance(self):
+        """
+        方差 Var[X] = n (M/N)(1 - M/N)(N-n)/(N-1)，N = 1 时为 0
+        """
+        r = self.M / self.N
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = self.n * r * (1 - r) * (self.N - self.n) / (self.N - 1)
+        return np.where(self.N > 1, out, 0.0)
+
+    def skewness(self):
+        """
+        偏度 (N-2M)(N-1)^(1/2)(N-2n) / ((nM(N-M)(N-n))^(1/2)(N-2))
+        """
+        N, M, n = (a.astype(float) for a in (self.N, self.M, self.n))
+        return ((N - 2 * M) * np.sqrt(N - 1) * (N - 2 * n)
+                / (np.sqrt(n * M * (N - M) * (N - n)) * (N - 2)))
+
+    def _excess_kurtosis(self):
+        N, M, n = (a.astype(float) for a in (self.N, self.M, self.n))
+        top = ((N - 1) * N ** 2 * (N * (N + 1) - 6 * M * (N - M) - 6 * n * (N - n))
+               + 6 * n * M * (N - M) * (N - n) * (5 * N - 6))
+        return top / (n * M * (N - M) * (N - n) * (N - 2) * (N - 3))
+
+
+class GeomFamily(_DiscreteFamily):
+    """
+    几何分布族 G(p)，X 为首次成功所需的试验次数
+
+    Property
+    ------
+    p : ndarray[float]
+        成功概率，0 < p <= 1
+    shape : tuple
+        参数形状
+
+    Method
+    ------
+    pmf(k) / logpmf(k) / cdf(k)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('p',)
+    _params = ('p',)
+
+    def __init__(self, p):
+        """
+        参数
+        ------
+        p : array_like[float]
+            0 < p <= 1
+        """
+        p = np.asarray(p, dtype=float)
+        if np.any((p <= 0) | (p > 1)):
+            raise ValueError("成功概率 p 必须在 (0, 1] 区间内")
+        self.p = p
+
+    def logpmf(self, k):
+        """
+        log P(X = k) = (k-1) log(1-p) + log p
+        """
+        k, p = self._align(k)
+        valid = (k >= 1) & (k == np.floor(k)) & np.isfinite(k)
+        kk = np.where(valid, k, 1)
+        out = xlog1py(kk - 1, -p) + np.log(p)
+        return np.where(valid, out, -np.inf)
+
+    def cdf(self, k):
+        """
+        P(X <= k) = 1 - (1-p)^k
+        """
+        k, p = self._align(k)
+        k = np.floor(k)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out = -np.expm1(xlog1py(np.maximum(k, 0), -p))
+        return np.where(k >= 1, out, 0.0)
+
+    def expectation(self):
+        """
+        期望 E[X] = 1/p
+        """
+        return 1 / self.p
+
+    def variance(self):
+        """
+        方差 Var[X] = (1-p)/p²
+        """
+        return (1 - self.p) / self.p ** 2
+
+    def skewness(self):
+        """
+        偏度 (2-p)/sqrt(1-p)
+        """
+        with np.errstate(divide='ignore'):
+            return (2 - self.p) / np.sqrt(1 - self.p)
+
+    def _excess_kurtosis(self):
+        with np.errstate(divide='ignore'):
+            return 6 + self.p ** 2 / (1 - self.p)
+
+
+class NormFamily(_Family):
+    """
+    正态分布族 N(mu, sigma²)
+
+    Property
+    ------
+    mu : ndarray[float]
+        均值
+    sigma : ndarray[float]
+        标准差，> 0
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pdf(x) / logpdf(x) / cdf(x)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('mu', 'sigma')
+    _params = ('mu', 'sigma')
+
+    def __init__(self, mu=0.0, sigma=1.0):
+        """
+        参数
+        ------
+        mu : array_like[float]
+        sigma : array_like[float]
+            sigma > 0
+        """
+        mu, sigma = np.broadcast_arrays(np.asarray(mu, dtype=float), np.asarray(sigma, dtype=float))
+        if np.any(sigma <= 0):
+            raise ValueError("sigma 必须为正数")
+        self.mu = mu
+        self.sigma = sigma
+
+    def logpdf(self, x):
+        """
+        log f(x) = -z²/2 - log(σ√(2π))
+        """
+        x, mu, sigma = self._align(x)
+        z = (x - mu) / sigma
+        return -0.5 * z * z - np.log(sigma) - 0.5 * np.log(2 * np.pi)
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x)
+        """
+        return np.exp(self.logpdf(x))
+
+    def cdf(self, x):
+        """
+        P(X <= x) = Φ((x - mu)/sigma)
+        """
+        x, mu, sigma = self._align(x)
+        return ndtr_pair((x - mu) / sigma)[0]
+
+    def expectation(self):
+        """
+        期望 E[X] = mu
+        """
+        return self.mu.copy()
+
+    def variance(self):
+        """
+        方差 Var[X] = sigma²
+        """
+        return self.sigma ** 2
+
+    def skewness(self):
+        """
+        偏度 0
+        """
+        return np.zeros(self.shape)
+
+    def _excess_kurtosis(self):
+        return np.zeros(self.shape)
+
+
+class UniformFamily(_Family):
+    """
+    均匀分布族 U(a, b)
+
+    Property
+    ------
+    a, b : ndarray[float]
+        区间端点，b > a
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pdf(x) / logpdf(x) / cdf(x)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('a', 'b')
+    _params = ('a', 'b')
+
+    def __init__(self, a=0.0, b=1.0):
+        """
+        参数
+        ------
+        a, b : array_like[float]
+            b > a
+        """
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        if np.any(b <= a):
+            raise ValueError("区间参数必须满足 b > a")
+        self.a = a
+        self.b = b
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x) = 1/(b-a)，x ∈ [a, b]
+        """
+        x, a, b = self._align(x)
+        return np.where((x >= a) & (x <= b), 1 / (b - a), 0.0)
+
+    def logpdf(self, x):
+        """
+        log f(x)，区间外为 -inf
+        """
+        x, a, b = self._align(x)
+        return np.where((x >= a) & (x <= b), -np.log(b - a), -np.inf)
+
+    def cdf(self, x):
+        """
+        P(X <= x) = (x-a)/(b-a)，截断到 [0, 1]
+        """
+        x, a, b = self._align(x)
+        return np.clip((x - a) / (b - a), 0.0, 1.0)
+
+    def expectation(self):
+        """
+        期望 E[X] = (a+b)/2
+        """
+        return (self.a + self.b) / 2
+
+    def variance(self):
+        """
+        方差 Var[X] = (b-a)²/12
+        """
+        return (self.b - self.a) ** 2 / 12
+
+    def skewness(self):
+        """
+        偏度 0
+        """
+        return np.zeros(self.shape)
+
+    def _excess_kurtosis(self):
+        return np.full(self.shape, -1.2)
+
+
+class ExpFamily(_Family):
+    """
+    指数分布族 Exp(λ)
+
+    Property
+    ------
+    lam : ndarray[float]
+        速率参数 λ > 0
+    shape : tuple
+        参数形状
+
+    Method
+    ------
+    pdf(x) / logpdf(x) / cdf(x)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('lam',)
+    _params = ('lam',)
+
+    def __init__(self, lam):
+        """
+        参数
+        ------
+        lam : array_like[float]
+            λ > 0
+        """
+        lam = np.asarray(lam, dtype=float)
+        if np.any(lam <= 0):
+            raise ValueError("λ (lambda) 必须为正数")
+        self.lam = lam
+
+    def logpdf(self, x):
+        """
+        log f(x) = log λ - λx，x < 0 时为 -inf
+        """
+        x, lam = self._align(x)
+        return np.where(x >= 0, np.log(lam) - lam * x, -np.inf)
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x) = λ e^(-λx)
+        """
+        return np.exp(self.logpdf(x))
+
+    def cdf(self, x):
+        """
+        P(X <= x) = 1 - e^(-λx)
+        """
+        x, lam = self._align(x)
+        return np.where(x > 0, -np.expm1(-lam * np.maximum(x, 0)), 0.0)
+
+    def expectation(self):
+        """
+        期望 E[X] = 1/λ
+        """
+        return 1 / self.lam
+
+    def variance(self):
+        """
+        方差 Var[X] = 1/λ²
+        """
+        return 1 / self.lam ** 2
+
+    def skewness(self):
+        """
+        偏度 2
+        """
+        return np.full(self.shape, 2.0)
+
+    def _excess_kurtosis(self):
+        return np.full(self.shape, 6.0)
+
+
+class GammaFamily(_Family):
+    """
+    伽马分布族 Gamma(k, λ)，形状参数 k、速率参数 λ
+
+    Property
+    ------
+    k, lam : ndarray[float]
+        均大于 0
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pdf(x) / logpdf(x) / cdf(x)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('k', 'lam')
+    _params = ('k', 'lam')
+
+    def __init__(self, k, lam):
+        """
+        参数
+        ------
+        k : array_like[float]
+            形状参数，> 0
+        lam : array_like[float]
+            速率参数，> 0
+        """
+        k, lam = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(lam, dtype=float))
+        if np.any(k <= 0) or np.any(lam <= 0):
+            raise ValueError("参数 k 和 λ 必须都大于 0")
+        self.k = k
+        self.lam = lam
+
+    def logpdf(self, x):
+        """
+        log f(x) = k log λ + (k-1) log x - λx - log Γ(k)，x <= 0 时为 -inf
+        """
+        x, k, lam = self._align(x)
+        pos = x > 0
+        xx = np.where(pos, x, 1.0)
+        out = k * np.log(lam) + xlogy(k - 1, xx) - lam * xx - gammaln(k)
+        return np.where(pos, out, -np.inf)
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x)
+        """
+        return np.exp(self.logpdf(x))
+
+    def cdf(self, x):
+        """
+        P(X <= x) = P(k, λx)
+        """
+        x, k, lam = self._align(x)
+        return gammainc_pair(k, lam * x)[0]
+
+    def expectation(self):
+        """
+        期望 E[X] = k/λ
+        """
+        return self.k / self.lam
+
+    def variance(self):
+        """
+        方差 Var[X] = k/λ²
+        """
+        return self.k / self.lam ** 2
+
+    def skewness(self):
+        """
+        偏度 2/sqrt(k)
+        """
+        return 2 / np.sqrt(self.k)
+
+    def _excess_kurtosis(self):
+        return 6 / self.k
+
+
+class BetaFamily(_Family):
+    """
+    贝塔分布族 Beta(alpha, beta)
+
+    Property
+    ------
+    alpha, beta : ndarray[float]
+        均大于 0
+    shape : tuple
+        参数广播后的形状
+
+    Method
+    ------
+    pdf(x) / logpdf(x) / cdf(x)
+    expectation() / variance() / std_dev() / coef_variation()
+    skewness() / kurtosis(excess=False)
+    """
+
+    __slots__ = ('alpha', 'beta')
+    _params = ('alpha', 'beta')
+
+    def __init__(self, alpha, beta):
+        """
+        参数
+        ------
+        alpha, beta : array_like[float]
+            均大于 0
+        """
+        alpha, beta = np.broadcast_arrays(np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float))
+        if np.any(alpha <= 0) or np.any(beta <= 0):
+            raise ValueError("alpha 和 beta 必须都大于 0")
+        self.alpha = alpha
+        self.beta = beta
+
+    def logpdf(self, x):
+        """
+        log f(x) = (α-1) log x + (β-1) log(1-x) - log B(α, β)，(0, 1) 外为 -inf
+        """
+        x, a, b = self._align(x)
+        inside = (x > 0) & (x < 1)
+        xx = np.where(inside, x, 0.5)
+        out = (xlogy(a - 1, xx) + xlog1py(b - 1, -xx)
+               - gammaln(a) - gammaln(b) + gammaln(a + b))
+        return np.where(inside, out, -np.inf)
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x)
+        """
+        return np.exp(self.logpdf(x))
+
+    def cdf(self, x):
+        """
+        P(X <= x) = I_x(α, β)
+        """
+        x, a, b = self._align(x)
+        return betainc_pair(a, b, x)[0]
+
+    def expectation(self):
+        """
+        期望 E[X] = α/(α+β)
+        """
+        return self.alpha / (self.alpha + self.beta)
+
+    def variance(self):
+        """
+        方差 Var[X] = αβ/((α+β)²(α+β+1))
+        """
+        s = self.alpha + self.beta
+        return self.alpha * self.beta / (s ** 2 * (s + 1))
+
+    def skewness(self):
+        """
+        偏度 2(β-α)sqrt(α+β+1) / ((α+β+2)sqrt(αβ))
+        """
+        a, b = self.alpha, self.beta
+        return 2 * (b - a) * np.sqrt(a + b + 1) / ((a + b + 2) * np.sqrt(a * b))
+
+    def _excess_kurtosis(self):
+        a, b = self.alpha, self.beta
+        return (6 * ((a - b) ** 2 * (a + b + 1) - a * b * (a + b + 2))
+                / (a * b * (a + b + 2) * (a + b + 3)))
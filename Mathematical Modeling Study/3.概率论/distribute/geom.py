@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 09:38
+    @file  : geom.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order, raw_from_cumulants, central_from_cumulants
+from ._lazy import lazy
+from . import _vspecial
+from ._special import log1mexp, xlog1py
+from ._vector import is_scalar, check_q
+
+class Geom:
+    """
+    几何分布类：表示第一次成功所需的试验次数（X ∈ {1, 2, 3, ...}）
+
+    属性
+    ------
+    p : float
+        每次伯努利试验成功的概率（0 < p <= 1）
+
+    方法
+    ------
+    pmf(k)               返回 P(X = k)：第 k 次试验才成功的概率
+    cdf(k)               返回 P(X <= k)：在前 k 次试验中至少成功一次的概率
+    sf(k)                生存函数 P(X > k) = (1-p)^k
+    logpmf(k)            对数概率质量函数 log P(X = k)
+    logcdf(k)            对数累积分布函数 log P(X <= k)
+    logsf(k)             对数生存函数 log P(X > k) = k log(1 - p)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m)        m 阶原点矩 E[X^m]
+    central_moment(m)    m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = min{k: CDF(k) >= q}
+    isf(q)               逆生存函数 ISF(q) = min{k: SF(k) <= q}
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X] = (2 - p) / sqrt(1 - p)
+    kurtosis(excess=False)
+                         峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('p', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, p):
+        """
+        初始化几何分布对象
+
+        参数
+        ------
+        p : float
+            每次试验成功的概率，必须满足 0 < p <= 1
+        """
+        if not (0 < p <= 1):
+            raise ValueError("成功概率 p 必须在 (0, 1] 区间内")
+        self.p = p
+
+    def pmf(self, k):
+        """
+        概率质量函数：P(X = k)
+
+        参数
+        ------
+        k : int 或 array_like
+            第 k 次才成功
+
+        返回
+        ------
+        float 或 ndarray : P(X = k)
+        """
+        if not is_scalar(k):
+            k = np.asarray(k, dtype=float)
+            return np.where(k < 1, 0.0, (1 - self.p) ** (np.maximum(k, 1) - 1) * self.p)
+        if k < 1:
+            return 0.0
+        return (1 - self.p) ** (k - 1) * self.p
+
+    def cdf(self, k):
+        """
+        累积分布函数：P(X <= k)
+
+        参数
+        ------
+        k : int 或 array_like
+            最大尝试次数
+
+        返回
+        ------
+        float 或 ndarray : P(X <= k)
+        """
+        if not is_scalar(k):
+            return -np.expm1(self.logsf(k))
+        if k < 1:
+            return 0.0
+        return -math.expm1(xlog1py(k, -self.p))
+
+    def sf(self, k):
+        """
+        生存函数 P(X > k) = (1 - p)^k，前 k 次试验全部失败的概率
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > k)
+        """
+        if not is_scalar(k):
+            return np.exp(self.logsf(k))
+        if k < 1:
+            return 1.0
+        return math.exp(xlog1py(k, -self.p))
+
+    def logpmf(self, k):
+        """
+        对数概率质量函数 log P(X = k) = (k - 1) log(1 - p) + log p
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X = k)
+        """
+        if not is_scalar(k):
+            k = np.asarray(k, dtype=float)
+            return np.where(k < 1, -math.inf, _vspecial.xlog1py(k - 1, -self.p) + math.log(self.p))
+        if k < 1:
+            return -math.inf
+        return xlog1py(k - 1, -self.p) + math.log(self.p)
+
+    def logcdf(self, k):
+        """
+        对数累积分布函数 log P(X <= k) = log(1 - (1 - p)^k)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X <= k)
+        """
+        if not is_scalar(k):
+            return _vspecial.log1mexp(self.logsf(k))
+        if k < 1:
+            return -math.inf
+        return log1mexp(xlog1py(k, -self.p))
+
+    def logsf(self, k):
+        """
+        对数生存函数 log P(X > k) = k log(1 - p)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X > k)
+        """
+        if not is_scalar(k):
+            k = np.asarray(k, dtype=float)
+            return np.where(k < 1, 0.0, _vspecial.xlog1py(k, -self.p))
+        if k < 1:
+            return 0.0
+        return xlog1py(k, -self.p)
+
+    def expectation(self):
+        """
+        返回期望 E[X] = 1 / p
+        """
+        return 1 / self.p
+
+    def variance(self):
+        """
+        返回方差 Var[X] = (1 - p) / p^2
+        """
+        return (1 - self.p) / (self.p ** 2)
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = sqrt(Var[X])
+        """
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.std / mu if mu != 0 else float('inf')
+
+    def _failure_cumulants(self, m):
+        """
+        失败次数 Y = X - 1 的累积量 [κ_1, ..., κ_m]
+
+        κ_r = Li_{1-r}(1-p) = P_r(t)，t = (1-p)/p，P_1(t) = t，P_{r+1}(t) = t(1+t) P_r'(t)，系数全为正。
+        直接递推各项 d_j = c_j t^j：d_j <- j d_j + (j-1) t d_{j-1}，每项不超过 κ_r 本身，不会提前上溢
+        """
+        t = (1 - self.p) / self.p
+        d = [0.0, t]
+        out = [t]
+        for r in range(1, m):
+            d = [0.0] + [j * d[j] + (j - 1) * t * d[j - 1] for j in range(1, r + 1)] + [r * t * d[r]]
+            out.append(sum(d))
+        return out
+
+    def raw_moment(self, m):
+        """
+        m 阶原点矩 E[X^m]，X = Y + 1 的累积量为 κ_1 + 1 与 κ_r (r >= 2)，由累积量递推
+        """
+        check_order(m)
+        kap = self._failure_cumulants(m)
+        return raw_from_cumulants(m, lambda r: kap[0] + 1 if r == 1 else kap[r - 1])
+
+    def central_moment(self, m):
+        """
+        m 阶中心矩 E[(X - μ)^m] = E[(Y - E[Y])^m]，由 Y 的累积量递推，各项同号，浮点运算不抵消
+        """
+        check_order(m)
+        kap = self._failure_cumulants(m)
+        return central_from_cumulants(m, lambda r: kap[r - 1])
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = min{k: CDF(k) >= q}
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : 分位数 k，q = 1 时为 inf
+        """
+        # 由 1 - (1-p)^k >= q 得 k = ceil(log(1-q) / log(1-p))，
+        # 再用 CDF 校正浮点舍入造成的 ±1 偏差，耗时与 k 的大小无关
+        scalar = is_scalar(q)
+        q = check_q(q)
+        if self.p == 1:
+            k = np.ones(q.shape)
+        else:
+            rate = math.log1p(-self.p)
+            with np.errstate(divide='ignore'):
+                k = np.maximum(np.ceil(np.log1p(-q) / rate), 1)
+            k = np.where((k > 1) & (-np.expm1((k - 1) * rate) >= q), k - 1, k)
+            k = np.where(-np.expm1(k * rate) < q, k + 1, k)
+        if scalar:
+            k = float(k)
+            return int(k) if k < math.inf else k
+        return k.astype(int) if np.isfinite(k).all() else k
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = min{k: SF(k) <= q}
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : k，q = 0 时为 inf
+        """
+        # 由 (1-p)^k <= q 得 k = ceil(log q / log(1-p))，直接用 log q，
+        # q 很小时不经过 1 - q；再用 SF 校正浮点舍入造成的 ±1 偏差
+        scalar = is_scalar(q)
+        q = check_q(q)
+        if self.p == 1:
+            k = np.ones(q.shape)
+        else:
+            rate = math.log1p(-self.p)
+            with np.errstate(divide='ignore'):
+                k = np.maximum(np.ceil(np.log(q) / rate), 1)
+            k = np.where((k > 1) & (np.exp((k - 1) * rate) <= q), k - 1, k)
+            k = np.where(np.exp(k * rate) > q, k + 1, k)
+        if scalar:
+            k = float(k)
+            return int(k) if k < math.inf else k
+        return k.astype(int) if np.isfinite(k).all() else k
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样，调用 Generator.geometric（支撑集同为 {1, 2, ...}）
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        int 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return rng.geometric(self.p, size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = (2 - p) / sqrt(1 - p)
+        """
+        return (2 - self.p) / math.sqrt(1 - self.p)
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度
+
+        返回
+        ------
+        float : 峰度值
+        """
+        ex = (6 + self.p ** 2 / (1 - self.p))
+        return ex if excess else ex + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$几何分布：X~Geom(p={self.p})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 09:33
+    @file  : norm.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order
+from ._lazy import lazy
+from .integrate import quad
+from . import _vspecial
+from ._special import log_ndtr, ndtri
+from ._vector import is_scalar, check_q
+
+
+def _phi(z):
+    """标准正态密度 φ(z)，数值积分的被积函数用"""
+    return np.exp(-0.5 * z * z) / math.sqrt(2 * math.pi)
+
+
+class Norm:
+    r"""
+    正态分布类（Normal Distribution）
+
+    属性
+    ------
+    mu : float
+        均值（期望），决定曲线中心位置
+    sigma : float
+        标准差，决定曲线宽度，必须 > 0
+
+    方法
+    ------
+    pdf(x)               返回概率密度函数 f(x)
+    cdf(x)               返回累积分布函数 P(X <= x)
+    sf(x)                生存函数 P(X > x)，用 erfc 直接计算上尾
+    logpdf(x)            对数概率密度 log f(x)
+    logcdf(x)            对数累积分布函数 log P(X <= x)
+    logsf(x)             对数生存函数 log P(X > x)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m, tol=None) m 阶原点矩 E[X^m]（默认解析式）
+    central_moment(m, tol=None) m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = μ + σΦ^{-1}(q)
+    isf(q)               逆生存函数 ISF(q) = μ - σΦ^{-1}(q)
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    __str__()            分布概要信息
+    """
+
+    __slots__ = ('mu', 'sigma', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, mu=0.0, sigma=1.0):
+        """
+        初始化正态分布
+
+        参数
+        ------
+        mu : float
+            分布均值（μ）
+        sigma : float
+            分布标准差（σ），必须为正数
+        """
+        if sigma <= 0:
+            raise ValueError("sigma 必须为正数")
+        self.mu = mu
+        self.sigma = sigma
+
+    def pdf(self, x):
+        """
+        概率密度函数 PDF：f(x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : 密度值
+        """
+        coeff = 1 / (self.sigma * math.sqrt(2 * math.pi))
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return coeff * np.exp(-((x - self.mu) ** 2) / (2 * self.sigma ** 2))
+        exponent = -((x - self.mu) ** 2) / (2 * self.sigma ** 2)
+        return coeff * math.exp(exponent)
+
+    def cdf(self, x):
+        """
+        累积分布函数 CDF：P(X <= x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : 累计概率
+        """
+        # Φ(z) = erfc(-z/√2) / 2，左尾不经过 1 + erf 的抵消
+        if not is_scalar(x):
+            return _vspecial.ndtr_pair((np.asarray(x, dtype=float) - self.mu) / self.sigma)[0]
+        z = (x - self.mu) / (self.sigma * math.sqrt(2))
+        return 0.5 * math.erfc(-z)
+
+    def sf(self, x):
+        """
+        生存函数 P(X > x) = erfc(z/√2) / 2，右尾直接由 erfc 算出，不经过 1 - CDF
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > x)
+        """
+        if not is_scalar(x):
+            return _vspecial.ndtr_pair((np.asarray(x, dtype=float) - self.mu) / self.sigma)[1]
+        z = (x - self.mu) / (self.sigma * math.sqrt(2))
+        return 0.5 * math.erfc(z)
+
+    def logpdf(self, x):
+        """
+        对数概率密度 log f(x) = -(x-μ)²/(2σ²) - log σ - log(2π)/2
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+        z = (x - self.mu) / self.sigma
+        return -0.5 * z ** 2 - math.log(self.sigma) - 0.5 * math.log(2 * math.pi)
+
+    def logcdf(self, x):
+        """
+        对数累积分布函数 log P(X <= x)，远端左尾用渐近展开，不会下溢为 -inf
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        if not is_scalar(x):
+            return _vspecial.log_ndtr((np.asarray(x, dtype=float) - self.mu) / self.sigma)
+        return log_ndtr((x - self.mu) / self.sigma)
+
+    def logsf(self, x):
+        """
+        对数生存函数 log P(X > x) = log Φ(-(x-μ)/σ)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        if not is_scalar(x):
+            return _vspecial.log_ndtr(-(np.asarray(x, dtype=float) - self.mu) / self.sigma)
+        return log_ndtr(-(x - self.mu) / self.sigma)
+
+    def expectation(self):
+        """
+        返回期望 E[X] = μ
+        """
+        return self.mu
+
+    def variance(self):
+        """
+        返回方差 Var[X] = σ^2
+        """
+        return self.sigma ** 2
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = σ
+        """
+        return self.sigma
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        return self.std / self.E if self.E != 0 else float('inf')
+
+    def raw_moment(self, m, tol=None):
+        """
+        m 阶原点矩 E[X^m] = Σ_{j 偶} C(m, j) μ^{m-j} σ^j (j-1)!!
+        指定 tol 时改用自适应数值积分 ∫ (μ + σz)^m φ(z) dz（integrate.quad，积分区间为整条实轴）
+
+        参数
+        ------
+        m : int 阶数
+        tol : float or None 数值积分的相对误差目标，None 表示用解析式
+
+        返回
+        ------
+        float
+        """
+        check_order(m)
+        if tol is None:
+            total = 0.0
+            double_fact = 1  # (j-1)!!
+            for j in range(0, m + 1, 2):
+                total += math.comb(m, j) * self.mu ** (m - j) * self.sigma ** j * double_fact
+                double_fact *= j + 1
+            return total
+        mu, sigma = self.mu, self.sigma
+        return quad(lambda z: (mu + sigma * z) ** m * _phi(z), -math.inf, math.inf, tol)[0]
+
+    def central_moment(self, m, tol=None):
+        """
+        m 阶中心矩 E[(X - μ)^m]：奇数阶为 0，偶数阶为 σ^m (m-1)!!
+        指定 tol 时改用自适应数值积分 σ^m ∫ z^m φ(z) dz
+
+        参数
+        ------
+        m : int 阶数
+        tol : float or None 数值积分的相对误差目标，None 表示用解析式
+
+        返回
+        ------
+        float
+        """
+        check_order(m)
+        if tol is None:
+            if m % 2:
+                return 0.0
+            return float(self.sigma ** m * math.prod(range(1, m, 2)))
+        return self.sigma ** m * quad(lambda z: z ** m * _phi(z), -math.inf, math.inf, tol)[0]
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = μ + σ Φ^{-1}(q)
+        Φ^{-1} 用 Acklam 有理逼近加一步 Halley 修正，达到机器精度，不再迭代求解
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : q = 0 / 1 时为 -inf / inf
+        """
+        if not is_scalar(q):
+            return self.mu + self.sigma * _vspecial.ndtri(check_q(q))
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return self.mu + self.sigma * ndtri(q)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = μ - σ Φ^{-1}(q)
+        ndtri 对小概率 q 直接求解，右尾不经过 1 - q
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : q = 0 / 1 时为 inf / -inf
+        """
+        if not is_scalar(q):
+            return self.mu - self.sigma * _vspecial.ndtri(check_q(q))
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return self.mu - self.sigma * ndtri(q)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样 μ + σZ，Z 由 Generator.standard_normal（ziggurat 算法）生成
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return self.mu + self.sigma * rng.standard_normal(size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = 0
+        """
+        return 0.0
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度
+
+        返回
+        ------
+        float
+        """
+        ex = 0.0
+        return ex if excess else ex + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$正态分布：X~N(\\mu={self.mu}, \\sigma={self.sigma})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 09:24
+    @file  : poisson.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order, raw_from_cumulants, central_from_cumulants
+from ._lazy import lazy
+from ._special import gammainc, gammaincc, log_gammainc_pair
+from . import _vspecial
+from .logfact import log_poisson_pmf
+from ._vector import is_scalar, cumulative_table, table_quantile, survival_table, table_isf
+
+class Poisson:
+    """
+    泊松分布类：使用纯数学方法计算泊松分布的概率特性
+
+    属性
+    ------
+    lam : float
+        单位时间（或单位面积、体积）内的平均事件发生次数 λ（lambda）
+
+    方法
+    ------
+    pmf(k)               计算概率质量函数 P(X = k)
+    cdf(k)               计算累积分布函数 P(X <= k)
+    sf(k)                生存函数 P(X > k)，直接计算上尾
+    logpmf(k)            对数概率质量函数 log P(X = k)
+    logcdf(k)            对数累积分布函数 log P(X <= k)
+    logsf(k)             对数生存函数 log P(X > k)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m)        m 阶原点矩 E[X^m]
+    central_moment(m)    m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = min{k: CDF(k) >= q}
+    isf(q)               逆生存函数 ISF(q) = min{k: SF(k) <= q}
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('lam', '_E', '_Var', '_std', '_coef', '_skew', '_kurt', '_cum_table', '_sf_table')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+    # 分位数查找用的累积分布表，第一次调用 quantile 时构造
+    cum_table = lazy('_cumulative_table')
+    # 逆生存函数查找用的生存函数表，第一次调用 isf 时构造
+    sf_table = lazy('_survival_table')
+
+    def __init__(self, lam):
+        """
+        初始化泊松分布对象
+
+        参数
+        ------
+        lam : float
+            平均事件发生率 λ，必须大于 0
+        """
+        if lam <= 0:
+            raise ValueError("λ (lambda) 必须为正数")
+        self.lam = lam
+
+    def pmf(self, k):
+        """
+        概率质量函数 PMF
+
+        参数
+        ------
+        k : int 或 array_like
+            事件发生的次数
+
+        返回
+        ------
+        float 或 ndarray : P(X = k)
+        """
+        if not is_scalar(k):
+            return np.exp(self.logpmf(k))
+        if k < 0:
+            return 0.0
+        return math.exp(log_poisson_pmf(k, self.lam))
+
+    def _tails(self, k, log=False):
+        """
+        数组输入的 (P(X <= k), P(X > k))，k >= 0 的有限值一次调用 _vspecial.gammainc_pair；
+        log=True 时改用 log_gammainc_pair 返回对数值，k 为 nan 的元素两者都是 nan
+        """
+        k = np.floor(np.asarray(k, dtype=float))
+        one, zero = (0.0, -math.inf) if log else (1.0, 0.0)
+        cdf = np.where(k >= 0, one, zero)
+        sf = np.where(k < 0, one, zero)
+        mid = (k >= 0) & np.isfinite(k)
+        if mid.any():
+            pair = _vspecial.log_gammainc_pair if log else _vspecial.gammainc_pair
+            sf[mid], cdf[mid] = pair(k[mid] + 1, self.lam)
+        nan = np.isnan(k)
+        cdf[nan] = sf[nan] = np.nan
+        return cdf, sf
+
+    def cdf(self, k):
+        """
+        累积分布函数 CDF
+        P(X <= k) = Q(k+1, λ)，用正则化上不完全伽马函数计算，耗时与 k 无关
+
+        参数
+        ------
+        k : int 或 array_like
+            事件发生次数的上限
+
+        返回
+        ------
+        float 或 ndarray : P(X <= k)
+        """
+        if not is_scalar(k):
+            return self._tails(k)[0]
+        if k < 0:
+            return 0.0
+        return gammaincc(math.floor(k) + 1, self.lam)
+
+    def sf(self, k):
+        """
+        生存函数 P(X > k) = P(k+1, λ)
+        直接用正则化下不完全伽马函数算上尾，不经过 1 - CDF
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > k)
+        """
+        if not is_scalar(k):
+            return self._tails(k)[1]
+        if k < 0:
+            return 1.0
+        return gammainc(math.floor(k) + 1, self.lam)
+
+    def logpmf(self, k):
+        """
+        对数概率质量函数 log P(X = k) = k log λ - λ - log k!
+        用 logfact.log_poisson_pmf 的鞍点展开，k 很大时不溢出，也不因 k log λ 与 log k! 的抵消丢失精度
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X = k)
+        """
+        return log_poisson_pmf(k, self.lam)
+
+    def logcdf(self, k):
+        """
+        对数累积分布函数 log P(X <= k) = log Q(k+1, λ)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X <= k)
+        """
+        if not is_scalar(k):
+            return self._tails(k, log=True)[0]
+        if k < 0:
+            return -math.inf
+        return log_gammainc_pair(math.floor(k) + 1, self.lam)[1]
+
+    def logsf(self, k):
+        """
+        对数生存函数 log P(X > k) = log P(k+1, λ)
+
+        参数
+        ------
+        k : int 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : log P(X > k)
+        """
+        if not is_scalar(k):
+            return self._tails(k, log=True)[1]
+        if k < 0:
+            return 0.0
+        return log_gammainc_pair(math.floor(k) + 1, self.lam)[0]
+
+    def expectation(self):
+        """
+        返回期望 E[X] = λ
+        """
+        return self.lam
+
+    def variance(self):
+        """
+        返回方差 Var[X] = λ
+        """
+        return self.lam
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = sqrt(λ)
+        """
+        return math.sqrt(self.lam)
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.std / mu if mu != 0 else float('inf')
+
+    def raw_moment(self, m):
+        """
+        m 阶原点矩 E[X^m] = Σ S(m, j) λ^j（Touchard 多项式）
+        由累积量 κ_r = λ 递推，各项同号，浮点运算不抵消
+        """
+        check_order(m)
+        return raw_from_cumulants(m, lambda r: self.lam)
+
+    def central_moment(self, m):
+        """
+        m 阶中心矩 E[(X - μ)^m]，由累积量 κ_r = λ 递推
+        """
+        check_order(m)
+        return central_from_cumulants(m, lambda r: self.lam)
+
+    def _cumulative_table(self):
+        """
+        μ ± (12σ + 20) 范围内的累积分布表，见 cumulative_table
+        """
+        return cumulative_table(self.logpmf, self.cdf, self.E, self.std, 0)
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = min{k: CDF(k) >= q}
+        在缓存的累积分布表上二分查找；q = 1 时返回表的右端（CDF 在双精度下已等于 1）
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : 分位数 k
+        """
+        return table_quantile(self.cum_table, self.cdf, q, 0)
+
+    def _survival_table(self):
+        """
+        μ ± (12σ + 20) 范围内的生存函数表，见 survival_table
+        """
+        return survival_table(self.logpmf, self.sf, self.E, self.std, 0)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = min{k: P(X > k) <= q}
+        在缓存的生存函数表上二分查找，q 是 1e-12 这样的极小尾概率时也不经过 1 - q
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        int 或 ndarray : k
+        """
+        return table_isf(self.sf_table, self.sf, q, 0)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样
+        调用 Generator.poisson：λ >= 10 时为 PTRS 变换拒绝法，λ 较小时为逆变换
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        int 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return rng.poisson(self.lam, size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = 1 / sqrt(λ)
+        """
+        return 1 / math.sqrt(self.lam)
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度
+
+        返回
+        ------
+        float
+        """
+        ex = 1 / self.lam
+        return ex if excess else ex + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$泊松分布：X~P(\\lambda={self.lam})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
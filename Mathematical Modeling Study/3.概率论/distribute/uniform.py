@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/1 10:15
+    @file  : uniform.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order
+from ._lazy import lazy
+from .integrate import quad
+from ._vector import is_scalar, check_q
+
+class Uniform:
+    """
+    连续型均匀分布类（Uniform Distribution）
+
+    表示一个在 [a, b] 区间上均匀分布的随机变量
+
+    属性
+    ------
+    a : float
+        区间左端点
+    b : float
+        区间右端点（必须 a < b）
+
+    方法
+    ------
+    pdf(x)               概率密度函数 f(x)
+    cdf(x)               累积分布函数 P(X <= x)
+    sf(x)                生存函数 P(X > x)
+    logpdf(x)            对数概率密度 log f(x)
+    logcdf(x)            对数累积分布函数 log P(X <= x)
+    logsf(x)             对数生存函数 log P(X > x)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m, tol=None) m 阶原点矩 E[X^m]（默认解析式）
+    central_moment(m, tol=None) m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = a + q(b-a)
+    isf(q)               逆生存函数 ISF(q) = b - q(b-a)
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    __str__()            分布概要信息
+    """
+
+    __slots__ = ('a', 'b', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, a, b):
+        """
+        初始化均匀分布对象
+
+        参数
+        ------
+        a : float
+            区间起点
+        b : float
+            区间终点，需满足 b > a
+        """
+        if b <= a:
+            raise ValueError("区间参数必须满足 b > a")
+        self.a = a
+        self.b = b
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : 对应的密度值
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            out = np.where((self.a <= x) & (x <= self.b), 1 / (self.b - self.a), 0.0)
+            return np.where(np.isnan(x), np.nan, out)
+        if self.a <= x <= self.b:
+            return 1 / (self.b - self.a)
+        return math.nan if math.isnan(x) else 0.0
+
+    def cdf(self, x):
+        """
+        累积分布函数 P(X <= x)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : 累计概率
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.clip((x - self.a) / (self.b - self.a), 0.0, 1.0)
+        if x < self.a:
+            return 0.0
+        if x > self.b:
+            return 1.0
+        return (x - self.a) / (self.b - self.a)
+
+    def sf(self, x):
+        """
+        生存函数 P(X > x) = (b - x)/(b - a)
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > x)
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            return np.clip((self.b - x) / (self.b - self.a), 0.0, 1.0)
+        if x < self.a:
+            return 1.0
+        if x > self.b:
+            return 0.0
+        return (self.b - x) / (self.b - self.a)
+
+    def logpdf(self, x):
+        """
+        对数概率密度 log f(x)，区间外为 -inf
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            x = np.asarray(x, dtype=float)
+            out = np.where((self.a <= x) & (x <= self.b), -math.log(self.b - self.a), -math.inf)
+            return np.where(np.isnan(x), np.nan, out)
+        if self.a <= x <= self.b:
+            return -math.log(self.b - self.a)
+        return math.nan if math.isnan(x) else -math.inf
+
+    def logcdf(self, x):
+        """
+        对数累积分布函数 log P(X <= x)
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            with np.errstate(divide='ignore'):
+                return np.log(self.cdf(x))
+        if x <= self.a:
+            return -math.inf
+        if x >= self.b:
+            return 0.0
+        return math.log((x - self.a) / (self.b - self.a))
+
+    def logsf(self, x):
+        """
+        对数生存函数 log P(X > x)
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            with np.errstate(divide='ignore'):
+                return np.log(self.sf(x))
+        if x <= self.a:
+            return 0.0
+        if x >= self.b:
+            return -math.inf
+        return math.log((self.b - x) / (self.b - self.a))
+
+    def expectation(self):
+        """
+        返回期望 E[X] = (a + b) / 2
+        """
+        return (self.a + self.b) / 2
+
+    def variance(self):
+        """
+        返回方差 Var[X] = (b - a)^2 / 12
+        """
+        return ((self.b - self.a) ** 2) / 12
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = sqrt(Var[X])
+        """
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        mu = self.E
+        return self.std / mu if mu != 0 else float('inf')
+
+    def raw_moment(self, m, tol=None):
+        """
+        m 阶原点矩 E[X^m] = (b^{m+1} - a^{m+1}) / ((m+1)(b-a)) = Σ_{i=0}^m a^i b^{m-i} / (m+1)
+        指定 tol 时改用自适应数值积分（integrate.quad）
+
+        参数
+        ------
+        m : int 阶数
+        tol : float or None 数值积分的相对误差目标，None 表示用解析式
+        """
+        check_order(m)
+        if tol is None:
+            return sum(self.a ** i * self.b ** (m - i) for i in range(m + 1)) / (m + 1)
+        return quad(lambda x: x ** m, self.a, self.b, tol)[0] / (self.b - self.a)
+
+    def central_moment(self, m, tol=None):
+        """
+        m 阶中心矩 E[(X - μ)^m]：奇数阶为 0，偶数阶为 ((b-a)/2)^m / (m+1)
+        指定 tol 时改用自适应数值积分（integrate.quad）
+
+        参数
+        ------
+        m : int 阶数
+        tol : float or None 数值积分的相对误差目标，None 表示用解析式
+        """
+        check_order(m)
+        if tol is None:
+            if m % 2:
+                return 0.0
+            return ((self.b - self.a) / 2) ** m / (m + 1)
+        mu = self.E
+        return quad(lambda x: (x - mu) ** m, self.a, self.b, tol)[0] / (self.b - self.a)
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = a + q (b - a)
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+        """
+        if not is_scalar(q):
+            return self.a + check_q(q) * (self.b - self.a)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return self.a + q * (self.b - self.a)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = b - q (b - a)
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+        """
+        if not is_scalar(q):
+            return self.b - check_q(q) * (self.b - self.a)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        return self.b - q * (self.b - self.a)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样 a + (b - a)U
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return self.a + (self.b - self.a) * rng.random(size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = 0
+        """
+        return 0.0
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool 是否返回超额峰度
+        """
+        ex = -6/5
+        return ex if excess else ex + 3
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$均匀分布：X~U(a={self.a}, b={self.b})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+    @author: 数模加油站
+    @time  : 2025/8/9 16:05
+    @file  : weibull.py
+"""
+
+import math
+
+import numpy as np
+
+from ._moments import check_order
+from ._lazy import lazy
+from . import _vspecial
+from ._special import log1mexp
+from ._vector import is_scalar, check_q
+
+
+class Weibull:
+    """
+    威布尔分布类（Weibull Distribution），可靠性分析中最常用的寿命分布
+
+    F(x) = 1 - exp(-(x/λ)^k)，k < 1 故障率递减（早期失效），k = 1 即指数分布，k > 1 故障率递增（耗损）
+
+    属性
+    ------
+    k : float
+        形状参数 k > 0
+    scale : float
+        尺度参数 λ > 0（特征寿命，P(X <= λ) = 1 - 1/e）
+
+    方法
+    ------
+    pdf(x)               概率密度函数 f(x)
+    cdf(x)               累积分布函数 P(X <= x)
+    sf(x)                生存函数 P(X > x) = exp(-(x/λ)^k)
+    logpdf(x)            对数概率密度 log f(x)
+    logcdf(x)            对数累积分布函数 log P(X <= x)
+    logsf(x)             对数生存函数 log P(X > x) = -(x/λ)^k
+    hazard(x)            故障率函数 h(x) = f(x) / P(X > x)
+    expectation()        返回期望 E[X]
+    variance()           返回方差 Var[X]
+    std_dev()            返回标准差 Std[X]
+    coef_variation()     变异系数 CV = Std[X]/E[X]
+    raw_moment(m)        m 阶原点矩 E[X^m]
+    central_moment(m)    m 阶中心矩 E[(X - μ)^m]
+    quantile(q)          分位数 Q(q) = λ(-ln(1-q))^{1/k}
+    isf(q)               逆生存函数 ISF(q) = λ(-ln q)^{1/k}
+    rvs(size=None, rng=None) 随机抽样
+    skewness()           偏度 Skew[X]
+    kurtosis(excess=False) 峰度 Kurt[X] 或 超额峰度
+    """
+
+    __slots__ = ('k', 'scale', '_E', '_Var', '_std', '_coef', '_skew', '_kurt')
+
+    # 统计量在首次访问时才计算并缓存，构造对象只校验参数
+    E = lazy('expectation')
+    Var = lazy('variance')
+    std = lazy('std_dev')
+    coef = lazy('coef_variation')
+    skew = lazy('skewness')
+    kurt = lazy('kurtosis')
+
+    def __init__(self, k, scale=1.0):
+        """
+        初始化威布尔分布
+
+        参数
+        ------
+        k : float
+            形状参数，必须大于 0
+        scale : float
+            尺度参数 λ，必须大于 0
+        """
+        if k <= 0 or scale <= 0:
+            raise ValueError("参数 k 和 scale 必须都大于 0")
+        self.k = k
+        self.scale = scale
+
+    def _power(self, x):
+        """(x/λ)^k，x < 0 处取 0，数组输入返回数组"""
+        if not is_scalar(x):
+            return (np.maximum(np.asarray(x, dtype=float), 0) / self.scale) ** self.k
+        return (max(x, 0) / self.scale) ** self.k
+
+    def pdf(self, x):
+        """
+        概率密度函数 f(x) = (k/λ)(x/λ)^{k-1} exp(-(x/λ)^k)，由 logpdf 取指数
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : f(x)
+        """
+        if not is_scalar(x):
+            return np.exp(self.logpdf(x))
+        return math.exp(self._logpdf(x))
+
+    def cdf(self, x):
+        """
+        累积分布函数 P(X <= x) = 1 - exp(-(x/λ)^k)，用 expm1 计算，左尾不丢精度
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X <= x)
+        """
+        if not is_scalar(x):
+            return -np.expm1(-self._power(x))
+        return -math.expm1(-self._power(x))
+
+    def sf(self, x):
+        """
+        生存函数 P(X > x) = exp(-(x/λ)^k)，右尾直接算出，不经过 1 - CDF
+
+        参数
+        ------
+        x : float 或 array_like
+
+        返回
+        ------
+        float 或 ndarray : P(X > x)
+        """
+        if not is_scalar(x):
+            return np.exp(-self._power(x))
+        return math.exp(-self._power(x))
+
+    def logpdf(self, x):
+        """
+        对数概率密度 log f(x) = log(k/λ) + (k-1) log(x/λ) - (x/λ)^k
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            const = math.log(self.k / self.scale)
+            x = np.asarray(x, dtype=float)
+            # 条件写成 x <= 0 / x < 0，nan 落在计算分支里，结果仍为 nan
+            t = np.where(x <= 0, self.scale, x) / self.scale
+            out = np.where(x < 0, -math.inf, const + (self.k - 1) * np.log(t) - t ** self.k)
+            return np.where(x == 0, self._logpdf(0.0), out)
+        return self._logpdf(x)
+
+    def _logpdf(self, x):
+        """logpdf 的标量路径，pdf 直接调用，不再重复判断输入类型"""
+        if x < 0:
+            return -math.inf
+        const = math.log(self.k / self.scale)
+        if x == 0:
+            # k < 1 时密度发散，k = 1 时为 1/λ，k > 1 时为 0
+            return math.inf if self.k < 1 else (const if self.k == 1 else -math.inf)
+        t = x / self.scale
+        return const + (self.k - 1) * math.log(t) - t ** self.k
+
+    def logcdf(self, x):
+        """
+        对数累积分布函数 log P(X <= x) = log(1 - exp(-(x/λ)^k))
+        右尾 exp(-(x/λ)^k) 很小时用 log1p 计算，不被 1 - exp 的舍入吞掉
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        if not is_scalar(x):
+            return _vspecial.log1mexp(-self._power(x))
+        return log1mexp(-self._power(x))
+
+    def logsf(self, x):
+        """
+        对数生存函数 log P(X > x) = -(x/λ)^k
+
+        参数
+        ------
+        x : float 或 array_like
+        """
+        return -self._power(x)
+
+    def hazard(self, x):
+        """
+        故障率函数 h(x) = (k/λ)(x/λ)^{k-1}
+
+        参数
+        ------
+        x : float 或 array_like, x >= 0
+        """
+        if not is_scalar(x):
+            x = np.maximum(np.asarray(x, dtype=float), 0)
+            with np.errstate(divide='ignore'):
+                return self.k / self.scale * (x / self.scale) ** (self.k - 1)
+        if x < 0:
+            return 0.0
+        if x == 0 and self.k < 1:
+            return math.inf
+        return self.k / self.scale * (x / self.scale) ** (self.k - 1)
+
+    def expectation(self):
+        """
+        返回期望 E[X] = λ Γ(1 + 1/k)
+        """
+        return self.raw_moment(1)
+
+    def variance(self):
+        """
+        返回方差 Var[X] = λ² [Γ(1 + 2/k) - Γ(1 + 1/k)²]
+        """
+        return self.central_moment(2)
+
+    def std_dev(self):
+        """
+        返回标准差 Std[X] = sqrt(Var[X])
+        """
+        return math.sqrt(self.variance())
+
+    def coef_variation(self):
+        """
+        变异系数 CV = Std[X] / E[X]
+        """
+        return self.std / self.E
+
+    def raw_moment(self, m):
+        """
+        m 阶原点矩 E[X^m] = λ^m Γ(1 + m/k)，在对数空间计算，k 很小时不溢出
+        """
+        check_order(m)
+        return math.exp(m * math.log(self.scale) + math.lgamma(1 + m / self.k))
+
+    def central_moment(self, m):
+        """
+        m 阶中心矩 E[(X - μ)^m]
+        对标准化变量 X/λ 的原点矩做二项展开，再乘 λ^m；展开要用到一阶矩 g[1]，m = 0 时也算出来
+        """
+        check_order(m)
+        g = [math.exp(math.lgamma(1 + i / self.k)) for i in range(max(m, 1) + 1)]
+        total = math.fsum(math.comb(m, i) * g[i] * (-g[1]) ** (m - i) for i in range(m + 1))
+        return total * self.scale ** m
+
+    def quantile(self, q):
+        """
+        分位数 Q(q) = λ (-ln(1 - q))^{1/k}，用 log1p 计算，q 很小时不丢精度
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : 分位数值，q = 1 时为 inf
+        """
+        if not is_scalar(q):
+            q = check_q(q)
+            with np.errstate(divide='ignore'):
+                return self.scale * (-np.log1p(-q)) ** (1 / self.k)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        if q == 1:
+            return math.inf
+        return self.scale * (-math.log1p(-q)) ** (1 / self.k)
+
+    def isf(self, q):
+        """
+        逆生存函数 ISF(q) = λ (-ln q)^{1/k}，直接用 log q，极小的尾概率不经过 1 - q
+
+        参数
+        ------
+        q : float 或 array_like, ∈ [0, 1]
+
+        返回
+        ------
+        float 或 ndarray : q = 0 时为 inf
+        """
+        if not is_scalar(q):
+            q = check_q(q)
+            with np.errstate(divide='ignore'):
+                return self.scale * (-np.log(q)) ** (1 / self.k)
+        if not 0 <= q <= 1:
+            raise ValueError("q 必须在 [0, 1] 之间")
+        if q == 0:
+            return math.inf
+        return self.scale * (-math.log(q)) ** (1 / self.k)
+
+    def rvs(self, size=None, rng=None):
+        """
+        随机抽样 λ W，W 由 Generator.weibull（尺度为 1 的威布尔分布）生成
+
+        参数
+        ------
+        size : int 或 tuple, 可选
+            样本形状，None 时返回单个值
+        rng : numpy.random.Generator 或 int, 可选
+            随机数生成器或种子，None 时新建默认生成器；
+            并行模拟时每个进程传入 SeedSequence.spawn 得到的独立 Generator
+
+        返回
+        ------
+        float 或 ndarray
+        """
+        rng = np.random.default_rng(rng)
+        return self.scale * rng.weibull(self.k, size)
+
+    def skewness(self):
+        """
+        偏度 Skew[X] = E[(X-μ)^3] / Std^3
+        """
+        return self.central_moment(3) / self.std ** 3
+
+    def kurtosis(self, excess=False):
+        """
+        峰度 Kurt[X] 或 超额峰度
+
+        参数
+        ------
+        excess : bool
+            是否返回超额峰度，默认 False
+
+        返回
+        ------
+        float : 峰度值
+        """
+        k4 = self.central_moment(4) / self.Var ** 2
+        return k4 - 3 if excess else k4
+
+    def __str__(self):
+        """
+        返回分布概要信息
+        """
+        return f"""$威布尔分布：X~Weibull(k={self.k}, \\lambda={self.scale})$
+            期望: {self.E}
+            方差: {self.Var}
+            变异系数: {self.coef}
+            偏度: {self.skew}
+            峰度: {self.kurt}
+        """